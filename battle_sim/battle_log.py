@@ -0,0 +1,400 @@
+import struct
+from contextlib import contextmanager
+from dataclasses import dataclass
+from io import BytesIO
+from operator import attrgetter
+from pathlib import Path
+from types import TracebackType
+from typing import IO, Any, Callable, Iterator, Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+from battle_sim.database.dex import STATUSES
+from battle_sim.database.registry import MOVES
+from battle_sim.engine import Battle
+from battle_sim.maths.rng import RNG, BufferedRNG, CounterRNG
+from battle_sim.maths.stats import NATURE_INDEX
+from battle_sim.mechanics.events import Event, EventBus, EventContext, EventHandler, EventPriority
+from battle_sim.mechanics.payloads import DamageCalcPayload, HitPayload, StatusPayload, SwitchPayload, TurnPayload
+from battle_sim.models.actions import ActionRecord
+from battle_sim.models.battle_state import TEAM_SIZE
+from battle_sim.models.moves import EMPTY_SLOT_ID, MoveSet, MoveSlot
+from battle_sim.models.pokemon import Pokemon
+from battle_sim.models.stats import BaseStats, EVs, IVs
+from battle_sim.models.type_matchups import NO_TYPE_INDEX, TYPE_INDEX
+from battle_sim.utils import Stats, Type
+
+# Binary battle log. A file is a header followed by one block per battle, appended as each battle finishes:
+#
+#   file header    MAGIC, LOG_VERSION
+#   battle header  RNG kind, seed, block size, battle index and starting turn; winner, turns, team sizes, record
+#                  count and spawn key length, followed by the CounterRNG spawn key (one uint64 per entry)
+#   teams          each Pokemon once: name and nickname (length-prefixed UTF-8), then a fixed POKEMON struct
+#   records        one fixed-size RECORD per event emitted through the battle's EventBus
+#
+# A record holds the Event value, the actor's slot (side * TEAM_SIZE + team position, or NO_ACTOR) and three int16
+# payload values, packed per payload type by `_PACKERS` (see `pack_payload`). Damage and base power are uncapped, so
+# they saturate at the int16 limits rather than widening every record. Everything is little-endian.
+
+MAGIC = b"BSLOG"
+LOG_VERSION = 2
+NO_ACTOR = 255
+LOG_PRIORITY = EventPriority.DEFAULT - 1  # Below every handler, so records hold the final payload values
+
+FILE_HEADER = struct.Struct("<5sH")
+BATTLE_HEADER = struct.Struct("<B16sIIQbHBBIB")
+SPAWN_KEY_ENTRY = struct.Struct("<Q")
+POKEMON = struct.Struct(f"<BBBB{len(Stats)}B{len(Stats)}B{len(Stats)}B{len(MoveSlot)}h")
+RECORD = struct.Struct("<BB3h")
+RECORD_DTYPE = np.dtype([("event", np.uint8), ("actor", np.uint8), ("values", "<i2", (3,))])
+assert RECORD_DTYPE.itemsize == RECORD.size
+INITIAL_RECORDS = 512  # Records a recorder has room for before its buffer first doubles
+
+RNG_KINDS: tuple[type[RNG], ...] = (RNG, BufferedRNG, CounterRNG)
+EVENTS = tuple(Event)
+NATURES = tuple(NATURE_INDEX)
+TYPES = tuple(Type)
+BASE_STATS = tuple(Stats)
+_stat_values = attrgetter(*BASE_STATS)
+
+PayloadValues = tuple[int, int, int]
+_NO_VALUES: PayloadValues = (0, 0, 0)
+INT16_MIN, INT16_MAX = -(1 << 15), (1 << 15) - 1
+
+
+def _saturate(value: int) -> int:
+    return value if INT16_MIN <= value <= INT16_MAX else max(INT16_MIN, min(INT16_MAX, value))
+
+
+def _pack_hit(payload: HitPayload, slots: dict[int, int]) -> PayloadValues:
+    return payload.move.id, _saturate(payload.damage), int(payload.effectiveness * 4) << 1 | payload.critical
+
+
+def _pack_damage_calc(payload: DamageCalcPayload, slots: dict[int, int]) -> PayloadValues:
+    return payload.move.id, _saturate(payload.base_power), payload.critical
+
+
+def _pack_switch(payload: SwitchPayload, slots: dict[int, int]) -> PayloadValues:
+    outgoing = -1 if payload.outgoing is None else slots[id(payload.outgoing)]
+    incoming = -1 if payload.incoming is None else slots[id(payload.incoming)]
+    return outgoing, incoming, 0
+
+
+def _pack_status(payload: StatusPayload, slots: dict[int, int]) -> PayloadValues:
+    return STATUSES.index(payload.status), 0, 0
+
+
+def _pack_turn(payload: TurnPayload, slots: dict[int, int]) -> PayloadValues:
+    return payload.turn, 0, 0
+
+
+_PACKERS: dict[type, Callable[[Any, dict[int, int]], PayloadValues]] = {
+    HitPayload: _pack_hit,
+    DamageCalcPayload: _pack_damage_calc,
+    SwitchPayload: _pack_switch,
+    StatusPayload: _pack_status,
+    TurnPayload: _pack_turn,
+}
+
+
+def pack_payload(context: EventContext, payload: Any, slots: dict[int, int]) -> PayloadValues:
+    """
+    The three record values for an event. Typed payloads are packed by type: hits as (move id, damage,
+    effectiveness in quarters << 1 | critical), damage calcs as (move id, base power, critical), switches as the
+    outgoing and incoming slots, statuses as their dex status code and turns as the turn number. Any other event
+    records the packed ActionRecord of its context, if it has one. Damage and base power saturate at the int16 limits.
+    """
+    packer = _PACKERS.get(type(payload))
+    if packer is not None:
+        return packer(payload, slots)
+    if isinstance(context.action, ActionRecord):
+        return context.action.pack(), 0, 0
+    return _NO_VALUES
+
+
+def _team_slots(teams: Sequence[Sequence[Pokemon]]) -> dict[int, int]:
+    return {
+        id(pokemon): side * TEAM_SIZE + position
+        for side, team in enumerate(teams)
+        for position, pokemon in enumerate(team)
+    }
+
+
+def _encode_text(text: str) -> bytes:
+    encoded = text.encode()
+    if len(encoded) > 255:
+        raise ValueError(f"{text!r} is too long to log.")
+    return bytes((len(encoded),)) + encoded
+
+
+def encode_pokemon(pokemon: Pokemon) -> bytes:
+    """The logged form of a Pokemon's definition; live stats, stages and PP are not logged."""
+    move_ids = [pokemon.moves.move_id(slot) for slot in MoveSlot]
+    if any(move_id < EMPTY_SLOT_ID for move_id in move_ids):
+        raise ValueError(f"{pokemon.nickname} knows a move that is not registered, so it cannot be logged.")
+    primary, secondary = pokemon.types
+    return (
+        _encode_text(pokemon.name)
+        + _encode_text(pokemon.nickname)
+        + POKEMON.pack(
+            pokemon.level,
+            NATURE_INDEX[pokemon.nature],
+            TYPE_INDEX[primary],
+            NO_TYPE_INDEX if secondary is None else TYPE_INDEX[secondary],
+            *_stat_values(pokemon.base_stats),
+            *_stat_values(pokemon.effort_values),
+            *_stat_values(pokemon.individual_values),
+            *move_ids,
+        )
+    )
+
+
+def _read_exactly(file: IO[bytes], size: int) -> bytes:
+    data = file.read(size)
+    if len(data) != size:
+        raise ValueError("Battle log is truncated.")
+    return data
+
+
+def _read_text(file: IO[bytes]) -> str:
+    return _read_exactly(file, _read_exactly(file, 1)[0]).decode()
+
+
+def decode_pokemon(file: IO[bytes]) -> Pokemon:
+    name, nickname = _read_text(file), _read_text(file)
+    values = POKEMON.unpack(_read_exactly(file, POKEMON.size))
+    level, nature, primary, secondary = values[:4]
+    stats = len(BASE_STATS)
+    base, evs, ivs = (
+        {stat.value: value for stat, value in zip(BASE_STATS, values[start : start + stats], strict=True)}
+        for start in (4, 4 + stats, 4 + 2 * stats)
+    )
+    moves = [None if move_id == EMPTY_SLOT_ID else MOVES[move_id] for move_id in values[4 + 3 * stats :]]
+    first, *rest = moves
+    if first is None:
+        raise ValueError(f"Logged Pokemon {nickname!r} has no first move.")
+    return Pokemon(
+        name=name,
+        nickname=nickname,
+        level=level,
+        nature=NATURES[nature],
+        effort_values=EVs(**evs),
+        individual_values=IVs(**ivs),
+        base_stats=BaseStats(**base),
+        types=(TYPES[primary], None if secondary == NO_TYPE_INDEX else TYPES[secondary]),
+        moves=MoveSet(first, *rest),
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class LoggedBattle:
+    rng_kind: type[RNG]
+    seed: int
+    block_size: int
+    battle_index: int
+    turn: int  # The CounterRNG's starting turn
+    spawn_key: tuple[int, ...]
+    winner: int | None
+    turns: int
+    team_data: bytes  # Encoded teams, decoded on demand by `teams()`
+    team_sizes: tuple[int, int]
+    records: NDArray[np.void]  # RECORD_DTYPE
+
+    def teams(self) -> tuple[list[Pokemon], list[Pokemon]]:
+        """Rebuild both teams, at full HP and PP. Move ids are resolved through the global move registry."""
+        file = BytesIO(self.team_data)
+        one, two = ([decode_pokemon(file) for _ in range(size)] for size in self.team_sizes)
+        return one, two
+
+    def make_rng(self) -> RNG:
+        """A fresh RNG that produces the same stream as the logged battle's."""
+        if self.rng_kind is CounterRNG:
+            return CounterRNG(
+                self.seed,
+                block_size=self.block_size,
+                battle_index=self.battle_index,
+                turn=self.turn,
+                spawn_key=self.spawn_key,
+            )
+        if self.rng_kind is BufferedRNG:
+            return BufferedRNG(self.seed, block_size=self.block_size)
+        return RNG(self.seed)
+
+    def events(self) -> Iterator[tuple[Event, int | None, PayloadValues]]:
+        """The records as (Event, actor slot or None, payload values)."""
+        records = self.records
+        columns = records["event"].tolist(), records["actor"].tolist(), records["values"].tolist()
+        for event, actor, (first, second, third) in zip(*columns, strict=True):
+            yield EVENTS[event - 1], None if actor == NO_ACTOR else actor, (first, second, third)
+
+
+class BattleRecorder:
+    """EventOwner that collects one battle's records; see `BattleLogWriter.recording`."""
+
+    __slots__ = ("name", "battle", "_buffer", "_size", "_slots", "_action", "_action_code")
+
+    def __init__(self, battle: Battle) -> None:
+        self.name = "battle log"
+        self.battle = battle
+        # Records are packed straight into a preallocated buffer that doubles when full, not appended one by one.
+        self._buffer = bytearray(INITIAL_RECORDS * RECORD.size)
+        self._size = 0
+        self._slots = _team_slots(battle.teams)
+        # The packed code of the last action seen: every event of an action is recorded with the same one.
+        self._action: ActionRecord | None = None
+        self._action_code = 0
+
+    @property
+    def records(self) -> bytes:
+        return bytes(self._buffer[: self._size])
+
+    def on_register(self, bus: EventBus) -> None:
+        for event in Event:
+            bus.on(event, self._handler(event), priority=LOG_PRIORITY, owner=self)
+
+    def on_unregister(self, bus: EventBus) -> None:
+        bus.off_owner(self)
+
+    def _handler(self, event: Event) -> EventHandler:
+        recorder, event_id, buffer, slots = self, event.value, self._buffer, self._slots
+        packers, get_slot, pack_into, record_size = _PACKERS, slots.get, RECORD.pack_into, RECORD.size
+
+        def record(context: EventContext, payload: Any) -> None:
+            # pack_payload, inlined: this runs for every event of every logged battle.
+            actor = context.actor
+            packer = packers.get(type(payload))
+            if packer is not None:
+                values = packer(payload, slots)
+            else:
+                action = context.action
+                if action is recorder._action:
+                    values = recorder._action_code, 0, 0
+                elif isinstance(action, ActionRecord):
+                    recorder._action, recorder._action_code = action, action.pack()
+                    values = recorder._action_code, 0, 0
+                else:
+                    values = _NO_VALUES
+            offset = recorder._size
+            if offset == len(buffer):
+                buffer.extend(bytes(offset))  # In place, so every handler keeps writing to the same buffer
+            pack_into(buffer, offset, event_id, NO_ACTOR if actor is None else get_slot(id(actor), NO_ACTOR), *values)
+            recorder._size = offset + record_size
+
+        return record
+
+
+class BattleLogWriter:
+    """
+    Appends battles to a binary battle log, one block per finished battle. Use as a context manager, and wrap each
+    battle in `recording`. Records are buffered per battle and written once it finishes, so logging costs one small
+    handler call per event.
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = Path(path)
+        if self.path.exists() and self.path.stat().st_size:
+            with self.path.open("rb") as file:
+                _read_file_header(file)
+            self._file = self.path.open("ab")
+        else:
+            self._file = self.path.open("wb")
+            self._file.write(FILE_HEADER.pack(MAGIC, LOG_VERSION))
+
+    def __enter__(self) -> "BattleLogWriter":
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._file.close()
+
+    @contextmanager
+    def recording(self, battle: Battle) -> Iterator[BattleRecorder]:
+        """Record every event `battle` emits inside the block, and append the battle once the block exits cleanly."""
+        recorder = BattleRecorder(battle)
+        recorder.on_register(battle.bus)
+        try:
+            yield recorder
+        finally:
+            recorder.on_unregister(battle.bus)
+        self.write(recorder)
+
+    def write(self, recorder: BattleRecorder) -> None:
+        battle = recorder.battle
+        rng = battle.rng
+        if type(rng) not in RNG_KINDS or rng.seed is None or rng.seed < 0:
+            raise ValueError("Only battles with a non-negative seed and a built-in RNG can be logged.")
+        spawn_key = getattr(rng, "spawn_key", ())
+        if len(spawn_key) > 255 or any(not 0 <= entry < 1 << 64 for entry in spawn_key):
+            raise ValueError(f"Cannot log an RNG with spawn key {spawn_key!r}.")
+        winner = battle.winner()
+        records = recorder.records
+        teams = b"".join(encode_pokemon(pokemon) for team in battle.teams for pokemon in team)
+        self._file.write(
+            BATTLE_HEADER.pack(
+                RNG_KINDS.index(type(rng)),
+                rng.seed.to_bytes(16, "little"),
+                getattr(rng, "block_size", 0),
+                getattr(rng, "battle_index", 0),
+                getattr(rng, "turn", 0),
+                -1 if winner is None else winner,
+                battle.turn,
+                len(battle.teams[0]),
+                len(battle.teams[1]),
+                len(records) // RECORD.size,
+                len(spawn_key),
+            )
+        )
+        self._file.write(b"".join(SPAWN_KEY_ENTRY.pack(entry) for entry in spawn_key))
+        self._file.write(teams)
+        self._file.write(records)
+
+
+def _read_file_header(file: IO[bytes]) -> None:
+    magic, version = FILE_HEADER.unpack(_read_exactly(file, FILE_HEADER.size))
+    if magic != MAGIC:
+        raise ValueError("Not a battle log.")
+    if version != LOG_VERSION:
+        raise ValueError(f"Unsupported battle log version {version}.")
+
+
+def read_battle_log(path: Path | str) -> Iterator[LoggedBattle]:
+    """Yield the battles of a log one at a time, reading only as far as the battle being yielded."""
+    with open(path, "rb") as file:
+        _read_file_header(file)
+        while header := file.read(BATTLE_HEADER.size):
+            if len(header) != BATTLE_HEADER.size:
+                raise ValueError("Battle log is truncated.")
+            kind, seed, block_size, battle_index, turn, winner, turns, size_one, size_two, count, spawn_key_length = (
+                BATTLE_HEADER.unpack(header)
+            )
+            spawn_key = tuple(
+                entry
+                for (entry,) in SPAWN_KEY_ENTRY.iter_unpack(
+                    _read_exactly(file, spawn_key_length * SPAWN_KEY_ENTRY.size)
+                )
+            )
+            team_data = bytearray()
+            for _ in range(size_one + size_two):
+                for _ in range(2):  # Name and nickname
+                    length = _read_exactly(file, 1)
+                    team_data += length + _read_exactly(file, length[0])
+                team_data += _read_exactly(file, POKEMON.size)
+            records = np.frombuffer(_read_exactly(file, count * RECORD.size), dtype=RECORD_DTYPE)
+            yield LoggedBattle(
+                rng_kind=RNG_KINDS[kind],
+                seed=int.from_bytes(seed, "little"),
+                block_size=block_size,
+                battle_index=battle_index,
+                turn=turn,
+                spawn_key=spawn_key,
+                winner=None if winner < 0 else winner,
+                turns=turns,
+                team_data=bytes(team_data),
+                team_sizes=(size_one, size_two),
+                records=records,
+            )
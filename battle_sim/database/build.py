@@ -0,0 +1,117 @@
+"""
+Compile the dex source CSVs into the structured arrays loaded by `battle_sim.database.dex`.
+
+Run with:
+    uv run python -m battle_sim.database.build [source_dir] [output_dir]
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from numpy.typing import NDArray
+
+from battle_sim.database.dex import (
+    BASE_STATS,
+    CATEGORIES,
+    COMPILED_DIR,
+    DATA_DIR,
+    MOVE_DTYPE,
+    NAME_LENGTH,
+    NO_VALUE,
+    SPECIES_DTYPE,
+    STAGE_TARGETS,
+    STAGED_STATS,
+    STATUSES,
+    TARGETS,
+)
+from battle_sim.models.type_matchups import NO_TYPE_INDEX, TYPE_INDEX
+
+
+def _codes(column: pd.Series, options: tuple, *, missing: int | None = None) -> NDArray[np.int64]:
+    """Encode enum names (or None/NaN, if `missing` is given) as their index in `options`."""
+    index = {None if option is None else getattr(option, "name", option): i for i, option in enumerate(options)}
+    codes = []
+    for value in column:
+        if pd.isna(value):
+            if missing is None:
+                raise ValueError(f"Missing value in column {column.name!r}.")
+            codes.append(missing)
+        elif value not in index:
+            raise ValueError(f"Unknown {column.name} {value!r}.")
+        else:
+            codes.append(index[value])
+    return np.array(codes, dtype=np.int64)
+
+
+def _type_codes(column: pd.Series, *, optional: bool = False) -> NDArray[np.int64]:
+    return _codes(column, tuple(TYPE_INDEX), missing=NO_TYPE_INDEX if optional else None)
+
+
+def _ints(column: pd.Series, default: int = 0) -> NDArray[np.int64]:
+    return column.fillna(default).astype(np.int64).to_numpy()
+
+
+def _table(frame: pd.DataFrame, dtype: np.dtype) -> tuple[pd.DataFrame, NDArray[np.void]]:
+    """Validate ids and names, and return the frame sorted by id with a matching table holding those columns."""
+    if frame["id"].duplicated().any():
+        raise ValueError("Dex ids must be unique.")
+    if (frame["name"].str.len() > NAME_LENGTH).any():
+        raise ValueError(f"Dex names are limited to {NAME_LENGTH} characters.")
+    frame = frame.sort_values("id", ignore_index=True)
+    table = np.zeros(len(frame), dtype=dtype)
+    table["id"] = frame["id"]
+    table["name"] = frame["name"].str.encode("ascii")
+    return frame, table
+
+
+def compile_moves(frame: pd.DataFrame) -> NDArray[np.void]:
+    """Encode a moves frame (columns as in `data/moves.csv`) as a MOVE_DTYPE array sorted by id."""
+    frame, table = _table(frame, MOVE_DTYPE)
+    table["type"] = _type_codes(frame["type"])
+    table["category"] = _codes(frame["category"], CATEGORIES)
+    table["accuracy"] = _ints(frame["accuracy"], NO_VALUE)
+    table["priority"] = _ints(frame["priority"])
+    table["pp"] = _ints(frame["pp"])
+    table["target"] = _codes(frame["target"], TARGETS)
+    table["power"] = _ints(frame["power"])
+    table["crit_stage"] = _ints(frame["crit_stage"])
+    table["contact"] = frame["contact"].astype("boolean").fillna(False).to_numpy(dtype=bool)
+    table["multi_hit"] = np.stack([_ints(frame["multi_hit_min"]), _ints(frame["multi_hit_max"])], axis=1)
+    table["recoil_percent"] = frame["recoil_percent"].astype(np.float64)
+    table["drain_percent"] = frame["drain_percent"].astype(np.float64)
+    table["status"] = _codes(frame["status"], STATUSES, missing=0)
+    table["status_chance"] = _ints(frame["status_chance"])
+    table["stage_target"] = _codes(frame["stage_target"], STAGE_TARGETS, missing=0)
+    table["stage_chance"] = _ints(frame["stage_chance"])
+    table["stages"] = np.stack([_ints(frame[stat.value]) for stat in STAGED_STATS], axis=1)
+    return table
+
+
+def compile_species(frame: pd.DataFrame) -> NDArray[np.void]:
+    """Encode a species frame (columns as in `data/species.csv`) as a SPECIES_DTYPE array sorted by id."""
+    frame, table = _table(frame, SPECIES_DTYPE)
+    table["types"] = np.stack([_type_codes(frame["type1"]), _type_codes(frame["type2"], optional=True)], axis=1)
+    table["base_stats"] = np.stack([_ints(frame[stat.value]) for stat in BASE_STATS], axis=1)
+    return table
+
+
+def _save(table: NDArray[np.void], path: Path) -> None:
+    # Write then rename, so concurrent workers never memory-map a half-written file.
+    with tempfile.NamedTemporaryFile(dir=path.parent, suffix=".npy", delete=False) as file:
+        np.save(file, table)
+    os.replace(file.name, path)
+
+
+def build_database(source_dir: Path = DATA_DIR, output_dir: Path = COMPILED_DIR) -> None:
+    """Compile `moves.csv` and `species.csv` from `source_dir` into `.npy` files in `output_dir`."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    _save(compile_moves(pd.read_csv(source_dir / "moves.csv")), output_dir / "moves.npy")
+    _save(compile_species(pd.read_csv(source_dir / "species.csv")), output_dir / "species.npy")
+
+
+if __name__ == "__main__":
+    build_database(*(Path(arg) for arg in sys.argv[1:3]))
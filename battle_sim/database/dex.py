@@ -0,0 +1,236 @@
+import os
+import sys
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
+from typing import Generic, Iterator, Literal, TypeVar
+
+import numpy as np
+from numpy.typing import NDArray
+
+from battle_sim.database.registry import register_move
+from battle_sim.models.moves import DamageEffect, InflictStatusEffect, Move, MoveEffect, StatStageChangeEffect
+from battle_sim.models.stats import BaseStats
+from battle_sim.models.type_matchups import NO_TYPE_INDEX, TypePair
+from battle_sim.utils import Category, ExtraStatus, PriorityLevel, Stats, Status, Target, Type
+
+# The dex is compiled from the CSVs in `data/` into NumPy structured arrays (see `battle_sim.database.build`), which
+# are memory-mapped, so worker processes share the same pages. Move and Species objects are built from a row on
+# first access and interned by id; moves are also registered in the global move registry under their dex id.
+# The tables are compiled into a per-user cache directory (or BATTLE_SIM_DEX_DIR), never into the installed package,
+# which may be read-only.
+
+DATA_DIR = Path(__file__).parent / "data"
+
+
+def _user_cache_dir() -> Path:
+    if sys.platform == "win32":
+        root = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+    elif sys.platform == "darwin":
+        root = Path.home() / "Library" / "Caches"
+    else:
+        root = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(root) / "battle_sim" / "dex"
+
+
+COMPILED_DIR = Path(os.environ.get("BATTLE_SIM_DEX_DIR") or _user_cache_dir())
+
+NAME_LENGTH = 24
+NO_VALUE = 255  # Stored for a missing percentage (e.g. the accuracy of a move that never misses)
+
+TYPES = tuple(Type)  # Type codes follow TYPE_INDEX, with NO_TYPE_INDEX for a missing secondary type
+CATEGORIES = tuple(Category)
+TARGETS = tuple(Target)
+# Status code 0 is "no status"; the rest index Status then ExtraStatus, without their NONE members.
+STATUSES: tuple[Status | ExtraStatus | None, ...] = (
+    None,
+    *(s for s in Status if s is not Status.NONE),
+    *(s for s in ExtraStatus if s is not ExtraStatus.NONE),
+)
+STAGE_TARGETS: tuple[Literal["SELF", "TARGET"] | None, ...] = (None, "SELF", "TARGET")
+STAGED_STATS = (Stats.ATTACK, Stats.DEFENCE, Stats.SP_ATTACK, Stats.SP_DEFENCE, Stats.SPEED)
+BASE_STATS = tuple(Stats)
+
+MOVE_DTYPE = np.dtype(
+    [
+        ("id", np.uint16),
+        ("name", f"S{NAME_LENGTH}"),
+        ("type", np.uint8),
+        ("category", np.uint8),
+        ("accuracy", np.uint8),  # Percent, or NO_VALUE
+        ("priority", np.int8),
+        ("pp", np.uint8),
+        ("target", np.uint8),
+        ("power", np.uint16),  # 0 for moves without a DamageEffect
+        ("crit_stage", np.uint8),
+        ("contact", np.bool_),
+        ("multi_hit", np.uint8, (2,)),  # (0, 0) for single-hit moves
+        ("recoil_percent", np.float64),  # NaN for none
+        ("drain_percent", np.float64),
+        ("status", np.uint8),  # STATUSES code
+        ("status_chance", np.uint8),  # Percent
+        ("stage_target", np.uint8),  # STAGE_TARGETS code
+        ("stage_chance", np.uint8),  # Percent
+        ("stages", np.int8, (len(STAGED_STATS),)),
+    ]
+)
+
+SPECIES_DTYPE = np.dtype(
+    [
+        ("id", np.uint16),
+        ("name", f"S{NAME_LENGTH}"),
+        ("types", np.uint8, (2,)),
+        ("base_stats", np.uint8, (len(BASE_STATS),)),
+    ]
+)
+
+
+@dataclass(frozen=True, slots=True)
+class Species:
+    id: int
+    name: str
+    types: TypePair
+    base_stats: BaseStats
+
+
+Record = TypeVar("Record")
+
+
+class Dex(ABC, Generic[Record]):
+    """
+    Read-only table of dex records, backed by a structured array sorted by `id`.
+    Records are built lazily from their row and interned, so repeated lookups return the same object.
+    """
+
+    __slots__ = ("table", "_records", "_ids_by_name")
+
+    def __init__(self, table: NDArray[np.void]) -> None:
+        self.table = table
+        self._records: dict[int, Record] = {}
+        self._ids_by_name: dict[str, int] | None = None
+
+    @classmethod
+    def load(cls, path: Path):
+        return cls(np.load(path, mmap_mode="r"))
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def __iter__(self) -> Iterator[Record]:
+        return (self[int(record_id)] for record_id in self.table["id"])
+
+    def __contains__(self, record_id: object) -> bool:
+        return isinstance(record_id, int) and self._row(record_id) is not None
+
+    def __getitem__(self, record_id: int) -> Record:
+        record = self._records.get(record_id)
+        if record is None:
+            row = self._row(record_id)
+            if row is None:
+                raise KeyError(record_id)
+            record = self._records[record_id] = self._build(self.table[row])
+        return record
+
+    def by_name(self, name: str) -> Record:
+        record_id = self.id_of(name)
+        if record_id is None:
+            raise KeyError(name)
+        return self[record_id]
+
+    def id_of(self, name: str) -> int | None:
+        if self._ids_by_name is None:
+            names = self.table["name"].tolist()
+            self._ids_by_name = {n.decode(): int(i) for n, i in zip(names, self.table["id"], strict=True)}
+        return self._ids_by_name.get(name)
+
+    def ids(self) -> NDArray[np.uint16]:
+        return self.table["id"]
+
+    def _row(self, record_id: int) -> int | None:
+        ids = self.table["id"]
+        row = int(np.searchsorted(ids, record_id))
+        return row if row < len(ids) and ids[row] == record_id else None
+
+    @abstractmethod
+    def _build(self, row: np.void) -> Record: ...
+
+
+def _percent(value: int) -> float:
+    return int(value) / 100
+
+
+class MoveDex(Dex[Move]):
+    __slots__ = ()
+
+    def _build(self, row: np.void) -> Move:
+        category = CATEGORIES[row["category"]]
+        effects: list[MoveEffect] = []
+        if row["power"]:
+            multi_hit = tuple(int(hits) for hits in row["multi_hit"])
+            effects.append(
+                DamageEffect(
+                    power=int(row["power"]),
+                    category=category,
+                    crit_stage=int(row["crit_stage"]),
+                    contact=bool(row["contact"]),
+                    multi_hit=(multi_hit[0], multi_hit[1]) if multi_hit[0] else None,
+                    recoil_percent=None if np.isnan(row["recoil_percent"]) else float(row["recoil_percent"]),
+                    drain_percent=None if np.isnan(row["drain_percent"]) else float(row["drain_percent"]),
+                )
+            )
+        status = STATUSES[row["status"]]
+        if status is not None:
+            effects.append(InflictStatusEffect(status=status, probability=_percent(row["status_chance"])))
+        stage_target = STAGE_TARGETS[row["stage_target"]]
+        if stage_target is not None:
+            stages = {stat: int(n) for stat, n in zip(STAGED_STATS, row["stages"], strict=True) if n}
+            effects.append(
+                StatStageChangeEffect(target=stage_target, stages=stages, probability=_percent(row["stage_chance"]))
+            )
+        move = Move(
+            name=row["name"].decode(),
+            type=TYPES[row["type"]],
+            category=category,
+            accuracy_probability=None if row["accuracy"] == NO_VALUE else _percent(row["accuracy"]),
+            priority=PriorityLevel(int(row["priority"])),
+            pp=int(row["pp"]),
+            target=TARGETS[row["target"]],
+            effects=effects,
+        )
+        return register_move(move, int(row["id"]))
+
+
+class SpeciesDex(Dex[Species]):
+    __slots__ = ()
+
+    def _build(self, row: np.void) -> Species:
+        primary, secondary = (int(t) for t in row["types"])
+        stats = {stat.value: int(value) for stat, value in zip(BASE_STATS, row["base_stats"], strict=True)}
+        return Species(
+            id=int(row["id"]),
+            name=row["name"].decode(),
+            types=(TYPES[primary], None if secondary == NO_TYPE_INDEX else TYPES[secondary]),
+            base_stats=BaseStats(**stats),
+        )
+
+
+def _compiled(name: str) -> Path:
+    """Path to a compiled table, (re)building the dex first if it is missing or older than its source CSV."""
+    path = COMPILED_DIR / f"{name}.npy"
+    source = DATA_DIR / f"{name}.csv"
+    if not path.exists() or path.stat().st_mtime < source.stat().st_mtime:
+        from battle_sim.database.build import build_database  # pandas is only needed to compile
+
+        build_database(DATA_DIR, COMPILED_DIR)
+    return path
+
+
+@cache
+def move_dex() -> MoveDex:
+    return MoveDex.load(_compiled("moves"))
+
+
+@cache
+def species_dex() -> SpeciesDex:
+    return SpeciesDex.load(_compiled("species"))
@@ -0,0 +1,83 @@
+from dataclasses import replace
+from typing import Iterator
+
+from battle_sim.models.moves import Move
+
+# Moves outside the dex get ids from here up, in registration order, so they never collide with dex ids.
+CUSTOM_MOVE_ID_START = 10_000
+
+
+class MoveRegistry:
+    """
+    Interns moves by name: each registered move gets one shared instance with a stable integer id, so equality,
+    hashing and membership checks on registered moves are integer comparisons. Dex moves keep their dex id.
+    """
+
+    __slots__ = ("_by_id", "_by_name", "_next_custom_id")
+
+    def __init__(self) -> None:
+        self._by_id: dict[int, Move] = {}
+        self._by_name: dict[str, Move] = {}
+        self._next_custom_id = CUSTOM_MOVE_ID_START
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __iter__(self) -> Iterator[Move]:
+        return iter(self._by_id.values())
+
+    def __contains__(self, move_id: object) -> bool:
+        return move_id in self._by_id
+
+    def __getitem__(self, move_id: int) -> Move:
+        move = self._by_id.get(move_id)
+        if move is None:
+            from battle_sim.database.dex import move_dex
+
+            move = move_dex()[move_id]  # Building a dex move registers it
+        return move
+
+    def by_name(self, name: str) -> Move:
+        move = self._by_name.get(name)
+        if move is None:
+            move_id = self._dex_id(name)
+            if move_id is None:
+                raise KeyError(name)
+            move = self[move_id]
+        return move
+
+    def register(self, move: Move, move_id: int | None = None) -> Move:
+        """
+        Return the interned instance of `move`, registering it if its name is new. Its id is `move_id`, else its dex
+        id, else the next custom id. Re-registering a name with a different definition or id raises ValueError.
+        """
+        existing = self._by_name.get(move.name)
+        if existing is not None:
+            if existing.definition() != move.definition() or move_id not in (None, existing.id):
+                raise ValueError(f"Move {move.name!r} is already registered with a different definition.")
+            return existing
+
+        if move_id is None:
+            move_id = self._dex_id(move.name)
+        if move_id is None:
+            move_id = self._next_custom_id
+            self._next_custom_id += 1
+        if move_id in self._by_id:
+            raise ValueError(f"Move id {move_id} is already registered to {self._by_id[move_id].name!r}.")
+
+        interned = replace(move, id=move_id)
+        self._by_id[move_id] = self._by_name[move.name] = interned
+        return interned
+
+    def _dex_id(self, name: str) -> int | None:
+        from battle_sim.database.dex import move_dex
+
+        return move_dex().id_of(name)
+
+
+MOVES = MoveRegistry()
+
+
+def register_move(move: Move, move_id: int | None = None) -> Move:
+    """Intern `move` in the global MOVES registry."""
+    return MOVES.register(move, move_id)
@@ -0,0 +1,302 @@
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Callable, Iterable, Iterator, Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+from battle_sim.maths.rng import RNG, CounterRNG
+from battle_sim.mechanics.damage import roll_damage, roll_hit_count
+from battle_sim.mechanics.events import Event, EventBus, EventContext
+from battle_sim.mechanics.legal_actions import legal_action_mask, usable_move_slots
+from battle_sim.mechanics.payloads import HitPayload, SwitchPayload, TurnPayload
+from battle_sim.mechanics.turn_order import order_actions
+from battle_sim.models.actions import Action, ActionRecord, ActionType, AnyAction
+from battle_sim.models.moves import DamageEffect, Move, StatStageChangeEffect
+from battle_sim.models.pokemon import Pokemon
+from battle_sim.models.type_matchups import type_effectiveness
+from battle_sim.observation import encode_battle
+from battle_sim.utils import Target
+
+MAX_TURNS = 500
+CHUNKS_PER_WORKER = 4  # Enough chunks to balance uneven battle lengths while amortizing per-task overhead
+
+Policy = Callable[["Battle", int], AnyAction]
+
+SELF_TARGETS = (Target.SELF, Target.USER_SIDE, Target.FIELD)
+
+
+def first_move_policy(battle: "Battle", side: int) -> ActionRecord:
+    """Always use the first known move that has PP left."""
+    pokemon = battle.active_pokemon(side)
+    slot = usable_move_slots(pokemon)[0]
+    move = pokemon.moves[slot]
+    assert move is not None
+    return ActionRecord(ActionType.USE_MOVE, slot, move.target)
+
+
+def random_move_policy(battle: "Battle", side: int) -> ActionRecord:
+    """Use a uniformly random known move that has PP left."""
+    pokemon = battle.active_pokemon(side)
+    slot = battle.policy_rng.random_choice(usable_move_slots(pokemon))
+    move = pokemon.moves[slot]
+    assert move is not None
+    return ActionRecord(ActionType.USE_MOVE, slot, move.target)
+
+
+@dataclass(frozen=True, slots=True)
+class BattleResult:
+    winner: int | None  # Winning side (0 or 1), or None for a draw at MAX_TURNS
+    turns: int
+
+
+class Battle:
+    """A single 6v6 battle between two teams, driven by one Policy per side."""
+
+    def __init__(
+        self,
+        team_one: Sequence[Pokemon],
+        team_two: Sequence[Pokemon],
+        policies: tuple[Policy, Policy],
+        rng: RNG,
+        *,
+        bus: EventBus | None = None,
+        max_turns: int = MAX_TURNS,
+        strict: bool = False,
+        policy_rng: RNG | None = None,
+    ) -> None:
+        self.teams = (list(team_one), list(team_two))
+        self.policies = policies
+        self.rng = rng
+        # Randomness for the policies' choices. A separate stream keeps battle rolls independent of how actions were
+        # chosen, so the battle can be replayed from its seed and action list alone (see `battle_sim.replay`).
+        self.policy_rng = policy_rng if policy_rng is not None else rng
+        self.bus = bus if bus is not None else EventBus()
+        self.max_turns = max_turns
+        self.strict = strict  # Validate every ActionRecord, e.g. while debugging a policy
+        self.active = [0, 0]
+        self.turn = 0
+
+    def active_pokemon(self, side: int) -> Pokemon:
+        return self.teams[side][self.active[side]]
+
+    def side_defeated(self, side: int) -> bool:
+        return all(pokemon.is_fainted() for pokemon in self.teams[side])
+
+    def legal_actions(self, side: int, out: NDArray[np.bool_] | None = None) -> NDArray[np.bool_]:
+        """Legal-action mask for `side` (see `battle_sim.mechanics.legal_actions`), written into `out` if given."""
+        return legal_action_mask(self.teams[side], self.active[side], out)
+
+    def observe(self, out: NDArray[np.float32] | None = None, offset: int = 0) -> NDArray[np.float32]:
+        """Observation of the battle (see `battle_sim.observation`), written into `out` at `offset` if given."""
+        return encode_battle(self, out, offset)
+
+    def is_over(self) -> bool:
+        return self.side_defeated(0) or self.side_defeated(1) or self.turn >= self.max_turns
+
+    def winner(self) -> int | None:
+        one_defeated, two_defeated = self.side_defeated(0), self.side_defeated(1)
+        if one_defeated != two_defeated:
+            return 1 if one_defeated else 0
+        return None
+
+    def run(self) -> BattleResult:
+        while not self.is_over():
+            self.play_turn()
+        return BattleResult(winner=self.winner(), turns=self.turn)
+
+    def play_turn(self, actions: tuple[AnyAction, AnyAction] | None = None) -> None:
+        """
+        Resolve one turn, asking each side's policy for its action unless `actions` are given.
+        Actions may be validated `Action`s or unvalidated `ActionRecord`s, which are only checked in strict mode.
+        """
+        self.turn += 1
+        context = EventContext(rng=self.rng)
+        self.bus.emit(Event.ON_TURN_START, context, TurnPayload(turn=self.turn))
+
+        if actions is None:
+            actions = (self.policies[0](self, 0), self.policies[1](self, 1))
+        records = (self._record(0, actions[0]), self._record(1, actions[1]))
+
+        for side, action in self._ordered(records):
+            if self.active_pokemon(side).is_fainted():
+                continue
+            if action.action is ActionType.SWITCH_OUT:
+                assert action.switch_index is not None
+                self._switch(side, action.switch_index)
+            elif action.action is ActionType.USE_MOVE:
+                assert action.move is not None
+                self._use_move(side, action)
+            if self.side_defeated(0) or self.side_defeated(1):
+                break
+
+        for side in (0, 1):
+            self._replace_fainted(side)
+        self.bus.emit(Event.ON_TURN_END, context, TurnPayload(turn=self.turn))
+
+    def _record(self, side: int, action: AnyAction) -> ActionRecord:
+        if isinstance(action, Action):
+            return ActionRecord.from_action(action, self.teams[side])
+        return action.validate(len(self.teams[side])) if self.strict else action
+
+    def _ordered(self, actions: tuple[ActionRecord, ActionRecord]) -> list[tuple[int, ActionRecord]]:
+        order = order_actions((self.active_pokemon(0), self.active_pokemon(1)), actions, self.rng)
+        return [(side, actions[side]) for side in order]
+
+    def _switch(self, side: int, position: int) -> None:
+        outgoing, incoming = self.active_pokemon(side), self.teams[side][position]
+        context = EventContext(rng=self.rng, actor=outgoing)
+        self.bus.emit(Event.ON_SWITCH_OUT, context, SwitchPayload(outgoing=outgoing, incoming=incoming))
+        self.active[side] = position
+        self.bus.emit(Event.ON_SWITCH_IN, context, SwitchPayload(outgoing=outgoing, incoming=incoming))
+
+    def _replace_fainted(self, side: int) -> None:
+        if not self.active_pokemon(side).is_fainted():
+            return
+        for position, pokemon in enumerate(self.teams[side]):
+            if not pokemon.is_fainted():
+                self._switch(side, position)
+                return
+
+    def _use_move(self, side: int, action: ActionRecord) -> None:
+        attacker = self.active_pokemon(side)
+        defender = self.active_pokemon(1 - side)
+        assert action.move is not None
+        move = attacker.moves[action.move]
+        if move is None or not attacker.moves.has_pp(action.move):
+            return
+        attacker.moves.use_pp(action.move)
+
+        context = EventContext(rng=self.rng, actor=attacker, target=action.target, action=action)
+        self.bus.emit(Event.ON_ACTION_START, context)
+        if move.accuracy_probability is not None and not self.rng.roll_chance(move.accuracy_probability):
+            return
+
+        target = attacker if move.target in SELF_TARGETS else defender
+        for effect in move.effects:
+            if isinstance(effect, DamageEffect) and effect.power is not None:
+                self._apply_damage(context, attacker, target, move, effect)
+            elif isinstance(effect, StatStageChangeEffect) and self.rng.roll_chance(effect.probability):
+                recipient = attacker if effect.target == "SELF" else target
+                for stat, stages in effect.stages.items():
+                    recipient.change_stat_stage(stat, stages)
+        self.bus.emit(Event.ON_AFTER_ACTION, context)
+
+    def _apply_damage(
+        self, context: EventContext, attacker: Pokemon, defender: Pokemon, move: Move, effect: DamageEffect
+    ) -> None:
+        effectiveness = type_effectiveness(move.type, defender.types)
+        for _ in range(roll_hit_count(effect.multi_hit, self.rng)):
+            hit = self.bus.emit(Event.ON_BEFORE_HIT, context, HitPayload(move=move, effectiveness=effectiveness))
+            hit.damage, hit.critical = roll_damage(attacker, defender, move, self.rng, bus=self.bus, context=context)
+            dealt = defender.apply_damage(hit.damage)
+            if effect.recoil_percent:
+                attacker.apply_damage(int(dealt * effect.recoil_percent / 100))
+            if effect.drain_percent:
+                attacker.apply_healing(int(dealt * effect.drain_percent / 100))
+            self.bus.emit(Event.ON_AFTER_HIT, context, hit)
+            if defender.is_fainted():
+                self.bus.emit(Event.ON_FAINT, EventContext(rng=self.rng, actor=defender))
+                return
+
+
+# Matchup runner. Teams and policies are sent to each worker process once, through the pool initializer, and every
+# task is a chunk of trial indices; each trial gets its own CounterRNG stream derived from (seed, trial).
+
+
+@dataclass(frozen=True, slots=True)
+class TrialResult:
+    trial: int
+    winner: int | None
+    turns: int
+
+
+@dataclass(frozen=True, slots=True)
+class MatchupSummary:
+    trials: int
+    wins: int  # Side one's wins
+    losses: int
+    draws: int
+    mean_turns: float
+
+    @classmethod
+    def from_results(cls, results: Iterable[TrialResult]) -> "MatchupSummary":
+        trials = wins = losses = turns = 0
+        for result in results:
+            trials += 1
+            wins += result.winner == 0
+            losses += result.winner == 1
+            turns += result.turns
+        return cls(trials, wins, losses, trials - wins - losses, turns / trials if trials else 0.0)
+
+
+Matchup = tuple[list[Pokemon], list[Pokemon], tuple[Policy, Policy], int, int]  # Teams, policies, seed, max turns
+
+# Set once per pool worker by `_init_worker`, so the teams and policies are pickled once per worker, not per chunk.
+_worker_matchup: Matchup | None = None
+
+
+def _init_worker(
+    team_one: list[Pokemon], team_two: list[Pokemon], policies: tuple[Policy, Policy], seed: int, max_turns: int
+) -> None:
+    global _worker_matchup
+    _worker_matchup = (team_one, team_two, policies, seed, max_turns)
+
+
+def _run_worker_trials(start: int, stop: int) -> list[TrialResult]:
+    assert _worker_matchup is not None, "Worker was not initialised with a matchup."
+    return _run_trials(_worker_matchup, start, stop)
+
+
+def _run_trials(matchup: Matchup, start: int, stop: int) -> list[TrialResult]:
+    team_one, team_two, policies, seed, max_turns = matchup
+    results = []
+    for trial in range(start, stop):
+        # Battles only change live stats, stages and PP, so the worker's copy of the teams is reset rather than cloned.
+        for pokemon in (*team_one, *team_two):
+            pokemon.reset_live_stats()
+            pokemon.reset_stat_stages()
+            pokemon.moves.restore_pp()
+        battle = Battle(team_one, team_two, policies, CounterRNG(seed, battle_index=trial), max_turns=max_turns)
+        result = battle.run()
+        results.append(TrialResult(trial=trial, winner=result.winner, turns=result.turns))
+    return results
+
+
+def run_matchup(
+    team_one: Sequence[Pokemon],
+    team_two: Sequence[Pokemon],
+    policies: tuple[Policy, Policy],
+    trials: int,
+    *,
+    seed: int = 0,
+    workers: int | None = None,
+    chunk_size: int | None = None,
+    max_turns: int = MAX_TURNS,
+) -> Iterator[TrialResult]:
+    """
+    Play `trials` battles and yield each TrialResult as its chunk finishes (not in trial order).
+    Results depend only on the teams, policies and `seed`, never on `workers` or `chunk_size`. `workers=0` runs
+    in this process; `None` uses one worker per CPU. Policies must be picklable, e.g. module-level functions.
+    """
+    if trials < 0:
+        raise ValueError("Number of trials cannot be negative.")
+    teams = [p.clone() for p in team_one], [p.clone() for p in team_two]
+
+    if workers == 0:
+        yield from _run_trials((*teams, policies, seed, max_turns), 0, trials)
+        return
+
+    workers = workers or os.cpu_count() or 1
+    chunk_size = chunk_size or max(1, math.ceil(trials / (workers * CHUNKS_PER_WORKER)))
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(*teams, policies, seed, max_turns)
+    ) as executor:
+        futures = [
+            executor.submit(_run_worker_trials, start, min(start + chunk_size, trials))
+            for start in range(0, trials, chunk_size)
+        ]
+        for future in as_completed(futures):
+            yield from future.result()
@@ -1,12 +1,19 @@
 import random
 from dataclasses import dataclass, field
-from typing import Any, Sequence
+from typing import Any, Callable, Mapping, Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+# Damage rolls are uniform integers in [MIN_DAMAGE_ROLL, MAX_DAMAGE_ROLL], applied as a percentage.
+MIN_DAMAGE_ROLL = 85
+MAX_DAMAGE_ROLL = 100
 
 
 @dataclass
 class RNG:
     seed: int | None = None
-    _engine: random.Random = field(init=False)
+    _engine: random.Random = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
         self._engine = random.Random(self.seed)
@@ -39,7 +46,19 @@ class RNG:
         """Return True with the given percentage chance (0 to 100)."""
         if not 0.0 <= percent_chance <= 100.0:
             raise ValueError("Percentage chance must be between 0 and 100.")
-        return self.roll_chance(percent_chance / 100.0)
+        return self.random_probability() < percent_chance / 100.0
+
+    def random_probabilities(self, count: int) -> NDArray[np.float64]:
+        """Return `count` random floats in the range [0.0, 1.0)."""
+        return np.array([self.random_probability() for _ in range(count)], dtype=np.float64)
+
+    def random_integers(self, minimum: int, maximum: int, count: int) -> NDArray[np.int64]:
+        """Return `count` random integers N such that minimum <= N < maximum."""
+        return np.array([self.random_integer(minimum, maximum) for _ in range(count)], dtype=np.int64)
+
+    def damage_rolls(self, count: int) -> NDArray[np.int64]:
+        """Return `count` damage roll percentages between MIN_DAMAGE_ROLL and MAX_DAMAGE_ROLL inclusive."""
+        return self.random_integers(MIN_DAMAGE_ROLL, MAX_DAMAGE_ROLL + 1, count)
 
     def get_state(self) -> tuple[Any, ...]:
         """Return the internal RNG state for exact reproducibility."""
@@ -53,3 +72,145 @@ class RNG:
         """Reset the generator with a new seed value."""
         self.seed = new_seed
         self._engine.seed(new_seed)
+
+
+@dataclass
+class BufferedRNG(RNG):
+    """
+    RNG backed by a NumPy Generator that draws uniforms in blocks of `block_size` and serves single rolls from the
+    block, so each roll is a list read instead of a call into the generator. The batch methods draw from the
+    generator directly. Streams differ from RNG's for the same seed, but are just as reproducible.
+    """
+
+    block_size: int = 4096
+    _generator: np.random.Generator = field(init=False, repr=False)
+    _block: list[float] = field(init=False, repr=False)
+    _block_state: Mapping[str, Any] = field(init=False, repr=False)
+    _next: Callable[[], float] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.block_size < 1:
+            raise ValueError("Block size must be at least 1.")
+        self._start_stream()
+
+    def _start_stream(self) -> None:
+        self._generator = self._make_generator()
+        self._block_state = self._generator.bit_generator.state
+        self._load_block([])
+
+    def _make_generator(self) -> np.random.Generator:
+        return np.random.Generator(np.random.PCG64(self.seed))
+
+    def _load_block(self, block: list[float], position: int = 0) -> None:
+        self._block = block
+        values = iter(block)
+        for _ in range(position):
+            next(values)
+        # Rolls call the list iterator's C-level __next__ directly; StopIteration marks an exhausted block.
+        self._next = values.__next__
+
+    def _refill(self) -> float:
+        self._block_state = self._generator.bit_generator.state
+        self._load_block(self._generator.random(self.block_size).tolist())
+        return self._next()
+
+    def _position(self) -> int:
+        return len(self._block) - self._next.__self__.__length_hint__()  # type: ignore[attr-defined]
+
+    def random_probability(self) -> float:
+        try:
+            return self._next()
+        except StopIteration:
+            return self._refill()
+
+    def random_integer(self, minimum: int, maximum: int) -> int:
+        if minimum >= maximum:
+            raise ValueError(f"Empty range for random_integer ({minimum}, {maximum}).")
+        return minimum + int(self.random_probability() * (maximum - minimum))
+
+    def random_choice(self, options: Sequence[Any]) -> Any:
+        if not options:
+            raise ValueError("Cannot choose from an empty sequence.")
+        return options[int(self.random_probability() * len(options))]
+
+    def shuffle_items(self, items: list[Any]) -> None:
+        for i in range(len(items) - 1, 0, -1):
+            j = int(self.random_probability() * (i + 1))
+            items[i], items[j] = items[j], items[i]
+
+    def roll_chance(self, probability: float) -> bool:
+        if not 0.0 <= probability <= 1.0:
+            raise ValueError("Probability must be between 0 and 1.")
+        try:
+            return self._next() < probability
+        except StopIteration:
+            return self._refill() < probability
+
+    def random_probabilities(self, count: int) -> NDArray[np.float64]:
+        return self._generator.random(count)
+
+    def random_integers(self, minimum: int, maximum: int, count: int) -> NDArray[np.int64]:
+        return self._generator.integers(minimum, maximum, count, dtype=np.int64)
+
+    def get_state(self) -> tuple[Any, ...]:
+        # The block is rebuilt from the generator state it was drawn from, rather than stored.
+        return self._block_state, len(self._block), self._position(), self._generator.bit_generator.state
+
+    def set_state(self, state: tuple[Any, ...]) -> None:
+        block_state, block_length, position, generator_state = state
+        self._generator.bit_generator.state = block_state
+        self._block_state = block_state
+        self._load_block(self._generator.random(block_length).tolist(), position)
+        self._generator.bit_generator.state = generator_state
+
+    def reseed(self, new_seed: int) -> None:
+        self.seed = new_seed
+        self._start_stream()
+
+
+@dataclass
+class CounterRNG(BufferedRNG):
+    """
+    BufferedRNG on NumPy's counter-based Philox generator, for reproducible parallel battles.
+    The master `seed` (and `spawn_key`) is hashed into the Philox key, while `battle_index` and `turn` are written
+    into the counter, so the stream for any (seed, battle, turn) is reached in O(1) without replaying earlier draws.
+    Each turn owns 2**64 counter blocks, so turns and battles never overlap.
+    """
+
+    battle_index: int = 0
+    turn: int = 0
+    spawn_key: tuple[int, ...] = ()
+
+    def __post_init__(self) -> None:
+        if self.seed is None:
+            self.seed = int(np.random.SeedSequence().entropy)  # type: ignore[arg-type]
+        super().__post_init__()
+
+    def _make_generator(self) -> np.random.Generator:
+        key = np.random.SeedSequence(self.seed, spawn_key=self.spawn_key).generate_state(2, np.uint64)
+        counter = np.array([0, self.turn, self.battle_index, 0], dtype=np.uint64)
+        return np.random.Generator(np.random.Philox(key=key, counter=counter))
+
+    def for_battle(self, battle_index: int, turn: int = 0) -> "CounterRNG":
+        """Return the stream for another battle under the same master seed."""
+        return CounterRNG(
+            self.seed, block_size=self.block_size, battle_index=battle_index, turn=turn, spawn_key=self.spawn_key
+        )
+
+    def advance_to_turn(self, turn: int) -> None:
+        """Jump this battle's stream to the start of `turn`, discarding any unused draws."""
+        self.turn = turn
+        self._start_stream()
+
+    def spawn(self, count: int) -> list["CounterRNG"]:
+        """Return `count` statistically independent child streams, e.g. one per worker or per side."""
+        return [
+            CounterRNG(
+                self.seed,
+                block_size=self.block_size,
+                battle_index=self.battle_index,
+                turn=self.turn,
+                spawn_key=(*self.spawn_key, child),
+            )
+            for child in range(count)
+        ]
@@ -1,33 +1,50 @@
-from math import floor
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
 
 from battle_sim.models.stats import StatStages, StatTotals
 from battle_sim.utils import Nature, NatureEffect, StageBases, Stats
 
+# Row/column orders used by the batch functions: natures follow the Nature enum, stats follow Stats (HP first).
+NATURE_INDEX: dict[Nature, int] = {nature: i for i, nature in enumerate(Nature)}
+STAT_INDEX: dict[Stats, int] = {stat: i for i, stat in enumerate(Stats)}
+
+
+def nature_percent(nature: Nature, stat: Stats) -> int:
+    """Return the nature's effect on a stat as a percentage: 110 boosted, 90 hindered, 100 otherwise."""
+    effect: NatureEffect = nature.value
+    if effect.UP != effect.DOWN:
+        if stat == effect.UP:
+            return 110
+        if stat == effect.DOWN:
+            return 90
+    return 100
+
+
+# (nature, stat) lookup table of nature_percent, for vectorized stat calculation.
+NATURE_PERCENTS: NDArray[np.int64] = np.array(
+    [[nature_percent(nature, stat) for stat in Stats] for nature in Nature], dtype=np.int64
+)
+NATURE_PERCENTS.setflags(write=False)
+
 
 def calculate_total_hp(base: int, iv: int, ev: int, lvl: int) -> int:
-    return floor(((2 * base + iv + floor(ev / 4)) * lvl) / 100) + lvl + 10
+    return (2 * base + iv + ev // 4) * lvl // 100 + lvl + 10
 
 
 def calculate_total_stat(base: int, iv: int, ev: int, lvl: int, nature: Nature, stat: Stats) -> int:
-    def _nature_multiplier(nature: Nature, stat: Stats) -> float:
-        effect: NatureEffect = nature.value
-        if effect.UP != effect.DOWN:
-            if stat == effect.UP:
-                return 1.1
-            if stat == effect.DOWN:
-                return 0.9
-        return 1.0
-
-    raw = floor(((2 * base + iv + floor(ev / 4)) * lvl) / 100) + 5
-    mult = _nature_multiplier(nature, stat)
-    return floor(raw * mult)
+    raw = (2 * base + iv + ev // 4) * lvl // 100 + 5
+    return raw * nature_percent(nature, stat) // 100
 
 
 def calculate_effective_stat(stat_totals: StatTotals, stat_stages: StatStages, stat: Stats) -> int:
     assert stat in (Stats.ATTACK, Stats.DEFENCE, Stats.SP_ATTACK, Stats.SP_DEFENCE, Stats.SPEED)
     unmodified_value = getattr(stat_totals, stat.name)
     stage_level = getattr(stat_stages, stat.name)
-    stage_base = StageBases.STATS
+    return apply_stat_stage(unmodified_value, stage_level)
+
+
+def apply_stat_stage(unmodified_value: int, stage_level: int) -> int:
+    stage_base: int = StageBases.STATS
 
     if stage_level >= 0:
         numerator, denominator = stage_base + stage_level, stage_base
@@ -45,3 +62,46 @@ def calculate_effective_stat(stat_totals: StatTotals, stat_stages: StatStages, s
     #     val = val * 3 // 2
 
     return max(1, modified_value)
+
+
+# Batch versions. Arguments broadcast against each other and results are int64 arrays whose values match the
+# scalar functions above exactly; natures are given as NATURE_INDEX values.
+
+
+def calculate_total_hp_batch(base: ArrayLike, iv: ArrayLike, ev: ArrayLike, lvl: ArrayLike) -> NDArray[np.int64]:
+    base, iv, ev, lvl = (np.asarray(a, dtype=np.int64) for a in (base, iv, ev, lvl))
+    return (2 * base + iv + ev // 4) * lvl // 100 + lvl + 10
+
+
+def calculate_total_stat_batch(
+    base: ArrayLike, iv: ArrayLike, ev: ArrayLike, lvl: ArrayLike, nature: ArrayLike, stat: Stats
+) -> NDArray[np.int64]:
+    base, iv, ev, lvl = (np.asarray(a, dtype=np.int64) for a in (base, iv, ev, lvl))
+    raw = (2 * base + iv + ev // 4) * lvl // 100 + 5
+    return raw * NATURE_PERCENTS[np.asarray(nature, dtype=np.intp), STAT_INDEX[stat]] // 100
+
+
+def calculate_stat_totals_batch(
+    bases: ArrayLike, ivs: ArrayLike, evs: ArrayLike, lvl: ArrayLike, nature: ArrayLike
+) -> NDArray[np.int64]:
+    """
+    Compute full stat totals for many Pokemon at once.
+    `bases`, `ivs` and `evs` have a trailing axis of 6 stats in Stats order; `lvl` and `nature` have one value per
+    Pokemon. Returns totals with the same trailing stats axis.
+    """
+    bases, ivs, evs = (np.asarray(a, dtype=np.int64) for a in (bases, ivs, evs))
+    lvl = np.asarray(lvl, dtype=np.int64)[..., np.newaxis]
+    raw = (2 * bases + ivs + evs // 4) * lvl // 100
+    totals = (raw + 5) * NATURE_PERCENTS[np.asarray(nature, dtype=np.intp)] // 100
+    totals[..., STAT_INDEX[Stats.HP]] = raw[..., STAT_INDEX[Stats.HP]] + lvl[..., 0] + 10
+    return totals
+
+
+def calculate_effective_stat_batch(unmodified_value: ArrayLike, stage_level: ArrayLike) -> NDArray[np.int64]:
+    """Vectorized apply_stat_stage for stats other than HP (stages between -6 and +6)."""
+    value = np.asarray(unmodified_value, dtype=np.int64)
+    stage = np.asarray(stage_level, dtype=np.int64)
+    stage_base: int = StageBases.STATS
+    numerator = stage_base + np.maximum(stage, 0)
+    denominator = stage_base - np.minimum(stage, 0)
+    return np.maximum(1, value * numerator // denominator)
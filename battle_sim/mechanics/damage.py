@@ -0,0 +1,279 @@
+from dataclasses import dataclass
+from typing import Any, Sequence
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from battle_sim.maths.rng import MAX_DAMAGE_ROLL, MIN_DAMAGE_ROLL, RNG
+from battle_sim.mechanics.events import Event, EventBus, EventContext
+from battle_sim.mechanics.payloads import MODIFIER_BASE, DamageCalcPayload
+from battle_sim.models.moves import DamageEffect, Move
+from battle_sim.models.pokemon import Pokemon
+from battle_sim.models.type_matchups import type_effectiveness
+from battle_sim.utils import Category, Stats
+
+DAMAGE_ROLLS: NDArray[np.int64] = np.arange(MIN_DAMAGE_ROLL, MAX_DAMAGE_ROLL + 1, dtype=np.int64)
+DAMAGE_ROLLS.setflags(write=False)
+
+STAB_MODIFIER = 6144  # 1.5x in 4096ths
+CRIT_CHANCES = (1 / 24, 1 / 8, 1 / 2, 1.0)  # By crit stage, Gen 7+
+MULTI_HIT_CHANCES = {2: 0.35, 3: 0.35, 4: 0.15, 5: 0.15}  # Hit counts for 2-5 hit moves, Gen 5+
+
+
+def crit_chance(crit_stage: int) -> float:
+    return CRIT_CHANCES[min(max(crit_stage, 0), len(CRIT_CHANCES) - 1)]
+
+
+def hit_count_chances(multi_hit: tuple[int, int] | None) -> dict[int, float]:
+    """Probability of each number of hits for a DamageEffect's `multi_hit` range."""
+    if multi_hit is None:
+        return {1: 1.0}
+    low, high = multi_hit
+    if (low, high) == (2, 5):
+        return dict(MULTI_HIT_CHANCES)
+    return {hits: 1 / (high - low + 1) for hits in range(low, high + 1)}
+
+
+def roll_hit_count(multi_hit: tuple[int, int] | None, rng: RNG) -> int:
+    if multi_hit is None:
+        return 1
+    roll = rng.random_probability()
+    chances = hit_count_chances(multi_hit)
+    for hits, chance in chances.items():
+        roll -= chance
+        if roll < 0:
+            return hits
+    return multi_hit[1]
+
+
+def damage_for_rolls(
+    level: Any,
+    power: Any,
+    attack: Any,
+    defence: Any,
+    rolls: Any,
+    *,
+    critical: Any = False,
+    stab: Any = False,
+    effectiveness: Any = 1.0,
+    modifier: Any = MODIFIER_BASE,
+) -> Any:
+    """
+    Gen 5+ damage for the given damage roll(s), using the games' integer rounding at every step.
+    Every argument may be a Python number or a NumPy array; arrays broadcast, so passing `DAMAGE_ROLLS` yields all
+    16 outcomes at once. `modifier` is the chained final modifier in 4096ths.
+    The arithmetic is branchless so that scalars and arrays follow exactly the same steps.
+    """
+    effectiveness_quarters: Any
+    if isinstance(effectiveness, np.ndarray):
+        effectiveness_quarters = (effectiveness * 4).astype(np.int64)
+    else:
+        effectiveness_quarters = int(effectiveness * 4)
+    base = (2 * level // 5 + 2) * power * attack // defence // 50 + 2
+    base = base + (base // 2) * critical
+    damage = base * rolls // 100
+    damage = (damage * (MODIFIER_BASE + (STAB_MODIFIER - MODIFIER_BASE) * stab) + 2047) >> 12
+    damage = damage * effectiveness_quarters // 4
+    damage = (damage * modifier + 2047) >> 12
+    return (damage + (damage == 0)) * (effectiveness_quarters > 0)
+
+
+@dataclass(frozen=True, slots=True)
+class DamageDistribution:
+    normal: NDArray[np.int64]  # Damage for each of the 16 rolls, lowest roll first
+    critical: NDArray[np.int64]
+    crit_chance: float
+    effectiveness: float
+
+
+def damage_effect(move: Move) -> DamageEffect | None:
+    """The move's first DamageEffect with a base power, if any."""
+    for effect in move.effects:
+        if isinstance(effect, DamageEffect) and effect.power is not None:
+            return effect
+    return None
+
+
+def _modify(value: int, multiplier: float) -> int:
+    return value if multiplier == 1.0 else max(1, (value * round(multiplier * MODIFIER_BASE) + 2047) >> 12)
+
+
+def _staged_stats(attacker: Pokemon, defender: Pokemon, effect: DamageEffect, critical: bool) -> tuple[int, int]:
+    """Return the (attack, defence) a hit of `effect` uses, after stat stages."""
+    if effect.category is Category.PHYSICAL:
+        attack_stat, defence_stat = Stats.ATTACK, Stats.DEFENCE
+    else:
+        attack_stat, defence_stat = Stats.SP_ATTACK, Stats.SP_DEFENCE
+
+    attack_stage = getattr(attacker.stat_stages, attack_stat)
+    defence_stage = getattr(defender.stat_stages, defence_stat)
+    if critical:
+        # Critical hits ignore the attacker's drops and the defender's boosts.
+        attack_stage, defence_stage = max(attack_stage, 0), min(defence_stage, 0)
+    return (
+        attacker.effective_stat_table[attack_stat][attack_stage + 6],
+        defender.effective_stat_table[defence_stat][defence_stage + 6],
+    )
+
+
+def _fold(payload: DamageCalcPayload, attack: int, defence: int) -> tuple[int, int, int, int]:
+    """Return (power, attack, defence, modifier) with an emitted DamageCalcPayload applied."""
+    return (
+        payload.base_power,
+        _modify(attack, payload.attack_multiplier),
+        _modify(defence, payload.defence_multiplier),
+        payload.chained_modifier(),
+    )
+
+
+def _damage_inputs(
+    attacker: Pokemon,
+    defender: Pokemon,
+    move: Move,
+    effect: DamageEffect,
+    critical: bool,
+    bus: EventBus | None,
+    context: EventContext | None,
+) -> tuple[int, int, int, int]:
+    """Return (power, attack, defence, modifier) for one crit case, after any ON_DAMAGE_CALC handlers."""
+    assert effect.power is not None
+    attack, defence = _staged_stats(attacker, defender, effect, critical)
+    if bus is None:
+        return effect.power, attack, defence, MODIFIER_BASE
+
+    payload = DamageCalcPayload(move=move, base_power=effect.power, critical=critical)
+    assert context is not None  # Callers with a bus always supply one, seeded from their rng
+    bus.emit(Event.ON_DAMAGE_CALC, context, payload)
+    return _fold(payload, attack, defence)
+
+
+def damage_distribution(
+    attacker: Pokemon,
+    defender: Pokemon,
+    move: Move,
+    *,
+    bus: EventBus | None = None,
+    context: EventContext | None = None,
+) -> DamageDistribution:
+    """
+    All 16 damage outcomes of one hit of `move`, for both non-critical and critical hits.
+
+    With a `bus`, ON_DAMAGE_CALC is emitted once, as a non-critical hit, and the handlers' power, stat multipliers and
+    modifiers are folded into both cases; only the crit stage clamping differs. A handler that sets `critical` makes
+    every hit critical.
+    """
+    effect = damage_effect(move)
+    effectiveness = type_effectiveness(move.type, defender.types)
+    if effect is None:
+        zeros = np.zeros(len(DAMAGE_ROLLS), dtype=np.int64)
+        return DamageDistribution(zeros, zeros, 0.0, effectiveness)
+
+    assert effect.power is not None
+    payload = None
+    if bus is not None:
+        if context is None:
+            # Nothing is rolled here; a fixed seed keeps any randomness in handlers reproducible.
+            context = EventContext(rng=RNG(seed=0), actor=attacker)
+        payload = DamageCalcPayload(move=move, base_power=effect.power)
+        bus.emit(Event.ON_DAMAGE_CALC, context, payload)
+    always_critical = payload is not None and payload.critical
+
+    stab = move.type in attacker.types
+    outcomes = []
+    for critical in (always_critical, True):
+        attack, defence = _staged_stats(attacker, defender, effect, critical)
+        if payload is None:
+            power, modifier = effect.power, MODIFIER_BASE
+        else:
+            power, attack, defence, modifier = _fold(payload, attack, defence)
+        outcomes.append(
+            damage_for_rolls(
+                attacker.level,
+                power,
+                attack,
+                defence,
+                DAMAGE_ROLLS,
+                critical=critical,
+                stab=stab,
+                effectiveness=effectiveness,
+                modifier=modifier,
+            )
+        )
+    chance = 1.0 if always_critical else crit_chance(effect.crit_stage)
+    return DamageDistribution(outcomes[0], outcomes[1], chance, effectiveness)
+
+
+def roll_damage(
+    attacker: Pokemon,
+    defender: Pokemon,
+    move: Move,
+    rng: RNG,
+    *,
+    bus: EventBus | None = None,
+    context: EventContext | None = None,
+) -> tuple[int, bool]:
+    """Roll one hit of `move`: returns (damage, critical). Emits ON_DAMAGE_CALC once, for the rolled crit case."""
+    effect = damage_effect(move)
+    if effect is None:
+        return 0, False
+    critical = rng.roll_chance(crit_chance(effect.crit_stage))
+    roll = rng.random_integer(MIN_DAMAGE_ROLL, MAX_DAMAGE_ROLL + 1)
+    if bus is not None and context is None:
+        context = EventContext(rng=rng, actor=attacker)
+    power, attack, defence, modifier = _damage_inputs(attacker, defender, move, effect, critical, bus, context)
+    damage = damage_for_rolls(
+        attacker.level,
+        power,
+        attack,
+        defence,
+        roll,
+        critical=critical,
+        stab=move.type in attacker.types,
+        effectiveness=type_effectiveness(move.type, defender.types),
+        modifier=modifier,
+    )
+    return damage, critical
+
+
+def batch_damage_distributions(
+    attackers: Sequence[Pokemon],
+    defenders: Sequence[Pokemon],
+    moves: Sequence[Move],
+    modifiers: ArrayLike = MODIFIER_BASE,
+) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+    """
+    Damage distributions for many (attacker, defender, move) triples in one vectorized pass.
+    Returns (normal, critical) arrays of shape (N, 16). `modifiers` are optional precomputed final modifiers in
+    4096ths, one per triple; moves without a damaging effect produce rows of zeros.
+    """
+    count = len(moves)
+    columns = np.zeros((2, 5, count), dtype=np.int64)  # (crit case, [power, attack, defence, stab, quarters])
+    for i, (attacker, defender, move) in enumerate(zip(attackers, defenders, moves, strict=True)):
+        effect = damage_effect(move)
+        if effect is None:
+            continue
+        stab = move.type in attacker.types
+        quarters = int(type_effectiveness(move.type, defender.types) * 4)
+        for crit in (0, 1):
+            power, attack, defence, _ = _damage_inputs(attacker, defender, move, effect, bool(crit), None, None)
+            columns[crit, :, i] = power, attack, defence, stab, quarters
+
+    levels = np.array([attacker.level for attacker in attackers], dtype=np.int64)[:, np.newaxis]
+    modifier = np.broadcast_to(np.asarray(modifiers, dtype=np.int64), (count,))[:, np.newaxis]
+    outcomes = []
+    for crit in (0, 1):
+        power, attack, defence, stab, quarters = (column[:, np.newaxis] for column in columns[crit])
+        outcomes.append(
+            damage_for_rolls(
+                levels,
+                power,
+                np.maximum(attack, 1),  # Rows without a damaging effect are all zeros
+                np.maximum(defence, 1),
+                DAMAGE_ROLLS,
+                critical=crit,
+                stab=stab,
+                effectiveness=quarters / 4,
+                modifier=modifier,
+            )
+        )
+    return outcomes[0], outcomes[1]
@@ -1,13 +1,19 @@
-from dataclasses import dataclass, field
+from bisect import bisect_left, insort_right
+from dataclasses import dataclass
 from enum import Enum, IntEnum, auto
-from typing import Any, Protocol
+from typing import TYPE_CHECKING, Any, Protocol, TypeVar, overload
 
 from battle_sim.maths.rng import RNG
-from battle_sim.models.actions import Action
+from battle_sim.mechanics.payloads import EventPayload
+from battle_sim.models.actions import AnyAction
 from battle_sim.models.pokemon import Pokemon
 from battle_sim.utils import Target
 
+if TYPE_CHECKING:
+    from battle_sim.mechanics.instrumentation import BusStats
+
 Payload = dict[str, Any]
+TypedPayload = TypeVar("TypedPayload", bound=EventPayload)
 
 
 class Event(Enum):
@@ -50,17 +56,18 @@ class EventContext:
     rng: RNG
     actor: Pokemon | None = None
     target: Target | None = None
-    action: Action | None = None
+    action: AnyAction | None = None
 
 
 @dataclass(slots=True)
 class HandlerResult:
     cancel: bool = False
-    updated_payload: Payload = field(default_factory=dict)
+    updated_payload: Payload | None = None
 
 
 class EventHandler(Protocol):
-    def __call__(self, context: EventContext, payload: Payload) -> HandlerResult | None: ...
+    # Handlers receive either a `Payload` dict or the typed `EventPayload` passed to `emit`.
+    def __call__(self, context: EventContext, payload: Any) -> HandlerResult | None: ...
 
 
 class EventOwner(Protocol):
@@ -85,12 +92,36 @@ class Subscription:
     once: bool = False
 
 
+SubscriptionKey = tuple[int, int, int, int, bool]
+
+
+def _subscription_key(sub: Subscription) -> SubscriptionKey:
+    owner_id = id(sub.owner) if sub.owner is not None else 0
+    return sub.event.value, id(sub.handler), owner_id, int(sub.priority), sub.once
+
+
+# A compiled chain: the handlers in dispatch order, plus the matching subscriptions when any of them is `once`.
+DispatchChain = tuple[tuple[EventHandler, ...], tuple[Subscription, ...] | None]
+
+_EMPTY_CHAIN: DispatchChain = ((), None)
+
+
+def _descending_priority(sub: Subscription) -> int:
+    return -sub.priority
+
+
 class EventBus:
-    __slots__ = ("_subscriptions", "_dedupe_keys")
+    __slots__ = ("_buckets", "_chains", "_by_key", "_by_owner", "_stats")
 
     def __init__(self) -> None:
-        self._subscriptions: list[Subscription] = []
-        self._dedupe_keys: set[tuple[int, int, int, int, bool]] = set()
+        # Per-event buckets, each kept sorted by descending priority (ties keep registration order).
+        self._buckets: dict[Event, list[Subscription]] = {}
+        # Frozen dispatch chains compiled from the buckets, dropped whenever a bucket changes.
+        self._chains: dict[Event, DispatchChain] = {}
+        self._by_key: dict[SubscriptionKey, Subscription] = {}
+        self._by_owner: dict[int, dict[SubscriptionKey, Subscription]] = {}
+        # Only set while the bus is instrumented; see `battle_sim.mechanics.instrumentation`.
+        self._stats: BusStats | None = None
 
     def on(
         self,
@@ -101,73 +132,113 @@ class EventBus:
         owner: EventOwner | None = None,
         once: bool = False,
     ) -> Subscription:
-        key = (event.value, id(handler), id(owner) if owner is not None else 0, int(priority), once)
-        if key in self._dedupe_keys:
-            return Subscription(event=event, handler=handler, priority=int(priority), owner=owner, once=once)
-
         sub = Subscription(event=event, handler=handler, priority=int(priority), owner=owner, once=once)
-        self._subscriptions.append(sub)
-        self._dedupe_keys.add(key)
-
-        self._subscriptions.sort(key=lambda s: (-s.priority, s.event.value))
+        key = _subscription_key(sub)
+        if key in self._by_key:
+            return sub
+
+        bucket = self._buckets.setdefault(event, [])
+        insort_right(bucket, sub, key=_descending_priority)
+        self._chains.pop(event, None)
+        self._by_key[key] = sub
+        if owner is not None:
+            self._by_owner.setdefault(id(owner), {})[key] = sub
         return sub
 
     def off(self, subscription: Subscription) -> None:
-        if subscription in self._subscriptions:
-            self._subscriptions.remove(subscription)
-            key = (
-                subscription.event.value,
-                id(subscription.handler),
-                id(subscription.owner) if subscription.owner is not None else 0,
-                int(subscription.priority),
-                subscription.once,
-            )
-            if key in self._dedupe_keys:
-                self._dedupe_keys.remove(key)
-
-    def off_owner(self, owner: EventOwner) -> None:
-        if not self._subscriptions:
+        key = _subscription_key(subscription)
+        registered = self._by_key.pop(key, None)
+        if registered is None:
             return
 
-        remaining: list[Subscription] = []
-        for sub in self._subscriptions:
-            if sub.owner is owner:
-                key = (
-                    sub.event.value,
-                    id(sub.handler),
-                    id(owner),
-                    int(sub.priority),
-                    sub.once,
-                )
-                if key in self._dedupe_keys:
-                    self._dedupe_keys.remove(key)
-                continue
-            remaining.append(sub)
-        self._subscriptions = remaining
-
-    def emit(self, event: Event, context: EventContext, payload: Payload | None = None) -> Payload:
-        current: Payload = dict(payload or {})
-        to_remove_once: list[Subscription] = []
-
-        for sub in list(self._subscriptions):
-            if sub.event is not event:
-                continue
-
-            result = sub.handler(context, current)
+        self._remove_from_bucket(registered)
+        if registered.owner is not None:
+            owned = self._by_owner.get(id(registered.owner))
+            if owned is not None:
+                owned.pop(key, None)
+                if not owned:
+                    del self._by_owner[id(registered.owner)]
 
-            if sub.once:
-                to_remove_once.append(sub)
+    def off_owner(self, owner: EventOwner) -> None:
+        owned = self._by_owner.pop(id(owner), None)
+        if not owned:
+            return
 
+        for key, sub in owned.items():
+            del self._by_key[key]
+            self._remove_from_bucket(sub)
+
+    def _remove_from_bucket(self, sub: Subscription) -> None:
+        """Remove a registered subscription, searching only the run of handlers sharing its priority."""
+        bucket = self._buckets[sub.event]
+        index = bisect_left(bucket, -sub.priority, key=_descending_priority)
+        while bucket[index] is not sub:
+            index += 1
+        del bucket[index]
+        self._chains.pop(sub.event, None)
+        if not bucket:
+            del self._buckets[sub.event]
+
+    def _compile(self, event: Event) -> DispatchChain:
+        bucket = self._buckets.get(event)
+        if not bucket:
+            chain = _EMPTY_CHAIN
+        else:
+            handlers = tuple(sub.handler for sub in bucket)
+            once_subs = tuple(bucket) if any(sub.once for sub in bucket) else None
+            chain = (handlers, once_subs)
+        self._chains[event] = chain
+        return chain
+
+    @overload
+    def emit(self, event: Event, context: EventContext, payload: TypedPayload) -> TypedPayload: ...
+
+    @overload
+    def emit(self, event: Event, context: EventContext, payload: Payload | None = None) -> Payload: ...
+
+    def emit(self, event: Event, context: EventContext, payload: EventPayload | Payload | None = None) -> Any:
+        """
+        Run the handlers for `event` in priority order. Typed payloads are mutated in place and returned;
+        dict payloads are copied first, so the caller's dict is never modified.
+        """
+        current: EventPayload | Payload
+        if payload is None:  # Most emits; a fresh dict is all they need, with no copy to make
+            current = {}
+        elif isinstance(payload, EventPayload):
+            current = payload
+        else:
+            current = dict(payload)
+        chain = self._chains.get(event)
+        if chain is None:
+            chain = self._compile(event)
+        handlers, once_subs = chain
+
+        # Chains are immutable, so handlers may subscribe or unsubscribe mid-emit without a defensive copy;
+        # the change takes effect from the next emit.
+        if once_subs is None:
+            for handler in handlers:
+                result = handler(context, current)
+                if result is None:
+                    continue
+                if result.updated_payload:
+                    current.update(result.updated_payload)
+                if result.cancel:
+                    break
+            return current
+
+        called = 0
+        for handler in handlers:
+            called += 1
+            result = handler(context, current)
             if result is None:
                 continue
-
             if result.updated_payload:
                 current.update(result.updated_payload)
-
             if result.cancel:
                 break
 
-        for sub in to_remove_once:
-            self.off(sub)
+        for sub in once_subs[:called]:
+            if sub.once:
+                self.off(sub)
 
         return current
@@ -0,0 +1,220 @@
+from dataclasses import dataclass, field
+from time import perf_counter_ns
+from typing import TYPE_CHECKING, Any, Literal
+
+from battle_sim.mechanics.events import (
+    DispatchChain,
+    Event,
+    EventBus,
+    EventContext,
+    EventPayload,
+    EventPriority,
+    Payload,
+    Subscription,
+)
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Instrumentation swaps a bus's class to `InstrumentedEventBus` rather than checking a flag in `emit`, so a bus that
+# is not instrumented runs exactly the plain `EventBus.emit`. The subclass adds no slots of its own (the stats live in
+# the base class's `_stats` slot), which is what lets `__class__` be reassigned in both directions.
+
+Section = Literal["events", "tiers", "handlers"]
+
+_TIERS = sorted(EventPriority, reverse=True)
+
+
+def priority_tier(priority: int) -> EventPriority:
+    """The highest `EventPriority` tier at or below `priority`; anything below DEFAULT counts as DEFAULT."""
+    for tier in _TIERS:
+        if priority >= tier:
+            return tier
+    return EventPriority.DEFAULT
+
+
+def handler_name(sub: Subscription) -> str:
+    name = getattr(sub.handler, "__qualname__", None) or type(sub.handler).__qualname__
+    return name if sub.owner is None else f"{sub.owner.name}:{name}"
+
+
+def _rate(count: int, total: int) -> float:
+    return count / total if total else 0.0
+
+
+@dataclass(slots=True)
+class EventStats:
+    emits: int = 0
+    handler_calls: int = 0
+    cancels: int = 0
+
+
+@dataclass(slots=True)
+class HandlerStats:
+    event: Event
+    priority: int
+    name: str
+    calls: int = 0
+    total_ns: int = 0
+    max_ns: int = 0
+    cancels: int = 0
+
+
+@dataclass(slots=True)
+class BusStats:
+    """Counts and wall times collected by an instrumented bus. Times are kept in integer nanoseconds."""
+
+    events: dict[Event, EventStats] = field(default_factory=dict)
+    # Handlers are aggregated by (event, priority, name), so re-registering a handler keeps adding to one entry.
+    handlers: dict[tuple[Event, int, str], HandlerStats] = field(default_factory=dict)
+    # The per-handler stats for each compiled chain, rebuilt when the bus recompiles that chain.
+    _bound: dict[Event, tuple[DispatchChain, tuple[HandlerStats, ...]]] = field(default_factory=dict)
+
+    def clear(self) -> None:
+        self.events.clear()
+        self.handlers.clear()
+        self._bound.clear()
+
+    def _bind(self, event: Event, chain: DispatchChain) -> tuple[HandlerStats, ...]:
+        handler_stats = []
+        for sub in chain[1] or ():
+            key = (event, sub.priority, handler_name(sub))
+            stats = self.handlers.get(key)
+            if stats is None:
+                stats = self.handlers[key] = HandlerStats(event, sub.priority, key[2])
+            handler_stats.append(stats)
+        bound = self._bound[event] = (chain, tuple(handler_stats))
+        return bound[1]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Per-event, per-priority-tier and per-handler (slowest first) stats, with times in seconds."""
+        events = {
+            event.name: {
+                "emits": stats.emits,
+                "handler_calls": stats.handler_calls,
+                "cancels": stats.cancels,
+                "cancel_rate": _rate(stats.cancels, stats.emits),
+            }
+            for event, stats in self.events.items()
+        }
+
+        tiers: dict[str, dict[str, Any]] = {}
+        handlers = []
+        for stats in sorted(self.handlers.values(), key=lambda s: s.total_ns, reverse=True):
+            tier = priority_tier(stats.priority)
+            handlers.append(
+                {
+                    "event": stats.event.name,
+                    "tier": tier.name,
+                    "priority": stats.priority,
+                    "handler": stats.name,
+                    "calls": stats.calls,
+                    "total_time": stats.total_ns / 1e9,
+                    "mean_time": _rate(stats.total_ns, stats.calls) / 1e9,
+                    "max_time": stats.max_ns / 1e9,
+                    "cancels": stats.cancels,
+                    "cancel_rate": _rate(stats.cancels, stats.calls),
+                }
+            )
+            totals = tiers.setdefault(tier.name, {"handler_calls": 0, "total_time": 0.0, "max_time": 0.0, "cancels": 0})
+            totals["handler_calls"] += stats.calls
+            totals["total_time"] += stats.total_ns / 1e9
+            totals["max_time"] = max(totals["max_time"], stats.max_ns / 1e9)
+            totals["cancels"] += stats.cancels
+        for totals in tiers.values():
+            totals["cancel_rate"] = _rate(totals["cancels"], totals["handler_calls"])
+
+        return {"events": events, "tiers": tiers, "handlers": handlers}
+
+    def to_frame(self, section: Section = "handlers") -> "pd.DataFrame":
+        """One section of `to_dict` as a DataFrame: events and tiers are indexed by name, handlers are rows."""
+        import pandas as pd
+
+        data = self.to_dict()[section]
+        if section == "handlers":
+            return pd.DataFrame(data)
+        return pd.DataFrame.from_dict(data, orient="index")
+
+
+class InstrumentedEventBus(EventBus):
+    """An `EventBus` whose `emit` also records counts and per-handler timings into `stats`."""
+
+    __slots__ = ()
+
+    _stats: BusStats
+
+    @property
+    def stats(self) -> BusStats:
+        return self._stats
+
+    def _compile(self, event: Event) -> DispatchChain:
+        # Always keep the subscriptions, so each handler can be matched to its stats.
+        bucket = self._buckets.get(event)
+        chain: DispatchChain = (tuple(sub.handler for sub in bucket), tuple(bucket)) if bucket else ((), None)
+        self._chains[event] = chain
+        return chain
+
+    def emit(self, event: Event, context: EventContext, payload: EventPayload | Payload | None = None) -> Any:
+        current: EventPayload | Payload
+        if payload is None:
+            current = {}
+        elif isinstance(payload, EventPayload):
+            current = payload
+        else:
+            current = dict(payload)
+        chain = self._chains.get(event)
+        if chain is None:
+            chain = self._compile(event)
+        handlers, subs = chain
+
+        stats = self._stats
+        event_stats = stats.events.get(event)
+        if event_stats is None:
+            event_stats = stats.events[event] = EventStats()
+        bound = stats._bound.get(event)
+        handler_stats = bound[1] if bound is not None and bound[0] is chain else stats._bind(event, chain)
+
+        event_stats.emits += 1
+        called = 0
+        for handler, timing in zip(handlers, handler_stats, strict=True):
+            called += 1
+            start = perf_counter_ns()
+            result = handler(context, current)
+            elapsed = perf_counter_ns() - start
+            timing.calls += 1
+            timing.total_ns += elapsed
+            if elapsed > timing.max_ns:
+                timing.max_ns = elapsed
+            if result is None:
+                continue
+            if result.updated_payload:
+                current.update(result.updated_payload)
+            if result.cancel:
+                timing.cancels += 1
+                event_stats.cancels += 1
+                break
+        event_stats.handler_calls += called
+
+        for sub in (subs or ())[:called]:
+            if sub.once:
+                self.off(sub)
+        return current
+
+
+def instrument(bus: EventBus, stats: BusStats | None = None) -> BusStats:
+    """Start recording stats on `bus` (into `stats`, if given) and return them. Instrumenting twice is a no-op."""
+    if isinstance(bus, InstrumentedEventBus):
+        return bus.stats
+    bus._stats = stats if stats is not None else BusStats()
+    bus.__class__ = InstrumentedEventBus
+    bus._chains.clear()
+    return bus._stats
+
+
+def uninstrument(bus: EventBus) -> BusStats | None:
+    """Return `bus` to the plain `EventBus.emit` and hand back the stats it collected, if it was instrumented."""
+    stats = bus._stats
+    bus.__class__ = EventBus
+    bus._stats = None
+    bus._chains.clear()
+    return stats
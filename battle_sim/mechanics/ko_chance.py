@@ -0,0 +1,94 @@
+import numpy as np
+from numpy.typing import NDArray
+
+from battle_sim.mechanics.damage import DamageDistribution, damage_distribution, damage_effect, hit_count_chances
+from battle_sim.mechanics.events import EventBus, EventContext
+from battle_sim.models.moves import Move
+from battle_sim.models.pokemon import Pokemon
+
+# Exact KO odds by convolving damage histograms. Every histogram is a probability mass function over damage
+# 0..hp, where the last bin collects any damage at or above `hp`; a KO is absorbing, so capping after each
+# convolution keeps arrays small without changing the answer.
+
+
+def _cap(pmf: NDArray[np.float64], hp: int) -> NDArray[np.float64]:
+    capped = pmf[: hp + 1].copy()
+    capped[hp] += pmf[hp + 1 :].sum()
+    return capped
+
+
+def hit_pmf(distribution: DamageDistribution, hp: int) -> NDArray[np.float64]:
+    """Damage histogram of a single hit: 16 equally likely rolls, each a critical hit with `crit_chance`."""
+    pmf = np.zeros(hp + 1, dtype=np.float64)
+    weight = 1 / len(distribution.normal)
+    np.add.at(pmf, np.minimum(distribution.normal, hp), (1 - distribution.crit_chance) * weight)
+    np.add.at(pmf, np.minimum(distribution.critical, hp), distribution.crit_chance * weight)
+    return pmf
+
+
+def use_pmf(
+    distribution: DamageDistribution,
+    hp: int,
+    *,
+    accuracy: float | None = None,
+    multi_hit: tuple[int, int] | None = None,
+) -> NDArray[np.float64]:
+    """
+    Damage histogram of one use of a move: a single accuracy check, then a `multi_hit`-distributed number of hits
+    that each roll damage and crits independently. `accuracy=None` never misses.
+    """
+    single = hit_pmf(distribution, hp)
+    pmf = np.zeros(hp + 1, dtype=np.float64)
+    hits = np.zeros(hp + 1, dtype=np.float64)
+    hits[0] = 1.0
+    chances = hit_count_chances(multi_hit)
+    for count in range(1, max(chances) + 1):
+        hits = _cap(np.convolve(hits, single), hp)
+        pmf += chances.get(count, 0.0) * hits
+    if accuracy is not None:
+        pmf *= accuracy
+        pmf[0] += 1 - accuracy
+    return pmf
+
+
+def ko_chances_from_pmf(pmf: NDArray[np.float64], hp: int, max_uses: int) -> NDArray[np.float64]:
+    """P(KO within k uses) for k = 1..max_uses, given the damage histogram of one use."""
+    if hp <= 0:
+        return np.ones(max_uses, dtype=np.float64)
+    chances = np.empty(max_uses, dtype=np.float64)
+    taken = np.zeros(hp + 1, dtype=np.float64)
+    taken[0] = 1.0
+    for uses in range(max_uses):
+        taken = _cap(np.convolve(taken, pmf), hp)
+        chances[uses] = taken[hp]
+    return np.minimum(chances, 1.0)
+
+
+def ko_chances(
+    attacker: Pokemon,
+    defender: Pokemon,
+    move: Move,
+    max_uses: int = 4,
+    *,
+    hp: int | None = None,
+    bus: EventBus | None = None,
+    context: EventContext | None = None,
+) -> NDArray[np.float64]:
+    """
+    Exact probability that `move` KOs `defender` within 1..max_uses uses, accounting for accuracy, crit chance and
+    multi-hit. `hp` defaults to the defender's current HP. Stats and modifiers are held fixed across uses.
+    """
+    if max_uses < 1:
+        raise ValueError("max_uses must be at least 1.")
+    hp = defender.live_stats.HP if hp is None else hp
+    effect = damage_effect(move)
+    if effect is None or hp <= 0:
+        return np.full(max_uses, float(hp <= 0))
+    distribution = damage_distribution(attacker, defender, move, bus=bus, context=context)
+    pmf = use_pmf(distribution, hp, accuracy=move.accuracy_probability, multi_hit=effect.multi_hit)
+    return ko_chances_from_pmf(pmf, hp, max_uses)
+
+
+def ko_chance(attacker: Pokemon, defender: Pokemon, move: Move, uses: int = 1, *, hp: int | None = None) -> float:
+    """Probability that `move` KOs `defender` within `uses` uses, e.g. `uses=2` for the chance to 2HKO."""
+    return float(ko_chances(attacker, defender, move, uses, hp=hp)[-1])
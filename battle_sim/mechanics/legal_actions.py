@@ -0,0 +1,79 @@
+from typing import Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+from battle_sim.models.actions import ActionRecord, ActionType
+from battle_sim.models.battle_state import TEAM_SIZE, BattleState, FieldColumn, PokemonColumn
+from battle_sim.models.moves import MoveSlot
+from battle_sim.models.pokemon import Pokemon
+
+# Fixed-width action space: one entry per move slot, then one per team position to switch to. Each move slot has a
+# single action, aimed at its move's own Target.
+NUM_MOVE_ACTIONS = len(MoveSlot)
+NUM_SWITCH_ACTIONS = TEAM_SIZE
+ACTION_SPACE = NUM_MOVE_ACTIONS + NUM_SWITCH_ACTIONS
+
+SWITCH_ACTIONS = tuple(ActionRecord(ActionType.SWITCH_OUT, switch_index=i) for i in range(NUM_SWITCH_ACTIONS))
+_PP = slice(PokemonColumn.PP_1, PokemonColumn.PP_4 + 1)
+
+
+def usable_move_slots(pokemon: Pokemon) -> list[MoveSlot]:
+    """Slots whose move has PP left, or just the first slot if none do (Struggle is not modelled yet)."""
+    usable = [slot for slot in MoveSlot if pokemon.moves[slot] is not None and pokemon.moves.has_pp(slot)]
+    return usable or [MoveSlot.FIRST]
+
+
+def legal_action_mask(team: Sequence[Pokemon], active: int, out: NDArray[np.bool_] | None = None) -> NDArray[np.bool_]:
+    """
+    Write the legal actions of the side whose active Pokemon is `team[active]` into `out` (shape (ACTION_SPACE,)).
+    Moves are legal while the active Pokemon is standing; switches to any other standing team member are legal.
+    """
+    if out is None:
+        out = np.zeros(ACTION_SPACE, dtype=np.bool_)
+    else:
+        out[:] = False
+    pokemon = team[active]
+    if not pokemon.is_fainted():
+        for slot in usable_move_slots(pokemon):
+            out[slot.index] = True
+    for position, member in enumerate(team):
+        if position != active and not member.is_fainted():
+            out[NUM_MOVE_ACTIONS + position] = True
+    return out
+
+
+def legal_action_masks(state: BattleState, side: int, out: NDArray[np.bool_] | None = None) -> NDArray[np.bool_]:
+    """
+    `legal_action_mask` for one side of every battle in `state`, written into `out` (shape (num_battles,
+    ACTION_SPACE)) with array operations only. Empty team positions hold 0 HP, so they are never legal switches.
+    """
+    num_battles = state.num_battles
+    if out is None:
+        out = np.empty((num_battles, ACTION_SPACE), dtype=np.bool_)
+    battles = np.arange(num_battles)
+    team = state.pokemon[:, side * TEAM_SIZE : (side + 1) * TEAM_SIZE]
+    active = state.field[:, FieldColumn.ACTIVE_ONE + side].astype(np.intp)
+    active_rows = team[battles, active]
+    standing = active_rows[:, PokemonColumn.HP] > 0
+
+    moves = out[:, :NUM_MOVE_ACTIONS]
+    np.greater(active_rows[:, _PP], 0, out=moves)
+    moves[:, 0] |= ~moves.any(axis=1)  # Struggle fallback, as in usable_move_slots
+    moves &= standing[:, np.newaxis]
+
+    switches = out[:, NUM_MOVE_ACTIONS:]
+    np.greater(team[:, :, PokemonColumn.HP], 0, out=switches)
+    switches[battles, active] = False
+    return out
+
+
+def action_for_index(pokemon: Pokemon, index: int) -> ActionRecord:
+    """Decode an index into the action space as the ActionRecord it stands for."""
+    if index >= NUM_MOVE_ACTIONS:
+        return SWITCH_ACTIONS[index - NUM_MOVE_ACTIONS]
+    slot = MoveSlot(index + 1)
+    move = pokemon.moves[slot]
+    if move is None:
+        raise ValueError(f"{pokemon.nickname} has no move in {slot}.")
+    return ActionRecord(ActionType.USE_MOVE, slot, move.target)
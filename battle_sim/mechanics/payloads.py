@@ -0,0 +1,115 @@
+from dataclasses import dataclass, field, fields
+from typing import Any, Iterable, Mapping
+
+from battle_sim.models.moves import Move
+from battle_sim.models.pokemon import Pokemon
+from battle_sim.utils import ExtraStatus, Status
+
+# Damage modifiers are chained as 4096ths, matching the games' fixed-point arithmetic.
+MODIFIER_BASE = 4096
+
+
+class EventPayload:
+    """
+    Base class for typed, slotted event payloads that handlers mutate in place.
+    Dict-style access is kept as a compatibility adapter so handlers written against `Payload` dicts
+    (and `HandlerResult.updated_payload`) keep working unchanged. Keys are the dataclass fields; any other key is
+    kept in an overflow mapping, as a `Payload` dict would keep it.
+    """
+
+    __slots__ = ("_extra",)
+    _extra: dict[str, Any]  # Overflow mapping for non-field keys, only set once one is written
+
+    def __getitem__(self, key: str) -> Any:
+        if key in _field_names(type(self)):
+            return getattr(self, key)
+        return self._overflow()[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key in _field_names(type(self)):
+            setattr(self, key, value)
+            return
+        extra = self._overflow()
+        if extra is _NO_EXTRA:
+            extra = self._extra = {}
+        extra[key] = value
+
+    def __contains__(self, key: object) -> bool:
+        return key in _field_names(type(self)) or key in self._overflow()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in _field_names(type(self)):
+            return getattr(self, key)
+        return self._overflow().get(key, default)
+
+    def keys(self) -> tuple[str, ...]:
+        return _field_names(type(self)) + tuple(self._overflow())
+
+    def update(self, values: Mapping[str, Any] | Iterable[tuple[str, Any]]) -> None:
+        items = values.items() if isinstance(values, Mapping) else values
+        for key, value in items:
+            self[key] = value
+
+    def to_dict(self) -> dict[str, Any]:
+        return {key: self[key] for key in self.keys()}
+
+    def _overflow(self) -> dict[str, Any]:
+        return getattr(self, "_extra", _NO_EXTRA)
+
+
+_NO_EXTRA: dict[str, Any] = {}  # Shared empty overflow; never written to
+
+
+_FIELD_NAMES: dict[type, tuple[str, ...]] = {}
+
+
+def _field_names(payload_type: type) -> tuple[str, ...]:
+    names = _FIELD_NAMES.get(payload_type)
+    if names is None:
+        names = _FIELD_NAMES[payload_type] = tuple(f.name for f in fields(payload_type))
+    return names
+
+
+@dataclass(slots=True)
+class TurnPayload(EventPayload):
+    turn: int
+
+
+@dataclass(slots=True)
+class SwitchPayload(EventPayload):
+    outgoing: Pokemon | None
+    incoming: Pokemon | None
+
+
+@dataclass(slots=True)
+class StatusPayload(EventPayload):
+    status: Status | ExtraStatus
+
+
+@dataclass(slots=True)
+class DamageCalcPayload(EventPayload):
+    move: Move
+    base_power: int
+    attack_multiplier: float = 1.0
+    defence_multiplier: float = 1.0
+    critical: bool = False
+    modifiers: list[float] = field(default_factory=list)
+
+    def add_modifier(self, modifier: float) -> None:
+        """Queue a final-damage multiplier (e.g. 1.3 for Life Orb, 1.2 for Expert Belt, 0.5 for screens)."""
+        self.modifiers.append(modifier)
+
+    def chained_modifier(self) -> int:
+        """Combine queued modifiers into one 4096-based multiplier, rounding half up after each step."""
+        chained = MODIFIER_BASE
+        for modifier in self.modifiers:
+            chained = (chained * round(modifier * MODIFIER_BASE) + MODIFIER_BASE // 2) >> 12
+        return chained
+
+
+@dataclass(slots=True)
+class HitPayload(EventPayload):
+    move: Move
+    damage: int = 0
+    effectiveness: float = 1.0
+    critical: bool = False
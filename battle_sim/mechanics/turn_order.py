@@ -0,0 +1,66 @@
+from typing import Sequence
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from battle_sim.maths.rng import RNG
+from battle_sim.models.actions import ActionType, AnyAction
+from battle_sim.models.pokemon import Pokemon
+from battle_sim.utils import Stats
+
+# Lower runs first: switches and items resolve before any move, whatever its priority.
+ACTION_ORDER: dict[ActionType, int] = {
+    ActionType.RUN: 0,
+    ActionType.SWITCH_OUT: 1,
+    ActionType.USE_ITEM: 2,
+    ActionType.USE_MOVE: 3,
+}
+
+TurnOrderKey = tuple[int, int, int, float]
+
+
+def action_priority(pokemon: Pokemon, action: AnyAction) -> int:
+    """The priority bracket of `action`: its move's priority for USE_MOVE, otherwise 0."""
+    if action.action is not ActionType.USE_MOVE or action.move is None:
+        return 0
+    move = pokemon.moves[action.move]
+    return 0 if move is None else int(move.priority)
+
+
+def turn_order_key(pokemon: Pokemon, action: AnyAction, rng: RNG) -> TurnOrderKey:
+    """Sort key for one action; draws one random number, which only matters for speed ties."""
+    return (
+        ACTION_ORDER[action.action],
+        -action_priority(pokemon, action),
+        -pokemon.effective_stat(Stats.SPEED),
+        rng.random_probability(),
+    )
+
+
+def order_actions(actors: Sequence[Pokemon], actions: Sequence[AnyAction], rng: RNG) -> list[int]:
+    """Return the indices of `actions` (each used by the matching actor) in the order they resolve."""
+    keys = [turn_order_key(pokemon, action, rng) for pokemon, action in zip(actors, actions, strict=True)]
+    return sorted(range(len(keys)), key=keys.__getitem__)
+
+
+def order_actions_batch(
+    ranks: ArrayLike,
+    priorities: ArrayLike,
+    speeds: ArrayLike,
+    *,
+    tiebreaks: ArrayLike | None = None,
+    rng: RNG | None = None,
+) -> NDArray[np.intp]:
+    """
+    Turn order for many lockstep battles at once. Each argument has shape (num_battles, actions_per_battle):
+    `ranks` are ACTION_ORDER values, `priorities` move priorities and `speeds` effective speeds. Speed ties are
+    broken by `tiebreaks` (lower first), by fresh draws from `rng`, or else by position.
+    Returns the per-battle action indices in resolution order, with the same shape, from a single lexsort.
+    """
+    ranks, priorities, speeds = np.asarray(ranks), np.asarray(priorities), np.asarray(speeds)
+    if tiebreaks is None and rng is not None:
+        tiebreaks = rng.random_probabilities(ranks.size).reshape(ranks.shape)
+    elif tiebreaks is None:
+        tiebreaks = np.zeros(ranks.shape)
+    # lexsort sorts by the last key first, row by row; it is stable, so exact ties keep their original position.
+    return np.lexsort((np.asarray(tiebreaks), -speeds, -priorities, ranks), axis=-1)
@@ -1,4 +1,6 @@
 from enum import Enum, auto
+from functools import cache
+from typing import NamedTuple, Sequence, TypeAlias
 
 from pydantic import BaseModel, model_validator
 
@@ -27,3 +29,86 @@ class Action(BaseModel):
         elif self.action == ActionType.SWITCH_OUT and self.switch_in is None:
             raise ValueError("SWITCH_OUT requires a pokemon to switch_in.")
         return self
+
+
+# Packed action codes: bits 0-1 hold the ActionType, bits 2-4 the MoveSlot value, bits 5-8 the Target (1-based) and
+# bits 9-12 the switch index (1-based); 0 in a field means "not set".
+ACTION_TYPES = tuple(ActionType)
+TARGETS = tuple(Target)
+_ACTION_TYPE_CODE = {action_type: code for code, action_type in enumerate(ACTION_TYPES)}
+_TARGET_CODE = {target: code + 1 for code, target in enumerate(TARGETS)}
+_MOVE_SHIFT, _TARGET_SHIFT, _SWITCH_SHIFT = 2, 5, 9
+MAX_SWITCH_INDEX = 14
+
+
+class ActionRecord(NamedTuple):
+    """
+    Lightweight, unvalidated counterpart of `Action` for bots and search: the switch target is a team position rather
+    than a Pokemon, and records pack into small ints. Call `validate` (strict mode) on user-supplied records.
+    """
+
+    action: ActionType
+    move: MoveSlot | None = None
+    target: Target | None = None
+    switch_index: int | None = None
+
+    def pack(self) -> int:
+        code = _ACTION_TYPE_CODE[self.action]
+        if self.move is not None:
+            code |= self.move.value << _MOVE_SHIFT
+        if self.target is not None:
+            code |= _TARGET_CODE[self.target] << _TARGET_SHIFT
+        if self.switch_index is not None:
+            code |= (self.switch_index + 1) << _SWITCH_SHIFT
+        return code
+
+    def validate(self, team_size: int | None = None) -> "ActionRecord":
+        """Run the same checks as `Action`'s validator, plus type and range checks; return self or raise ValueError."""
+        if not isinstance(self.action, ActionType):
+            raise ValueError(f"Unknown action type {self.action!r}.")
+        if self.move is not None and not isinstance(self.move, MoveSlot):
+            raise ValueError(f"Unknown move slot {self.move!r}.")
+        if self.target is not None and not isinstance(self.target, Target):
+            raise ValueError(f"Unknown target {self.target!r}.")
+        if self.switch_index is not None:
+            limit = MAX_SWITCH_INDEX if team_size is None else team_size - 1
+            if not isinstance(self.switch_index, int) or not 0 <= self.switch_index <= limit:
+                raise ValueError(f"Switch index {self.switch_index!r} is out of range.")
+        if self.action == ActionType.USE_MOVE and (self.target is None or self.move is None):
+            raise ValueError("USE_MOVE requires a target and a move.")
+        elif self.action == ActionType.SWITCH_OUT and self.switch_index is None:
+            raise ValueError("SWITCH_OUT requires a switch_index.")
+        return self
+
+    @classmethod
+    def from_action(cls, action: Action, team: Sequence[Pokemon]) -> "ActionRecord":
+        """Encode a validated Action, resolving `switch_in` to its position in `team`."""
+        switch_index = None
+        if action.switch_in is not None:
+            positions = [i for i, pokemon in enumerate(team) if pokemon is action.switch_in]
+            if not positions:
+                raise ValueError(f"{action.switch_in.nickname} is not in the team.")
+            switch_index = positions[0]
+        return cls(action.action, action.move, action.target, switch_index)
+
+    def to_action(self, team: Sequence[Pokemon]) -> Action:
+        """Build the equivalent validated Action."""
+        switch_in = None if self.switch_index is None else team[self.switch_index]
+        return Action(action=self.action, target=self.target, move=self.move, switch_in=switch_in)
+
+
+@cache
+def unpack_action(code: int) -> ActionRecord:
+    """Decode a packed action; decoded records are shared, as they are immutable."""
+    move = (code >> _MOVE_SHIFT) & 0b111
+    target = (code >> _TARGET_SHIFT) & 0b1111
+    switch = (code >> _SWITCH_SHIFT) & 0b1111
+    return ActionRecord(
+        ACTION_TYPES[code & 0b11],
+        MoveSlot(move) if move else None,
+        TARGETS[target - 1] if target else None,
+        switch - 1 if switch else None,
+    )
+
+
+AnyAction: TypeAlias = Action | ActionRecord
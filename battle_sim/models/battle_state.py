@@ -0,0 +1,261 @@
+from enum import IntEnum
+from typing import Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+from battle_sim.maths.stats import NATURE_INDEX, apply_stat_stage
+from battle_sim.models.moves import MoveSlot
+from battle_sim.models.pokemon import Pokemon
+from battle_sim.models.type_matchups import NO_TYPE_INDEX, TYPE_INDEX, TypePair
+from battle_sim.utils import Hazards, Stats, Status, Terrain, Type, Weather
+
+SIDES = 2
+TEAM_SIZE = 6
+TEAM_SLOTS = SIDES * TEAM_SIZE  # Slot = side * TEAM_SIZE + team position
+
+# Every value fits comfortably in 16 bits; widen before doing arithmetic that can overflow (e.g. damage).
+STATE_DTYPE = np.int16
+
+STATUS_INDEX: dict[Status, int] = {status: i for i, status in enumerate(Status)}
+WEATHER_INDEX: dict[Weather, int] = {weather: i for i, weather in enumerate(Weather)}
+TERRAIN_INDEX: dict[Terrain, int] = {terrain: i for i, terrain in enumerate(Terrain)}
+SIDE_HAZARDS: tuple[Hazards, ...] = tuple(hazard for hazard in Hazards if hazard is not Hazards.NONE)
+
+
+class PokemonColumn(IntEnum):
+    HP = 0
+    MAX_HP = 1
+    LEVEL = 2
+    ATTACK = 3  # Stat totals
+    DEFENCE = 4
+    SP_ATTACK = 5
+    SP_DEFENCE = 6
+    SPEED = 7
+    STAGE_ATTACK = 8  # Stat stages, in StatStages field order
+    STAGE_DEFENCE = 9
+    STAGE_SP_ATTACK = 10
+    STAGE_SP_DEFENCE = 11
+    STAGE_SPEED = 12
+    STAGE_ACCURACY = 13
+    STAGE_EVASION = 14
+    PP_1 = 15  # Remaining PP per MoveSlot
+    PP_2 = 16
+    PP_3 = 17
+    PP_4 = 18
+    STATUS = 19  # STATUS_INDEX
+    PRIMARY_TYPE = 20  # TYPE_INDEX, or NO_TYPE_INDEX for a missing secondary type
+    SECONDARY_TYPE = 21
+    NATURE = 22  # NATURE_INDEX
+    MOVE_1 = 23  # Move id per MoveSlot, EMPTY_SLOT_ID for an empty slot
+    MOVE_2 = 24
+    MOVE_3 = 25
+    MOVE_4 = 26
+
+
+class FieldColumn(IntEnum):
+    TURN = 0
+    WEATHER = 1  # WEATHER_INDEX
+    WEATHER_TURNS = 2
+    TERRAIN = 3  # TERRAIN_INDEX
+    TERRAIN_TURNS = 4
+    ACTIVE_ONE = 5  # Team position of each side's active Pokemon
+    ACTIVE_TWO = 6
+    HAZARDS_ONE = 7  # One layer/turn counter per SIDE_HAZARDS entry, for each side
+    HAZARDS_TWO = HAZARDS_ONE + len(SIDE_HAZARDS)
+
+
+POKEMON_WIDTH = len(PokemonColumn)
+POKEMON_BLOCK = TEAM_SLOTS * POKEMON_WIDTH
+FIELD_WIDTH = FieldColumn.HAZARDS_TWO + len(SIDE_HAZARDS)
+ROW_WIDTH = POKEMON_BLOCK + FIELD_WIDTH
+
+_TOTAL_COLUMN: dict[str, int] = {
+    Stats.ATTACK: PokemonColumn.ATTACK,
+    Stats.DEFENCE: PokemonColumn.DEFENCE,
+    Stats.SP_ATTACK: PokemonColumn.SP_ATTACK,
+    Stats.SP_DEFENCE: PokemonColumn.SP_DEFENCE,
+    Stats.SPEED: PokemonColumn.SPEED,
+}
+_STAGE_COLUMN: dict[str, int] = {
+    "ATTACK": PokemonColumn.STAGE_ATTACK,
+    "DEFENCE": PokemonColumn.STAGE_DEFENCE,
+    "SP_ATTACK": PokemonColumn.STAGE_SP_ATTACK,
+    "SP_DEFENCE": PokemonColumn.STAGE_SP_DEFENCE,
+    "SPEED": PokemonColumn.STAGE_SPEED,
+    "ACCURACY": PokemonColumn.STAGE_ACCURACY,
+    "EVASION": PokemonColumn.STAGE_EVASION,
+}
+_STAGES = slice(PokemonColumn.STAGE_ATTACK, PokemonColumn.STAGE_EVASION + 1)
+_STATUSES = tuple(Status)
+_TYPES = tuple(Type)
+
+
+class BattleState:
+    """
+    Struct-of-arrays state for one or more 6v6 battles.
+    Each battle is one row of a single preallocated buffer: 12 Pokemon blocks of `PokemonColumn`s followed by the
+    `FieldColumn`s. `pokemon` and `field` are views into that buffer, so a snapshot or restore is one array copy.
+    """
+
+    __slots__ = ("buffer", "pokemon", "field")
+
+    def __init__(self, num_battles: int = 1) -> None:
+        self.buffer: NDArray[np.int16] = np.zeros((num_battles, ROW_WIDTH), dtype=STATE_DTYPE)
+        self.pokemon: NDArray[np.int16] = self.buffer[:, :POKEMON_BLOCK].reshape(num_battles, TEAM_SLOTS, POKEMON_WIDTH)
+        self.field: NDArray[np.int16] = self.buffer[:, POKEMON_BLOCK:]
+
+    @classmethod
+    def from_teams(cls, team_one: Sequence[Pokemon], team_two: Sequence[Pokemon], num_battles: int = 1):
+        """Create a state where every battle starts from the same two teams."""
+        state = cls(num_battles)
+        state.load_teams(0, team_one, team_two)
+        state.buffer[1:] = state.buffer[0]
+        return state
+
+    @property
+    def num_battles(self) -> int:
+        return self.buffer.shape[0]
+
+    def load_teams(self, battle: int, team_one: Sequence[Pokemon], team_two: Sequence[Pokemon]) -> None:
+        """Reset one battle's row and fill it from Pokemon models, leading with each team's first Pokemon."""
+        if len(team_one) > TEAM_SIZE or len(team_two) > TEAM_SIZE:
+            raise ValueError(f"Teams can have at most {TEAM_SIZE} Pokemon.")
+        self.buffer[battle] = 0
+        for side, team in enumerate((team_one, team_two)):
+            for position, pokemon in enumerate(team):
+                self.view(battle, side * TEAM_SIZE + position).load(pokemon)
+
+    def store_teams(self, battle: int, team_one: Sequence[Pokemon], team_two: Sequence[Pokemon]) -> None:
+        """Write one battle's HP, stat stages and PP back into the Pokemon models it was loaded from."""
+        for side, team in enumerate((team_one, team_two)):
+            for position, pokemon in enumerate(team):
+                self.view(battle, side * TEAM_SIZE + position).store(pokemon)
+
+    def view(self, battle: int, slot: int) -> "PokemonView":
+        return PokemonView(self.pokemon[battle, slot])
+
+    def active(self, battle: int, side: int) -> "PokemonView":
+        position = int(self.field[battle, FieldColumn.ACTIVE_ONE + side])
+        return self.view(battle, side * TEAM_SIZE + position)
+
+    def snapshot(self, battle: int | None = None) -> NDArray[np.int16]:
+        """Copy the whole buffer, or just one battle's row."""
+        return self.buffer.copy() if battle is None else self.buffer[battle].copy()
+
+    def restore(self, snapshot: NDArray[np.int16], battle: int | None = None) -> None:
+        """Write back a snapshot taken with the same `battle` argument."""
+        np.copyto(self.buffer if battle is None else self.buffer[battle], snapshot)
+
+    def copy(self) -> "BattleState":
+        state = BattleState(self.num_battles)
+        np.copyto(state.buffer, self.buffer)
+        return state
+
+
+class PokemonView:
+    """A Pokemon-like accessor that reads and writes one Pokemon block of a BattleState in place."""
+
+    __slots__ = ("row",)
+
+    def __init__(self, row: NDArray[np.int16]) -> None:
+        self.row = row
+
+    def load(self, pokemon: Pokemon) -> None:
+        row = self.row
+        totals = pokemon.stat_totals
+        row[PokemonColumn.HP] = pokemon.live_stats.HP
+        row[PokemonColumn.MAX_HP] = totals.HP
+        row[PokemonColumn.LEVEL] = pokemon.level
+        for stat, column in _TOTAL_COLUMN.items():
+            row[column] = getattr(totals, stat)
+        for stat, column in _STAGE_COLUMN.items():
+            row[column] = getattr(pokemon.stat_stages, stat)
+        for slot in MoveSlot:
+            row[PokemonColumn.PP_1 + slot.index] = pokemon.moves.pp(slot)
+            row[PokemonColumn.MOVE_1 + slot.index] = pokemon.moves.move_id(slot)
+        row[PokemonColumn.STATUS] = STATUS_INDEX[Status.NONE]
+        primary, secondary = pokemon.types
+        row[PokemonColumn.PRIMARY_TYPE] = TYPE_INDEX[primary]
+        row[PokemonColumn.SECONDARY_TYPE] = NO_TYPE_INDEX if secondary is None else TYPE_INDEX[secondary]
+        row[PokemonColumn.NATURE] = NATURE_INDEX[pokemon.nature]
+
+    def store(self, pokemon: Pokemon) -> None:
+        """Copy the state that changes during a battle (HP, stat stages and PP) back into `pokemon`."""
+        row = self.row
+        pokemon.live_stats.HP = int(row[PokemonColumn.HP])
+        stages = pokemon.stat_stages
+        for stat, column in _STAGE_COLUMN.items():
+            setattr(stages, stat, int(row[column]))
+        for slot in MoveSlot:
+            pokemon.moves.set_pp(slot, int(row[PokemonColumn.PP_1 + slot.index]))
+
+    @property
+    def hp(self) -> int:
+        return int(self.row[PokemonColumn.HP])
+
+    @hp.setter
+    def hp(self, value: int) -> None:
+        self.row[PokemonColumn.HP] = value
+
+    @property
+    def max_hp(self) -> int:
+        return int(self.row[PokemonColumn.MAX_HP])
+
+    @property
+    def level(self) -> int:
+        return int(self.row[PokemonColumn.LEVEL])
+
+    @property
+    def status(self) -> Status:
+        return _STATUSES[self.row[PokemonColumn.STATUS]]
+
+    @status.setter
+    def status(self, value: Status) -> None:
+        self.row[PokemonColumn.STATUS] = STATUS_INDEX[value]
+
+    @property
+    def types(self) -> TypePair:
+        secondary = int(self.row[PokemonColumn.SECONDARY_TYPE])
+        return _TYPES[self.row[PokemonColumn.PRIMARY_TYPE]], None if secondary == NO_TYPE_INDEX else _TYPES[secondary]
+
+    def stat_total(self, stat: Stats) -> int:
+        return self.max_hp if stat is Stats.HP else int(self.row[_TOTAL_COLUMN[stat]])
+
+    def stat_stage(self, stat: Stats | str) -> int:
+        return int(self.row[_STAGE_COLUMN[stat]])
+
+    def pp(self, move_slot: MoveSlot) -> int:
+        return int(self.row[PokemonColumn.PP_1 + move_slot.index])
+
+    def set_pp(self, move_slot: MoveSlot, value: int) -> None:
+        self.row[PokemonColumn.PP_1 + move_slot.index] = value
+
+    def _adjust_hp(self, amount: int) -> int:
+        old_hp = self.hp
+        new_hp = max(0, min(self.max_hp, old_hp + amount))
+        self.row[PokemonColumn.HP] = new_hp
+        return new_hp - old_hp
+
+    def apply_damage(self, amount: int) -> int:
+        return -self._adjust_hp(-abs(amount))
+
+    def apply_healing(self, amount: int) -> int:
+        return self._adjust_hp(abs(amount))
+
+    def change_stat_stage(self, stat: Stats | str, stages: int) -> int:
+        column = _STAGE_COLUMN[stat]
+        old_stage = int(self.row[column])
+        new_stage = max(-6, min(6, old_stage + stages))
+        self.row[column] = new_stage
+        return new_stage - old_stage
+
+    def reset_stat_stages(self) -> None:
+        self.row[_STAGES] = 0
+
+    def effective_stat(self, stat: Stats) -> int:
+        assert stat in (Stats.ATTACK, Stats.DEFENCE, Stats.SP_ATTACK, Stats.SP_DEFENCE, Stats.SPEED)
+        return apply_stat_stage(int(self.row[_TOTAL_COLUMN[stat]]), int(self.row[_STAGE_COLUMN[stat]]))
+
+    def is_fainted(self) -> bool:
+        return bool(self.row[PokemonColumn.HP] <= 0)
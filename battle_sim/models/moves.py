@@ -1,6 +1,10 @@
-from dataclasses import dataclass
+from array import array
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import ClassVar, Literal, Sequence, Union
+from typing import Annotated, Any, ClassVar, Iterable, Iterator, Literal, Mapping, Sequence, Union
+
+from pydantic import GetCoreSchemaHandler, PlainSerializer
+from pydantic_core import core_schema
 
 from battle_sim.utils import Category, ExtraStatus, PriorityLevel, Stats, Status, Target, Terrain, Type, Weather
 
@@ -29,12 +33,41 @@ class InflictStatusEffect:
     only_if_contact: bool = False
 
 
+class StageChanges(Mapping[Stats, int]):
+    """An immutable, hashable stat -> stage change mapping; compares equal to the equivalent dict."""
+
+    __slots__ = ("_stages",)
+
+    def __init__(self, stages: Mapping[Stats, int] | Iterable[tuple[Stats, int]] = ()) -> None:
+        self._stages = dict(stages)
+
+    def __getitem__(self, stat: Stats) -> int:
+        return self._stages[stat]
+
+    def __iter__(self) -> Iterator[Stats]:
+        return iter(self._stages)
+
+    def __len__(self) -> int:
+        return len(self._stages)
+
+    def __hash__(self) -> int:
+        return hash(frozenset(self._stages.items()))
+
+    def __repr__(self) -> str:
+        return f"StageChanges({self._stages!r})"
+
+
 @dataclass(frozen=True)
 class StatStageChangeEffect:
     target: Literal["SELF", "TARGET"]
-    stages: dict[Stats, int]  # e.g., {"ATTACK": +2} for Swords Dance
+    # e.g., {"ATTACK": +2} for Swords Dance; stored as StageChanges, serialized as the plain dict
+    stages: Annotated[Mapping[Stats, int], PlainSerializer(dict, return_type=dict[Stats, int])]
     probability: float
 
+    def __post_init__(self) -> None:
+        if not isinstance(self.stages, StageChanges):
+            object.__setattr__(self, "stages", StageChanges(self.stages))
+
 
 @dataclass(frozen=True)
 class WeatherEffect:
@@ -59,8 +92,17 @@ MoveEffect = Union[
 ]
 
 
-@dataclass(frozen=True)
+UNREGISTERED_MOVE_ID = -1
+
+
+@dataclass(frozen=True, eq=False)
 class Move:
+    """
+    A move definition. Moves interned by the move registry (`battle_sim.database.registry`) carry a stable `id`, and
+    two registered moves are equal exactly when their ids are; other moves compare field by field. Hashing uses the
+    name, which is consistent with both.
+    """
+
     name: str
     type: Type
     category: Category
@@ -68,8 +110,45 @@ class Move:
     priority: PriorityLevel
     pp: int
     target: Target
-    effects: Sequence[MoveEffect] = ()
+    effects: Sequence[MoveEffect] = ()  # Stored as a tuple
     # TODO: flags can be added later (e.g., "protectable", "makes contact", "triggers switch", etc.)
+    id: int = field(default=UNREGISTERED_MOVE_ID, kw_only=True)
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.effects, tuple):
+            object.__setattr__(self, "effects", tuple(self.effects))
+
+    @property
+    def is_registered(self) -> bool:
+        return self.id != UNREGISTERED_MOVE_ID
+
+    def definition(self) -> tuple[Any, ...]:
+        """Every field except `id`, for comparing move definitions."""
+        return (
+            self.name,
+            self.type,
+            self.category,
+            self.accuracy_probability,
+            self.priority,
+            self.pp,
+            self.target,
+            self.effects,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, Move):
+            return NotImplemented
+        if self.is_registered and other.is_registered:
+            return self.id == other.id
+        return self.definition() == other.definition()
+
+    def __hash__(self) -> int:
+        return hash(self.name)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "Move":
+        return self  # Immutable, so copies of a team share their interned moves
 
 
 class MoveSlot(Enum):
@@ -78,46 +157,159 @@ class MoveSlot(Enum):
     THIRD = 3
     FOURTH = 4
 
-    @property
-    def index(self) -> int:
-        return self.value - 1
+    def __init__(self, value: int) -> None:
+        self.index = value - 1  # A plain attribute rather than a property, as slot lookups are on the hot path
+
+
+EMPTY_SLOT_ID = 0  # Move id stored for an empty slot; dex ids start at 1
+_SLOT_NAMES = ("move_one", "move_two", "move_three", "move_four")
 
 
-@dataclass
 class MoveSet:
-    move_one: Move
-    move_two: Move | None
-    move_three: Move | None
-    move_four: Move | None
-    slots: ClassVar[tuple[str, ...]] = ("move_one", "move_two", "move_three", "move_four")
+    """
+    A Pokemon's four move slots and their current PP.
+    Slots are a fixed-size list of moves with parallel `array`s of move ids and current PP, so slot access, PP checks
+    and membership tests are O(1) without allocating, and `copy` is three small slice copies. Moves are immutable, so
+    copies share them.
+    """
+
+    __slots__ = ("_moves", "_ids", "_pp")
+    SIZE: ClassVar[int] = len(MoveSlot)
+
+    def __init__(
+        self,
+        move_one: Move,
+        move_two: Move | None = None,
+        move_three: Move | None = None,
+        move_four: Move | None = None,
+    ) -> None:
+        self._moves: list[Move | None] = [move_one, move_two, move_three, move_four]
+        self._ids = array("i", (EMPTY_SLOT_ID if move is None else move.id for move in self._moves))
+        self._pp = array("h", (0 if move is None else move.pp for move in self._moves))
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
+        # Data is the `move_one`..`move_four` mapping MoveSet had as a dataclass (plus optional current PP), or a list
+        # of up to four moves; MoveSet instances are taken as they are. Serializing gives the mapping form back.
+        move = handler.generate_schema(Move)
+        optional_move = core_schema.nullable_schema(move)
+        fields = {"move_one": core_schema.typed_dict_field(move)}
+        for name in _SLOT_NAMES[1:]:
+            fields[name] = core_schema.typed_dict_field(optional_move, required=False)
+        fields["pp"] = core_schema.typed_dict_field(
+            core_schema.list_schema(core_schema.int_schema(), max_length=cls.SIZE), required=False
+        )
+        mapping = core_schema.typed_dict_schema(fields)
+        moves = core_schema.tuple_schema([move, optional_move], variadic_item_index=1, max_length=cls.SIZE)
+        from_data = core_schema.no_info_after_validator_function(
+            cls._from_data, core_schema.union_schema([mapping, moves])
+        )
+        return core_schema.json_or_python_schema(
+            json_schema=from_data,
+            python_schema=core_schema.union_schema([core_schema.is_instance_schema(cls), from_data]),
+            serialization=core_schema.plain_serializer_function_ser_schema(cls._to_data, return_schema=mapping),
+        )
+
+    @classmethod
+    def _from_data(cls, data: dict[str, Any] | tuple[Any, ...]) -> "MoveSet":
+        if isinstance(data, tuple):
+            return cls(*data)
+        move_set = cls(data["move_one"], *(data.get(name) for name in _SLOT_NAMES[1:]))
+        for slot, pp in zip(MoveSlot, data.get("pp", ()), strict=False):  # Slots without PP given start full
+            move_set.set_pp(slot, pp)
+        return move_set
+
+    def _to_data(self) -> dict[str, Any]:
+        data: dict[str, Any] = dict(zip(_SLOT_NAMES, self._moves, strict=True))
+        data["pp"] = self._pp.tolist()
+        return data
 
     def __getitem__(self, slot: MoveSlot) -> Move | None:
-        return [self.move_one, self.move_two, self.move_three, self.move_four][slot.index]
+        return self._moves[slot.index]
 
-    def __iter__(self):
-        yield from (self.move_one, self.move_two, self.move_three, self.move_four)
+    def __iter__(self) -> Iterator[Move | None]:
+        return iter(self._moves)
 
     def __len__(self) -> int:
-        return sum(1 for move in self if move is not None)
+        return self.SIZE - self._ids.count(EMPTY_SLOT_ID)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, MoveSet):
+            return NotImplemented
+        return self._moves == other._moves and self._pp == other._pp
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        slots = ", ".join(
+            "None" if m is None else f"{m.name} ({pp}/{m.pp})" for m, pp in zip(self._moves, self._pp, strict=True)
+        )
+        return f"MoveSet({slots})"
+
+    def copy(self) -> "MoveSet":
+        clone = MoveSet.__new__(MoveSet)
+        clone._moves = self._moves[:]
+        clone._ids = self._ids[:]
+        clone._pp = self._pp[:]
+        return clone
+
+    def __copy__(self) -> "MoveSet":
+        return self.copy()
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "MoveSet":
+        return self.copy()
 
     def to_list(self) -> list[Move]:
-        return [m for m in (self.move_one, self.move_two, self.move_three, self.move_four) if m is not None]
+        return [m for m in self._moves if m is not None]
+
+    def move_id(self, slot: MoveSlot) -> int:
+        return self._ids[slot.index]
 
     def contains(self, move: Move) -> bool:
-        return any(m == move for m in self.to_list())
+        if move.is_registered and move.id in self._ids:
+            return True
+        # Unregistered moves (here or in the query) can still be equal by definition.
+        return (UNREGISTERED_MOVE_ID in self._ids or not move.is_registered) and move in self._moves
+
+    def _set_slot(self, index: int, move: Move | None) -> None:
+        self._moves[index] = move
+        self._ids[index] = EMPTY_SLOT_ID if move is None else move.id
+        self._pp[index] = 0 if move is None else move.pp
 
     def learn_move(self, new_move: Move, move_slot: MoveSlot) -> None:
-        if len(self) < 4:
-            for slot in self.slots:
-                if getattr(self, slot) is None:
-                    setattr(self, slot, new_move)
-                    return
+        """Learn a move with full PP. If not full, fills the first empty slot; otherwise overwrites move_slot."""
+        if EMPTY_SLOT_ID in self._ids:
+            self._set_slot(self._ids.index(EMPTY_SLOT_ID), new_move)
         else:
-            setattr(self, self.slots[move_slot.index], new_move)
+            self._set_slot(move_slot.index, new_move)
 
     def forget_move(self, move_slot: MoveSlot) -> None:
-        ordered_moves = [getattr(self, slot) for slot in self.slots]
-        ordered_moves.pop(move_slot.index)
-        ordered_moves.append(None)
-        for slot, move in zip(self.slots, ordered_moves, strict=True):
-            setattr(self, slot, move)
+        """Forget a move and shift later moves (and their PP) left, leaving the last slot empty."""
+        index = move_slot.index
+        del self._moves[index], self._ids[index], self._pp[index]
+        self._moves.append(None)
+        self._ids.append(EMPTY_SLOT_ID)
+        self._pp.append(0)
+
+    def pp(self, slot: MoveSlot) -> int:
+        return self._pp[slot.index]
+
+    def max_pp(self, slot: MoveSlot) -> int:
+        move = self._moves[slot.index]
+        return 0 if move is None else move.pp
+
+    def set_pp(self, slot: MoveSlot, value: int) -> None:
+        self._pp[slot.index] = max(0, min(self.max_pp(slot), value))
+
+    def has_pp(self, slot: MoveSlot) -> bool:
+        return self._pp[slot.index] > 0
+
+    def use_pp(self, slot: MoveSlot, amount: int = 1) -> int:
+        """Deduct PP from a slot (never below 0) and return what is left."""
+        index = slot.index
+        remaining = self._pp[index] = max(0, self._pp[index] - amount)
+        return remaining
+
+    def restore_pp(self) -> None:
+        for index, move in enumerate(self._moves):
+            self._pp[index] = 0 if move is None else move.pp
@@ -1,12 +1,20 @@
+from functools import cached_property
+from typing import Any, Mapping, Self
+
 from loguru import logger
 from pydantic import BaseModel, Field, model_validator
 
-from battle_sim.maths.stats import calculate_effective_stat, calculate_total_hp, calculate_total_stat
+from battle_sim.maths.stats import apply_stat_stage, calculate_total_hp, calculate_total_stat
 from battle_sim.models.moves import Move, MoveSet, MoveSlot
 from battle_sim.models.stats import BaseStats, EVs, IVs, LiveStats, StatStages, StatTotals
 from battle_sim.models.type_matchups import TypePair
 from battle_sim.utils import Nature, Stats
 
+# Fields that stat_totals is derived from; reassigning any of them drops the cached stats.
+STAT_SOURCE_FIELDS = frozenset({"level", "nature", "effort_values", "individual_values", "base_stats"})
+STAGE_RANGE = range(-6, 7)
+_STAGED_STATS = (Stats.ATTACK, Stats.DEFENCE, Stats.SP_ATTACK, Stats.SP_DEFENCE, Stats.SPEED)
+
 
 class Pokemon(BaseModel):
     name: str
@@ -26,9 +34,9 @@ class Pokemon(BaseModel):
     live_stats: LiveStats = Field(default_factory=lambda: LiveStats())
     stat_stages: StatStages = Field(default_factory=lambda: StatStages())
 
-    @property
+    @cached_property
     def stat_totals(self) -> StatTotals:
-        """Calculate final stats from base stats, IVs, EVs, level, and nature."""
+        """Final stats from base stats, IVs, EVs, level, and nature; cached until one of those is reassigned."""
         lvl = self.level
         nat = self.nature
         ivs = self.individual_values
@@ -44,6 +52,31 @@ class Pokemon(BaseModel):
             SPEED=calculate_total_stat(bs.SPEED, ivs.SPEED, evs.SPEED, lvl, nat, Stats.SPEED),
         )
 
+    @cached_property
+    def effective_stat_table(self) -> dict[Stats, tuple[int, ...]]:
+        """For each stageable stat, its effective value at every stage from -6 to +6."""
+        totals = self.stat_totals
+        return {
+            stat: tuple(apply_stat_stage(getattr(totals, stat), stage) for stage in STAGE_RANGE)
+            for stat in _STAGED_STATS
+        }
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in STAT_SOURCE_FIELDS:
+            self._clear_stat_cache()
+
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+        # `update` writes straight into the copy's __dict__, bypassing __setattr__, so the cached stats go stale.
+        copy = super().model_copy(update=update, deep=deep)
+        if update and not STAT_SOURCE_FIELDS.isdisjoint(update):
+            copy._clear_stat_cache()
+        return copy
+
+    def _clear_stat_cache(self) -> None:
+        self.__dict__.pop("stat_totals", None)
+        self.__dict__.pop("effective_stat_table", None)
+
     @model_validator(mode="after")
     def _init_live_stats(self):
         """Populate live_stats using stat_totals when initialised."""
@@ -58,6 +91,18 @@ class Pokemon(BaseModel):
         )
         return self
 
+    def clone(self) -> "Pokemon":
+        """
+        An independent copy for another battle, without re-validating. The frozen inputs (EVs, IVs, base stats) and
+        the cached stats are shared; live stats, stat stages and moves (with their PP) are copied.
+        """
+        clone = self.model_copy()
+        state = clone.__dict__
+        state["live_stats"] = self.live_stats.model_copy()
+        state["stat_stages"] = self.stat_stages.model_copy()
+        state["moves"] = self.moves.copy()
+        return clone
+
     def reset_live_stats(self) -> None:
         totals = self.stat_totals
         self.live_stats.HP = totals.HP
@@ -91,7 +136,8 @@ class Pokemon(BaseModel):
 
     def effective_stat(self, stat: Stats) -> int:
         assert stat in (Stats.ATTACK, Stats.DEFENCE, Stats.SP_ATTACK, Stats.SP_DEFENCE, Stats.SPEED)
-        return calculate_effective_stat(self.stat_totals, self.stat_stages, stat)
+        # Stages are read on every call, so the table stays correct however stat_stages was changed.
+        return self.effective_stat_table[stat][getattr(self.stat_stages, stat) + 6]
 
     def is_fainted(self) -> bool:
         return self.live_stats.HP <= 0
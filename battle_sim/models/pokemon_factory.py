@@ -0,0 +1,248 @@
+import gc
+from contextlib import contextmanager
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import Any, Iterator, Sequence, TypeVar
+
+import numpy as np
+from numpy.typing import NDArray
+from pydantic import BaseModel
+
+from battle_sim.maths.stats import NATURE_INDEX, calculate_stat_totals_batch
+from battle_sim.models.battle_state import POKEMON_WIDTH, STATE_DTYPE, STATUS_INDEX, PokemonColumn, PokemonView
+from battle_sim.models.moves import MoveSet, MoveSlot
+from battle_sim.models.pokemon import Pokemon
+from battle_sim.models.stats import BaseStats, EVs, IVs, LiveStats, StatStages, StatTotals
+from battle_sim.models.type_matchups import NO_TYPE_INDEX, TYPE_INDEX, TypePair
+from battle_sim.utils import Nature, Stats, Status, Type
+
+# Building a Pokemon normally validates its EVs, IVs, LiveStats and StatStages one model at a time and computes its
+# stat totals in the model validator. The factory checks a whole batch of specs with NumPy instead, computes every
+# stat total in one vectorized call and assembles the already-valid models directly. Any spec the vectorized checks
+# cannot vouch for (out-of-range values, or inputs pydantic would have to coerce) is built the normal way, so bad
+# input raises exactly the error `Pokemon(...)` does, from the first bad spec in the batch.
+#
+# What is left per Pokemon is allocating its six models, so the cyclic garbage collector is paused while a batch is
+# assembled: none of those objects can be garbage yet, and otherwise its passes over the growing batch cost more than
+# the assembly itself.
+
+STAT_NAMES: tuple[str, ...] = tuple(stat.name for stat in Stats)  # EVs, IVs and totals are given in this order
+DEFAULT_EVS = (0, 0, 0, 0, 0, 0)
+DEFAULT_IVS = (31, 31, 31, 31, 31, 31)
+MIN_LEVEL, MAX_LEVEL = 1, 100
+MAX_EV, MAX_EV_TOTAL, MAX_IV = 252, 510, 31
+MIN_STAT = 4  # Lowest non-HP LiveStats value
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+_base_stat_values = attrgetter(*STAT_NAMES)
+_NO_STAGES: dict[str, Any] = dict.fromkeys(StatStages.model_fields, 0)
+_set_attribute = object.__setattr__
+
+
+def _construct(model_type: type[ModelT], values: dict[str, Any]) -> ModelT:
+    """
+    What `model_type.model_construct(**values)` does, minus its per-field default handling, which costs more than
+    validating these small models: `values` must hold every field, already valid.
+    """
+    model = model_type.__new__(model_type)
+    _set_attribute(model, "__dict__", values)
+    _set_attribute(model, "__pydantic_fields_set__", set(values))
+    _set_attribute(model, "__pydantic_extra__", None)
+    _set_attribute(model, "__pydantic_private__", None)
+    return model
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+@dataclass(frozen=True, slots=True)
+class PokemonSpec:
+    """The inputs for one Pokemon. A spec can be built many times; each Pokemon gets its own copy of `moves`."""
+
+    name: str
+    nickname: str
+    nature: Nature
+    base_stats: BaseStats
+    types: TypePair
+    moves: MoveSet
+    effort_values: Sequence[int] = DEFAULT_EVS  # In Stats order
+    individual_values: Sequence[int] = DEFAULT_IVS
+    level: int = 50
+
+    def build(self) -> Pokemon:
+        """Build the Pokemon with full validation, exactly as constructing it directly would."""
+        return Pokemon(
+            name=self.name,
+            nickname=self.nickname,
+            level=self.level,
+            nature=self.nature,
+            effort_values=EVs(**dict(zip(STAT_NAMES, self.effort_values, strict=True))),
+            individual_values=IVs(**dict(zip(STAT_NAMES, self.individual_values, strict=True))),
+            base_stats=self.base_stats,
+            types=self.types,
+            moves=self.moves.copy() if isinstance(self.moves, MoveSet) else self.moves,
+        )
+
+
+def _is_plain(spec: PokemonSpec) -> bool:
+    """Whether every non-numeric field already has the exact type validation would produce."""
+    types = spec.types
+    return (
+        type(spec.name) is str
+        and type(spec.nickname) is str
+        and type(spec.nature) is Nature
+        and type(spec.base_stats) is BaseStats
+        and type(spec.moves) is MoveSet
+        and type(types) is tuple
+        and len(types) == 2
+        and type(types[0]) is Type
+        and (types[1] is None or type(types[1]) is Type)
+    )
+
+
+def _integers(values: list[Any], shape: tuple[int, ...]) -> NDArray[np.int64] | None:
+    """`values` as an int64 array of `shape`, or None if they are not all (bool or) int."""
+    try:
+        array = np.asarray(values)
+    except (ValueError, OverflowError):  # Ragged rows, or ints too large for NumPy
+        return None
+    if array.shape != shape or array.dtype.kind not in "biu":
+        return None
+    return array.astype(np.int64, copy=False)
+
+
+@dataclass(frozen=True, slots=True)
+class _CheckedBatch:
+    valid: NDArray[np.bool_]  # Specs that can skip validation; the rest must go through `PokemonSpec.build`
+    levels: NDArray[np.int64]
+    evs: NDArray[np.int64]
+    ivs: NDArray[np.int64]
+    natures: NDArray[np.int64]
+    totals: NDArray[np.int64]
+
+
+def _check(specs: Sequence[PokemonSpec]) -> _CheckedBatch:
+    count = len(specs)
+    plain = np.fromiter(map(_is_plain, specs), dtype=np.bool_, count=count)
+    levels = _integers([spec.level for spec in specs], (count,))
+    evs = _integers([spec.effort_values for spec in specs], (count, len(Stats)))
+    ivs = _integers([spec.individual_values for spec in specs], (count, len(Stats)))
+    plain_specs = list(zip(specs, plain.tolist(), strict=True))
+    bases = _integers(
+        [_base_stat_values(spec.base_stats) if ok else DEFAULT_EVS for spec, ok in plain_specs], (count, len(Stats))
+    )
+    if levels is None or evs is None or ivs is None or bases is None:
+        empty = np.zeros((count, len(Stats)), dtype=np.int64)
+        zeros = np.zeros(count, dtype=np.int64)
+        return _CheckedBatch(np.zeros(count, dtype=np.bool_), zeros, empty, empty, zeros, empty)
+
+    natures = np.fromiter(
+        (NATURE_INDEX[spec.nature] if ok else 0 for spec, ok in plain_specs), dtype=np.int64, count=count
+    )
+    totals = calculate_stat_totals_batch(bases, ivs, evs, levels, natures)
+    valid = (
+        plain
+        & (levels >= MIN_LEVEL)
+        & (levels <= MAX_LEVEL)
+        & ((evs >= 0) & (evs <= MAX_EV)).all(axis=1)
+        & (evs.sum(axis=1) <= MAX_EV_TOTAL)
+        & ((ivs >= 0) & (ivs <= MAX_IV)).all(axis=1)
+        & (totals[:, 0] >= 0)
+        & (totals[:, 1:] >= MIN_STAT).all(axis=1)
+    )
+    return _CheckedBatch(valid, levels, evs, ivs, natures, totals)
+
+
+def build_pokemon(specs: Sequence[PokemonSpec]) -> list[Pokemon]:
+    """
+    Build ready-to-battle Pokemon (full HP, no stat stages, full PP) equal to building each spec directly; about 2x
+    faster than the direct build-and-reset loop on large batches (bench_pokemon_factory).
+    """
+    with _gc_paused():
+        return _assemble(specs)
+
+
+def _assemble(specs: Sequence[PokemonSpec]) -> list[Pokemon]:
+    batch = _check(specs)
+    evs_cache: dict[tuple[int, ...], EVs] = {}  # EVs and IVs are frozen, so equal spreads share one model
+    ivs_cache: dict[tuple[int, ...], IVs] = {}
+    built = []
+    for spec, valid, level, evs, ivs, totals in zip(
+        specs,
+        batch.valid.tolist(),
+        batch.levels.tolist(),
+        map(tuple, batch.evs.tolist()),
+        map(tuple, batch.ivs.tolist()),
+        batch.totals.tolist(),
+        strict=True,
+    ):
+        if not valid:
+            built.append(spec.build())
+            continue
+        effort_values = evs_cache.get(evs)
+        if effort_values is None:
+            effort_values = evs_cache[evs] = _construct(EVs, dict(zip(STAT_NAMES, evs, strict=True)))
+        individual_values = ivs_cache.get(ivs)
+        if individual_values is None:
+            individual_values = ivs_cache[ivs] = _construct(IVs, dict(zip(STAT_NAMES, ivs, strict=True)))
+        stats = dict(zip(STAT_NAMES, totals, strict=True))
+        pokemon = _construct(
+            Pokemon,
+            {
+                "name": spec.name,
+                "nickname": spec.nickname,
+                "level": level,
+                "nature": spec.nature,
+                "effort_values": effort_values,
+                "individual_values": individual_values,
+                "base_stats": spec.base_stats,
+                "types": spec.types,
+                "moves": spec.moves.copy(),
+                "live_stats": _construct(LiveStats, stats.copy()),
+                "stat_stages": _construct(StatStages, _NO_STAGES.copy()),
+            },
+        )
+        pokemon.__dict__["stat_totals"] = StatTotals(**stats)  # Fill the cache the model validator would have
+        built.append(pokemon)
+    return built
+
+
+def build_teams(teams: Sequence[Sequence[PokemonSpec]]) -> list[list[Pokemon]]:
+    """`build_pokemon` over many teams at once, so the whole lot is checked in one vectorized pass."""
+    built = iter(build_pokemon([spec for team in teams for spec in team]))
+    return [[next(built) for _ in team] for team in teams]
+
+
+def pokemon_rows(specs: Sequence[PokemonSpec]) -> NDArray[np.int16]:
+    """
+    The BattleState Pokemon block (`PokemonColumn`s) each spec would load as, without building any models:
+    `state.pokemon[battle, slots] = pokemon_rows(team)`. Bad specs raise the same errors as `build_pokemon`.
+    """
+    batch = _check(specs)
+    rows = np.zeros((len(specs), POKEMON_WIDTH), dtype=STATE_DTYPE)
+    rows[:, PokemonColumn.HP] = rows[:, PokemonColumn.MAX_HP] = batch.totals[:, 0]
+    rows[:, PokemonColumn.LEVEL] = batch.levels
+    rows[:, PokemonColumn.ATTACK : PokemonColumn.SPEED + 1] = batch.totals[:, 1:]
+    rows[:, PokemonColumn.STATUS] = STATUS_INDEX[Status.NONE]
+    rows[:, PokemonColumn.NATURE] = batch.natures
+    for index, (spec, valid) in enumerate(zip(specs, batch.valid.tolist(), strict=True)):
+        if not valid:
+            PokemonView(rows[index]).load(spec.build())
+            continue
+        primary, secondary = spec.types
+        rows[index, PokemonColumn.PRIMARY_TYPE] = TYPE_INDEX[primary]
+        rows[index, PokemonColumn.SECONDARY_TYPE] = NO_TYPE_INDEX if secondary is None else TYPE_INDEX[secondary]
+        moves = spec.moves
+        for slot in MoveSlot:
+            rows[index, PokemonColumn.PP_1 + slot.index] = moves.pp(slot)
+            rows[index, PokemonColumn.MOVE_1 + slot.index] = moves.move_id(slot)
+    return rows
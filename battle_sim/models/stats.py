@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 
 @dataclass(frozen=True)
@@ -44,7 +44,10 @@ class StatStages(BaseModel):
     EVASION: int = Field(default=0, ge=-6, le=6)
 
 
+# EVs and IVs are frozen so that Pokemon can cache the stats derived from them; assign a new instance to change them.
 class EVs(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     HP: int = Field(default=0, ge=0, le=252)
     ATTACK: int = Field(default=0, ge=0, le=252)
     DEFENCE: int = Field(default=0, ge=0, le=252)
@@ -68,6 +71,8 @@ class EVs(BaseModel):
 
 
 class IVs(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     HP: int = Field(default=31, ge=0, le=31)
     ATTACK: int = Field(default=31, ge=0, le=31)
     DEFENCE: int = Field(default=31, ge=0, le=31)
@@ -1,9 +1,15 @@
-from typing import TypeAlias
+from typing import Iterable, TypeAlias
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
 
 from battle_sim.utils import Type
 
 TypePair: TypeAlias = tuple[Type, Type | None]  # e.g. (Type.FIRE, Type.FLYING) or (Type.NORMAL, None)
 
+TYPE_INDEX: dict[Type, int] = {t: i for i, t in enumerate(Type)}
+NO_TYPE_INDEX = len(TYPE_INDEX)  # Index used for the missing secondary type of a monotype TypePair
+
 
 def monotype_effectiveness(attacking_type: Type, defending_type: Type) -> float:
     """Return the effectiveness multiplier of one attacking type against one defending type."""
@@ -12,14 +18,27 @@ def monotype_effectiveness(attacking_type: Type, defending_type: Type) -> float:
 
 def type_effectiveness(attacking_type: Type, defending_types: TypePair) -> float:
     """Return total type effectiveness multiplier for a move hitting a TypePair."""
-    primary_type, secondary_type = defending_types
+    return _EFFECTIVENESS_LOOKUP[attacking_type][defending_types]
+
 
-    effectiveness_multiplier = monotype_effectiveness(attacking_type, primary_type)
+def type_indices(types: Iterable[Type | None]) -> NDArray[np.intp]:
+    """Convert types into indices for `EFFECTIVENESS_MATRIX`, mapping None to `NO_TYPE_INDEX`."""
+    return np.array([NO_TYPE_INDEX if t is None else TYPE_INDEX[t] for t in types], dtype=np.intp)
 
-    if secondary_type is not None and secondary_type != primary_type:
-        effectiveness_multiplier *= monotype_effectiveness(attacking_type, secondary_type)
 
-    return effectiveness_multiplier
+def type_pair_indices(type_pairs: Iterable[TypePair]) -> NDArray[np.intp]:
+    """Convert TypePairs into an (N, 2) array of primary/secondary indices."""
+    return type_indices(t for pair in type_pairs for t in pair).reshape(-1, 2)
+
+
+def batch_type_effectiveness(attacking_types: ArrayLike, defending_pairs: ArrayLike) -> NDArray[np.float64]:
+    """
+    Vectorized `type_effectiveness` over index arrays (see `type_indices`/`type_pair_indices`).
+    `defending_pairs` has a trailing axis of size 2; the other axes broadcast against `attacking_types`.
+    """
+    attacking = np.asarray(attacking_types, dtype=np.intp)
+    pairs = np.asarray(defending_pairs, dtype=np.intp)
+    return EFFECTIVENESS_MATRIX[attacking, pairs[..., 0], pairs[..., 1]]
 
 
 # Only store entries that differ from 1.0; assume 1.0 if missing.
@@ -181,3 +200,39 @@ TYPE_CHART: dict[Type, dict[Type, float]] = {
         Type.STEEL: 0.5,
     },
 }
+
+
+def _build_effectiveness_matrix() -> NDArray[np.float64]:
+    """Dense (attacking, primary, secondary) table covering every Type against every TypePair."""
+    matrix = np.ones((NO_TYPE_INDEX, NO_TYPE_INDEX, NO_TYPE_INDEX + 1), dtype=np.float64)
+    for attacking_type, attacking_index in TYPE_INDEX.items():
+        for primary_type, primary_index in TYPE_INDEX.items():
+            primary = monotype_effectiveness(attacking_type, primary_type)
+            matrix[attacking_index, primary_index, NO_TYPE_INDEX] = primary
+            for secondary_type, secondary_index in TYPE_INDEX.items():
+                # A repeated type only counts once, e.g. (Type.FIRE, Type.FIRE) behaves like (Type.FIRE, None).
+                secondary = (
+                    1.0 if secondary_type == primary_type else monotype_effectiveness(attacking_type, secondary_type)
+                )
+                matrix[attacking_index, primary_index, secondary_index] = primary * secondary
+    matrix.setflags(write=False)
+    return matrix
+
+
+EFFECTIVENESS_MATRIX = _build_effectiveness_matrix()
+
+# Scalar view of EFFECTIVENESS_MATRIX: one dict hop per attacking type, then one keyed by the TypePair itself.
+_EFFECTIVENESS_LOOKUP: dict[Type, dict[TypePair, float]] = {
+    attacking_type: {
+        (primary_type, secondary_type): float(
+            EFFECTIVENESS_MATRIX[
+                attacking_index,
+                primary_index,
+                NO_TYPE_INDEX if secondary_type is None else TYPE_INDEX[secondary_type],
+            ]
+        )
+        for primary_type, primary_index in TYPE_INDEX.items()
+        for secondary_type in (*TYPE_INDEX, None)
+    }
+    for attacking_type, attacking_index in TYPE_INDEX.items()
+}
@@ -0,0 +1,226 @@
+from typing import TYPE_CHECKING
+
+import numpy as np
+from numpy.typing import NDArray
+
+from battle_sim.maths.stats import NATURE_INDEX
+from battle_sim.models.battle_state import (
+    SIDE_HAZARDS,
+    STATE_DTYPE,
+    STATUS_INDEX,
+    TEAM_SIZE,
+    TEAM_SLOTS,
+    TERRAIN_INDEX,
+    WEATHER_INDEX,
+    BattleState,
+    FieldColumn,
+    PokemonColumn,
+)
+from battle_sim.models.moves import MoveSlot
+from battle_sim.models.pokemon import Pokemon
+from battle_sim.models.type_matchups import TYPE_INDEX
+from battle_sim.utils import Stats, Status, Terrain, Weather
+
+if TYPE_CHECKING:
+    from battle_sim.engine import Battle
+
+# Float32 observation of a whole 6v6 battle: TEAM_SLOTS Pokemon blocks in slot order (side * TEAM_SIZE + team
+# position), then the field block. Empty team positions are all zeros. Features are named in FEATURE_NAMES; change the
+# layout only together with OBSERVATION_VERSION and a new FEATURE_LAYOUTS entry, so stored datasets stay readable.
+#
+# Pokemon block:
+#   HP, MAX_HP, stat totals  / STAT_SCALE      LEVEL / 100       stat stages / 6       PP / PP_SCALE
+#   HP fraction             move ids (raw, for embedding lookups; 0 for an empty slot)
+#   nature one-hot          status one-hot     type multi-hot (both types of a dual-type Pokemon are 1)
+# Field block:
+#   turn / TURN_SCALE       weather one-hot, weather turns / 8      terrain one-hot, terrain turns / 8
+#   active team position one-hot per side      hazard layers/turns per side (raw)
+
+OBSERVATION_VERSION = 1
+
+STAT_SCALE = 500.0
+PP_SCALE = 64.0  # Most PP a move can have
+TURN_SCALE = 500.0
+FIELD_TURNS_SCALE = 8.0
+
+_NUMERIC = slice(PokemonColumn.HP, PokemonColumn.PP_4 + 1)  # Columns copied with a per-column scale
+_MOVES = slice(PokemonColumn.MOVE_1, PokemonColumn.MOVE_4 + 1)
+_SCALES = np.array(
+    [1 / STAT_SCALE, 1 / STAT_SCALE, 1 / 100]
+    + [1 / STAT_SCALE] * 5
+    + [1 / 6] * (PokemonColumn.STAGE_EVASION - PokemonColumn.STAGE_ATTACK + 1)
+    + [1 / PP_SCALE] * len(MoveSlot),
+    dtype=np.float32,
+)
+_CODES = np.arange(max(len(NATURE_INDEX), len(TYPE_INDEX)), dtype=STATE_DTYPE)  # Compared with codes to build one-hots
+_TOTALS = (Stats.ATTACK, Stats.DEFENCE, Stats.SP_ATTACK, Stats.SP_DEFENCE, Stats.SPEED)
+
+
+def _pokemon_feature_names() -> tuple[str, ...]:
+    names = [column.name for column in PokemonColumn if column.value < _NUMERIC.stop]
+    names += ["HP_FRACTION"] + [f"MOVE_ID_{slot.value}" for slot in MoveSlot]
+    names += [f"NATURE_{nature.name}" for nature in NATURE_INDEX]
+    names += [f"STATUS_{status.name}" for status in STATUS_INDEX]
+    names += [f"TYPE_{type_.name}" for type_ in TYPE_INDEX]
+    return tuple(names)
+
+
+def _field_feature_names() -> tuple[str, ...]:
+    names = ["TURN"] + [f"WEATHER_{weather.name}" for weather in WEATHER_INDEX] + ["WEATHER_TURNS"]
+    names += [f"TERRAIN_{terrain.name}" for terrain in TERRAIN_INDEX] + ["TERRAIN_TURNS"]
+    for side in range(2):
+        names += [f"SIDE{side}_ACTIVE_{position}" for position in range(TEAM_SIZE)]
+    for side in range(2):
+        names += [f"SIDE{side}_{hazard.name}" for hazard in SIDE_HAZARDS]
+    return tuple(names)
+
+
+POKEMON_FEATURE_NAMES = _pokemon_feature_names()
+FIELD_FEATURE_NAMES = _field_feature_names()
+POKEMON_FEATURES = len(POKEMON_FEATURE_NAMES)
+FIELD_FEATURES = len(FIELD_FEATURE_NAMES)
+OBSERVATION_SIZE = TEAM_SLOTS * POKEMON_FEATURES + FIELD_FEATURES
+
+FEATURE_NAMES = (
+    tuple(f"SLOT{slot}_{name}" for slot in range(TEAM_SLOTS) for name in POKEMON_FEATURE_NAMES) + FIELD_FEATURE_NAMES
+)
+FEATURE_LAYOUTS: dict[int, tuple[str, ...]] = {1: FEATURE_NAMES}
+
+# Offsets within a Pokemon block
+HP_FRACTION = _NUMERIC.stop
+MOVE_IDS = HP_FRACTION + 1
+NATURES = MOVE_IDS + len(MoveSlot)
+STATUSES = NATURES + len(NATURE_INDEX)
+TYPES = STATUSES + len(STATUS_INDEX)
+
+# Offsets within the field block
+TURN = 0
+WEATHERS = TURN + 1
+WEATHER_TURNS = WEATHERS + len(WEATHER_INDEX)
+TERRAINS = WEATHER_TURNS + 1
+TERRAIN_TURNS = TERRAINS + len(TERRAIN_INDEX)
+ACTIVE = TERRAIN_TURNS + 1
+HAZARDS = ACTIVE + 2 * TEAM_SIZE
+
+
+def feature_names(version: int = OBSERVATION_VERSION) -> tuple[str, ...]:
+    """Names of the features of an observation written with layout `version`, in order."""
+    try:
+        return FEATURE_LAYOUTS[version]
+    except KeyError:
+        raise ValueError(f"Unknown observation layout version {version}.") from None
+
+
+class ObservationEncoder:
+    """
+    Encodes every battle of a BattleState into an (num_battles, OBSERVATION_SIZE) float32 array.
+    Intermediate one-hot masks live in buffers allocated once, here, so `encode` allocates no arrays per step.
+    """
+
+    __slots__ = ("num_battles", "_hp", "_present", "_categories", "_secondary", "_field")
+
+    def __init__(self, num_battles: int) -> None:
+        self.num_battles = num_battles
+        pokemon = (num_battles, TEAM_SLOTS)
+        self._hp = np.empty(pokemon, dtype=np.int16)
+        self._present = np.empty((*pokemon, 1), dtype=np.bool_)
+        self._categories = np.empty((*pokemon, POKEMON_FEATURES - NATURES), dtype=np.bool_)  # Nature to types
+        self._secondary = np.empty((*pokemon, len(TYPE_INDEX)), dtype=np.bool_)
+        self._field = np.empty((num_battles, max(len(WEATHER_INDEX), len(TERRAIN_INDEX), 2 * TEAM_SIZE)), np.bool_)
+
+    def empty(self) -> NDArray[np.float32]:
+        return np.zeros((self.num_battles, OBSERVATION_SIZE), dtype=np.float32)
+
+    def encode(self, state: BattleState, out: NDArray[np.float32] | None = None) -> NDArray[np.float32]:
+        """Write the observation of every battle in `state` into `out` (see `empty`)."""
+        if out is None:
+            out = self.empty()
+        rows = state.pokemon
+        blocks = out[:, : TEAM_SLOTS * POKEMON_FEATURES].reshape(self.num_battles, TEAM_SLOTS, POKEMON_FEATURES)
+
+        np.multiply(rows[..., _NUMERIC], _SCALES, out=blocks[..., :HP_FRACTION])
+        np.maximum(rows[..., PokemonColumn.MAX_HP], 1, out=self._hp)
+        np.divide(rows[..., PokemonColumn.HP], self._hp, out=blocks[..., HP_FRACTION])
+        np.copyto(blocks[..., MOVE_IDS:NATURES], rows[..., _MOVES])
+        # The one-hots are built as one boolean block and copied once; empty team positions (MAX_HP 0) are cleared,
+        # as their zero codes would otherwise read as the first nature, status and type.
+        categories = self._categories
+        types = categories[..., TYPES - NATURES :]
+        np.equal(
+            rows[..., PokemonColumn.NATURE, np.newaxis],
+            _CODES[: len(NATURE_INDEX)],
+            out=categories[..., : STATUSES - NATURES],
+        )
+        np.equal(
+            rows[..., PokemonColumn.STATUS, np.newaxis],
+            _CODES[: len(STATUS_INDEX)],
+            out=categories[..., STATUSES - NATURES : TYPES - NATURES],
+        )
+        np.equal(rows[..., PokemonColumn.PRIMARY_TYPE, np.newaxis], _CODES[: len(TYPE_INDEX)], out=types)
+        np.equal(rows[..., PokemonColumn.SECONDARY_TYPE, np.newaxis], _CODES[: len(TYPE_INDEX)], out=self._secondary)
+        np.logical_or(types, self._secondary, out=types)
+        np.greater(rows[..., PokemonColumn.MAX_HP, np.newaxis], 0, out=self._present)
+        np.logical_and(categories, self._present, out=categories)
+        np.copyto(blocks[..., NATURES:], categories)
+
+        field, columns = out[:, TEAM_SLOTS * POKEMON_FEATURES :], state.field
+        np.multiply(columns[:, FieldColumn.TURN], 1 / TURN_SCALE, out=field[:, TURN])
+        self._one_hot(columns[:, FieldColumn.WEATHER, np.newaxis], self._field, field[:, WEATHERS:WEATHER_TURNS])
+        np.multiply(columns[:, FieldColumn.WEATHER_TURNS], 1 / FIELD_TURNS_SCALE, out=field[:, WEATHER_TURNS])
+        self._one_hot(columns[:, FieldColumn.TERRAIN, np.newaxis], self._field, field[:, TERRAINS:TERRAIN_TURNS])
+        np.multiply(columns[:, FieldColumn.TERRAIN_TURNS], 1 / FIELD_TURNS_SCALE, out=field[:, TERRAIN_TURNS])
+        active = self._field[:, : 2 * TEAM_SIZE].reshape(self.num_battles, 2, TEAM_SIZE)
+        np.equal(
+            columns[:, FieldColumn.ACTIVE_ONE : FieldColumn.ACTIVE_TWO + 1, np.newaxis], _CODES[:TEAM_SIZE], out=active
+        )
+        np.copyto(field[:, ACTIVE:HAZARDS], self._field[:, : 2 * TEAM_SIZE])
+        np.copyto(field[:, HAZARDS:], columns[:, FieldColumn.HAZARDS_ONE : FieldColumn.HAZARDS_TWO + len(SIDE_HAZARDS)])
+        return out
+
+    @staticmethod
+    def _one_hot(codes: NDArray[np.int16], scratch: NDArray[np.bool_], out: NDArray[np.float32]) -> None:
+        width = out.shape[-1]
+        mask = scratch[..., :width]
+        np.equal(codes, _CODES[:width], out=mask)
+        np.copyto(out, mask)
+
+
+def _encode_pokemon(pokemon: Pokemon, out: NDArray[np.float32], offset: int) -> None:
+    totals, stages, moves = pokemon.stat_totals, pokemon.stat_stages, pokemon.moves
+    values = (
+        pokemon.live_stats.HP / STAT_SCALE,
+        totals.HP / STAT_SCALE,
+        pokemon.level / 100,
+        *(getattr(totals, stat) / STAT_SCALE for stat in _TOTALS),
+        *(stage / 6 for _, stage in stages),
+        *(moves.pp(slot) / PP_SCALE for slot in MoveSlot),
+        pokemon.live_stats.HP / max(totals.HP, 1),
+        *(moves.move_id(slot) for slot in MoveSlot),
+    )
+    out[offset : offset + len(values)] = values
+    out[offset + NATURES + NATURE_INDEX[pokemon.nature]] = 1.0
+    out[offset + STATUSES + STATUS_INDEX[Status.NONE]] = 1.0  # Pokemon models do not track a status yet
+    for type_ in pokemon.types:
+        if type_ is not None:
+            out[offset + TYPES + TYPE_INDEX[type_]] = 1.0
+
+
+def encode_battle(battle: "Battle", out: NDArray[np.float32] | None = None, offset: int = 0) -> NDArray[np.float32]:
+    """
+    Write the observation of one Battle into the 1-D float32 array `out`, starting at `offset`, in the same layout as
+    `ObservationEncoder`. Battles have no weather, terrain or hazards yet, so those features are zero.
+    """
+    if out is None:
+        out = np.zeros(offset + OBSERVATION_SIZE, dtype=np.float32)
+    out[offset : offset + OBSERVATION_SIZE] = 0.0
+    for side, team in enumerate(battle.teams):
+        for position, pokemon in enumerate(team):
+            _encode_pokemon(pokemon, out, offset + (side * TEAM_SIZE + position) * POKEMON_FEATURES)
+
+    field = offset + TEAM_SLOTS * POKEMON_FEATURES
+    out[field + TURN] = battle.turn / TURN_SCALE
+    out[field + WEATHERS + WEATHER_INDEX[Weather.NONE]] = 1.0
+    out[field + TERRAINS + TERRAIN_INDEX[Terrain.NONE]] = 1.0
+    for side, position in enumerate(battle.active):
+        out[field + ACTIVE + side * TEAM_SIZE + position] = 1.0
+    return out
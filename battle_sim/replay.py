@@ -0,0 +1,194 @@
+from dataclasses import dataclass
+from typing import Any, Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+from battle_sim.battle_log import RECORD_DTYPE, BattleRecorder, LoggedBattle
+from battle_sim.engine import MAX_TURNS, Battle, Policy
+from battle_sim.maths.rng import RNG
+from battle_sim.mechanics.events import Event
+from battle_sim.models.actions import AnyAction
+from battle_sim.models.battle_state import BattleState, FieldColumn
+from battle_sim.models.pokemon import Pokemon
+
+# Replays rebuild a battle turn by turn, either from a per-turn action list or by re-running deterministic policies
+# on the same seed. A checkpoint of the battle state (as a BattleState row) and the RNG state is kept every
+# `checkpoint_interval` turns, so seeking to any turn restores the nearest earlier checkpoint and replays fewer than
+# `checkpoint_interval` turns, however long the battle is. Event handlers are not checkpointed, so replays are only
+# deterministic for handlers without state of their own.
+
+DEFAULT_CHECKPOINT_INTERVAL = 10
+
+TurnActions = tuple[AnyAction, AnyAction]
+
+
+@dataclass(frozen=True, slots=True)
+class Checkpoint:
+    turn: int
+    state: NDArray[np.int16]  # One BattleState row, with TURN and the active positions filled in
+    rng_state: tuple[Any, ...]
+    policy_rng_state: tuple[Any, ...] | None  # None when the policies share the battle's RNG
+
+
+def _no_policy(battle: Battle, side: int) -> AnyAction:
+    raise RuntimeError("Replays from an action list never ask a policy for an action.")
+
+
+class Replay:
+    """
+    A battle that can be rewound and replayed to any turn.
+    Pass `actions` (one pair per turn) to replay a recorded action list, or `policies` to re-run them; in that case
+    the actions they choose are recorded in `actions` as the battle first reaches each turn. An action list replays
+    the original battle exactly when its choices did not draw from the battle's RNG, e.g. with a separate
+    `policy_rng`.
+    """
+
+    def __init__(
+        self,
+        team_one: Sequence[Pokemon],
+        team_two: Sequence[Pokemon],
+        rng: RNG,
+        *,
+        actions: Sequence[TurnActions] | None = None,
+        policies: tuple[Policy, Policy] | None = None,
+        policy_rng: RNG | None = None,
+        checkpoint_interval: int = DEFAULT_CHECKPOINT_INTERVAL,
+        max_turns: int = MAX_TURNS,
+    ) -> None:
+        if (actions is None) == (policies is None):
+            raise ValueError("Replay needs either an action list or policies, not both.")
+        if checkpoint_interval < 1:
+            raise ValueError("Checkpoint interval must be at least 1.")
+        self.checkpoint_interval = checkpoint_interval
+        self.actions: list[TurnActions] = list(actions or ())
+        self._replaying_actions = policies is None
+        self._chosen: list[AnyAction | None] = [None, None]
+        if policies is not None:
+            policies = (self._recording(policies[0]), self._recording(policies[1]))
+        self.battle = Battle(
+            team_one, team_two, policies or (_no_policy, _no_policy), rng, max_turns=max_turns, policy_rng=policy_rng
+        )
+        self._state = BattleState()
+        self.checkpoints: list[Checkpoint] = [self._checkpoint()]
+
+    @property
+    def turn(self) -> int:
+        return self.battle.turn
+
+    def _recording(self, policy: Policy) -> Policy:
+        def record(battle: Battle, side: int) -> AnyAction:
+            action = self._chosen[side] = policy(battle, side)
+            return action
+
+        return record
+
+    def _checkpoint(self) -> Checkpoint:
+        battle, state = self.battle, self._state
+        state.load_teams(0, *battle.teams)
+        state.field[0, FieldColumn.TURN] = battle.turn
+        state.field[0, FieldColumn.ACTIVE_ONE] = battle.active[0]
+        state.field[0, FieldColumn.ACTIVE_TWO] = battle.active[1]
+        policy_rng_state = None if battle.policy_rng is battle.rng else battle.policy_rng.get_state()
+        return Checkpoint(battle.turn, state.snapshot(0), battle.rng.get_state(), policy_rng_state)
+
+    def _restore(self, checkpoint: Checkpoint) -> None:
+        battle, state = self.battle, self._state
+        state.restore(checkpoint.state, 0)
+        state.store_teams(0, *battle.teams)
+        battle.turn = checkpoint.turn
+        battle.active = [int(state.field[0, FieldColumn.ACTIVE_ONE]), int(state.field[0, FieldColumn.ACTIVE_TWO])]
+        battle.rng.set_state(checkpoint.rng_state)
+        if checkpoint.policy_rng_state is not None:
+            battle.policy_rng.set_state(checkpoint.policy_rng_state)
+
+    def step(self) -> bool:
+        """Play the next turn; False if the battle is over or the action list has run out."""
+        battle = self.battle
+        turn = battle.turn
+        if battle.is_over():
+            return False
+        if self._replaying_actions:
+            if turn >= len(self.actions):
+                return False
+            battle.play_turn(self.actions[turn])
+        else:
+            battle.play_turn()
+            if turn == len(self.actions):
+                one, two = self._chosen
+                assert one is not None and two is not None
+                self.actions.append((one, two))
+
+        if battle.turn == len(self.checkpoints) * self.checkpoint_interval:
+            self.checkpoints.append(self._checkpoint())
+        return True
+
+    def seek(self, turn: int) -> Battle:
+        """
+        Put the battle in its state at the end of `turn` (or at its last turn, if it ends sooner) and return it.
+        Restores the nearest checkpoint unless the battle can simply play forward from where it is.
+        """
+        if turn < 0:
+            raise ValueError("Cannot seek to a negative turn.")
+        checkpoint = self.checkpoints[min(turn // self.checkpoint_interval, len(self.checkpoints) - 1)]
+        if not checkpoint.turn <= self.battle.turn <= turn:
+            self._restore(checkpoint)
+        while self.battle.turn < turn and self.step():
+            pass
+        return self.battle
+
+    def run(self) -> Battle:
+        """Play to the end of the battle (or of the action list)."""
+        while self.step():
+            pass
+        return self.battle
+
+
+@dataclass(frozen=True, slots=True)
+class Divergence:
+    record: int  # Index of the first record that differs
+    turn: int  # Turn of that record, counting from 1
+    expected: tuple[Any, ...] | None  # The logged (event, actor, values) record, or None if the replay ran longer
+    actual: tuple[Any, ...] | None  # The replayed record, or None if the replay ended first
+
+
+def _record(records: NDArray[np.void], index: int) -> tuple[Any, ...] | None:
+    if index >= len(records):
+        return None
+    event, actor, values = records[index].tolist()
+    return Event(event), actor, tuple(int(value) for value in values)
+
+
+def verify(
+    logged: LoggedBattle,
+    *,
+    actions: Sequence[TurnActions] | None = None,
+    policies: tuple[Policy, Policy] | None = None,
+    policy_rng: RNG | None = None,
+) -> Divergence | None:
+    """
+    Re-run a logged battle from its seed and teams, with the policies (or actions) that played it, and return the
+    first record where the replay's events differ from the log, or None if they match exactly.
+    """
+    team_one, team_two = logged.teams()
+    replay = Replay(team_one, team_two, logged.make_rng(), actions=actions, policies=policies, policy_rng=policy_rng)
+    recorder = BattleRecorder(replay.battle)
+    recorder.on_register(replay.battle.bus)
+    while replay.turn < logged.turns and replay.step():
+        pass
+    recorder.on_unregister(replay.battle.bus)
+
+    expected = logged.records
+    actual = np.frombuffer(recorder.records, dtype=RECORD_DTYPE)
+    shared = min(len(expected), len(actual))
+    # Records are 8 bytes, so each one compares as a single integer.
+    different = np.flatnonzero(expected[:shared].view(np.uint64) != actual[:shared].view(np.uint64))
+    if different.size:
+        index = int(different[0])
+    elif len(expected) != len(actual):
+        index = shared
+    else:
+        return None
+    longer = expected if len(expected) > index else actual
+    turn = int(np.count_nonzero(longer["event"][: index + 1] == Event.ON_TURN_START.value))
+    return Divergence(index, turn, _record(expected, index), _record(actual, index))
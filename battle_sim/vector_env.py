@@ -0,0 +1,298 @@
+from dataclasses import dataclass
+from typing import Any, Sequence
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from battle_sim.engine import MAX_TURNS, SELF_TARGETS
+from battle_sim.maths.rng import RNG, BufferedRNG
+from battle_sim.maths.stats import calculate_effective_stat_batch
+from battle_sim.mechanics.damage import MULTI_HIT_CHANCES, crit_chance, damage_effect, damage_for_rolls
+from battle_sim.mechanics.legal_actions import ACTION_SPACE, NUM_MOVE_ACTIONS, legal_action_masks
+from battle_sim.mechanics.turn_order import ACTION_ORDER, order_actions_batch
+from battle_sim.models.actions import ActionType
+from battle_sim.models.battle_state import SIDES, TEAM_SIZE, TEAM_SLOTS, BattleState, FieldColumn, PokemonColumn
+from battle_sim.models.moves import MoveSlot, StatStageChangeEffect
+from battle_sim.models.pokemon import Pokemon
+from battle_sim.models.type_matchups import TYPE_INDEX, batch_type_effectiveness
+from battle_sim.observation import ObservationEncoder
+from battle_sim.utils import Category, Stats
+
+# Lockstep battles over one BattleState. Every battle starts from the same two teams, so per-move data is a static
+# table indexed by (team slot, move slot), while everything that changes lives in the state buffer. Each step
+# resolves one turn of every battle with array operations on the battles that need them.
+
+_STAGED = (Stats.ATTACK, Stats.DEFENCE, Stats.SP_ATTACK, Stats.SP_DEFENCE, Stats.SPEED)
+_STAGE_COLUMNS = slice(PokemonColumn.STAGE_ATTACK, PokemonColumn.STAGE_SPEED + 1)
+_MULTI_HIT_THRESHOLDS = np.cumsum(list(MULTI_HIT_CHANCES.values()))[:-1]  # Draws past each add a hit, from 2
+
+
+@dataclass(frozen=True, slots=True)
+class MoveTable:
+    """Per-move arrays of shape (TEAM_SLOTS, 4), built once from the teams; empty slots have no effects."""
+
+    power: NDArray[np.int64]
+    physical: NDArray[np.bool_]
+    type: NDArray[np.intp]
+    accuracy: NDArray[np.float64]  # 1.0 for moves that never miss
+    priority: NDArray[np.int64]
+    crit_chance: NDArray[np.float64]
+    multi_hit: NDArray[np.int64]  # (TEAM_SLOTS, 4, 2) hit range; (1, 1) for single-hit moves
+    recoil: NDArray[np.float64]  # Percent of damage dealt
+    drain: NDArray[np.float64]
+    stage_chance: NDArray[np.float64]  # 0.0 for moves without a StatStageChangeEffect
+    stage_self: NDArray[np.bool_]
+    stage_changes: NDArray[np.int64]  # (TEAM_SLOTS, 4, 5) changes to the staged stats
+
+    @classmethod
+    def from_teams(cls, team_one: Sequence[Pokemon], team_two: Sequence[Pokemon]) -> "MoveTable":
+        shape = (TEAM_SLOTS, len(MoveSlot))
+        columns: dict[str, NDArray[Any]] = {
+            "power": np.zeros(shape, dtype=np.int64),
+            "physical": np.zeros(shape, dtype=np.bool_),
+            "type": np.zeros(shape, dtype=np.intp),
+            "accuracy": np.ones(shape, dtype=np.float64),
+            "priority": np.zeros(shape, dtype=np.int64),
+            "crit_chance": np.zeros(shape, dtype=np.float64),
+            "multi_hit": np.ones((*shape, 2), dtype=np.int64),
+            "recoil": np.zeros(shape, dtype=np.float64),
+            "drain": np.zeros(shape, dtype=np.float64),
+            "stage_chance": np.zeros(shape, dtype=np.float64),
+            "stage_self": np.zeros(shape, dtype=np.bool_),
+            "stage_changes": np.zeros((*shape, len(_STAGED)), dtype=np.int64),
+        }
+        for side, team in enumerate((team_one, team_two)):
+            for position, pokemon in enumerate(team):
+                for slot in MoveSlot:
+                    move = pokemon.moves[slot]
+                    if move is None:
+                        continue
+                    at = (side * TEAM_SIZE + position, slot.index)
+                    columns["type"][at] = TYPE_INDEX[move.type]
+                    columns["accuracy"][at] = 1.0 if move.accuracy_probability is None else move.accuracy_probability
+                    columns["priority"][at] = move.priority
+                    effect = damage_effect(move)
+                    if effect is not None:
+                        assert effect.power is not None
+                        columns["power"][at] = effect.power
+                        columns["physical"][at] = effect.category is Category.PHYSICAL
+                        columns["crit_chance"][at] = crit_chance(effect.crit_stage)
+                        columns["multi_hit"][at] = effect.multi_hit or (1, 1)
+                        columns["recoil"][at] = effect.recoil_percent or 0.0
+                        columns["drain"][at] = effect.drain_percent or 0.0
+                    for stage_effect in move.effects:
+                        if isinstance(stage_effect, StatStageChangeEffect):
+                            columns["stage_chance"][at] = stage_effect.probability
+                            columns["stage_self"][at] = stage_effect.target == "SELF" or move.target in SELF_TARGETS
+                            columns["stage_changes"][at] = [stage_effect.stages.get(stat, 0) for stat in _STAGED]
+                            break
+        return cls(**columns)
+
+
+@dataclass(frozen=True, slots=True)
+class StepResult:
+    observation: NDArray[np.float32]  # (num_battles, OBSERVATION_SIZE); finished battles show their reset state
+    reward: NDArray[np.float32]  # (num_battles, 2): +1 to the winning side and -1 to the loser of finished battles
+    done: NDArray[np.bool_]  # (num_battles,)
+    winner: NDArray[np.int8]  # (num_battles,): 0 or 1 for finished battles with a winner, otherwise -1
+
+
+class VectorBattleEnv:
+    """
+    Steps `num_battles` battles between the same two teams in lockstep.
+    `step` takes one action-space index (see `battle_sim.mechanics.legal_actions`) per side and battle, resolves a
+    turn in every battle, and resets finished battles to the starting teams. Illegal actions are replaced with the
+    first legal one. Moves deal damage (including multi-hit, crits, recoil and drain) and change stat stages;
+    other effects and event handlers are not applied yet, as they are per-battle Python code.
+    """
+
+    def __init__(
+        self,
+        team_one: Sequence[Pokemon],
+        team_two: Sequence[Pokemon],
+        num_battles: int,
+        *,
+        rng: RNG | None = None,
+        max_turns: int = MAX_TURNS,
+    ) -> None:
+        self.state = BattleState.from_teams(team_one, team_two, num_battles)
+        self.moves = MoveTable.from_teams(team_one, team_two)
+        self.rng = rng if rng is not None else BufferedRNG()
+        self.max_turns = max_turns
+        self._initial_row = self.state.snapshot(0)
+        self._masks = np.zeros((num_battles, SIDES, ACTION_SPACE), dtype=np.bool_)
+        self.encoder = ObservationEncoder(num_battles)
+        self._observation = self.encoder.empty()
+
+    @property
+    def num_battles(self) -> int:
+        return self.state.num_battles
+
+    def observe(self) -> NDArray[np.float32]:
+        """Observations (see `battle_sim.observation`) of every battle; the array is reused between calls."""
+        return self.encoder.encode(self.state, self._observation)
+
+    def reset(self) -> NDArray[np.float32]:
+        self.state.buffer[:] = self._initial_row
+        return self.observe()
+
+    def legal_actions(self) -> NDArray[np.bool_]:
+        """Legal-action masks of shape (num_battles, 2, ACTION_SPACE); the array is reused between calls."""
+        for side in range(SIDES):
+            legal_action_masks(self.state, side, self._masks[:, side])
+        return self._masks
+
+    def step(self, actions: ArrayLike) -> StepResult:
+        """Resolve one turn of every battle, given an (num_battles, 2) array of action-space indices."""
+        actions = np.array(actions, dtype=np.intp)
+        masks = self.legal_actions()
+        battles = np.arange(self.num_battles)
+        for side in range(SIDES):
+            illegal = ~masks[battles, side, actions[:, side]]
+            actions[illegal, side] = masks[illegal, side].argmax(axis=1)
+
+        field = self.state.field
+        field[:, FieldColumn.TURN] += 1
+        is_switch = actions >= NUM_MOVE_ACTIONS
+        slots = np.where(is_switch, 0, actions)
+        active_slots = self._active_slots(battles[:, np.newaxis], np.arange(SIDES))
+        ranks = np.where(is_switch, ACTION_ORDER[ActionType.SWITCH_OUT], ACTION_ORDER[ActionType.USE_MOVE])
+        priorities = np.where(is_switch, 0, self.moves.priority[active_slots, slots])
+        speeds = calculate_effective_stat_batch(
+            self.state.pokemon[battles[:, np.newaxis], active_slots, PokemonColumn.SPEED],
+            self.state.pokemon[battles[:, np.newaxis], active_slots, PokemonColumn.STAGE_SPEED],
+        )
+        order = order_actions_batch(ranks, priorities, speeds, rng=self.rng)
+
+        for turn_position in range(SIDES):
+            sides = order[:, turn_position]
+            acting = ~self._decided(battles) & self._standing(battles, self._active_slots(battles, sides))
+            switching = acting & is_switch[battles, sides]
+            switchers = sides[switching]
+            field[switching, FieldColumn.ACTIVE_ONE + switchers] = actions[switching, switchers] - NUM_MOVE_ACTIONS
+            moving = np.flatnonzero(acting & ~is_switch[battles, sides])
+            self._use_moves(moving, sides[moving], slots[moving, sides[moving]])
+
+        for side in range(SIDES):
+            self._replace_fainted(side)
+        return self._finish_turn()
+
+    def _active_slots(self, battles: NDArray[np.intp], sides: NDArray[np.intp]) -> NDArray[np.intp]:
+        positions = self.state.field[battles, FieldColumn.ACTIVE_ONE + sides]
+        return sides * TEAM_SIZE + positions.astype(np.intp)
+
+    def _standing(self, battles: NDArray[np.intp], slots: NDArray[np.intp]) -> NDArray[np.bool_]:
+        return self.state.pokemon[battles, slots, PokemonColumn.HP] > 0
+
+    def _defeated(self, side: int) -> NDArray[np.bool_]:
+        team_hp = self.state.pokemon[:, side * TEAM_SIZE : (side + 1) * TEAM_SIZE, PokemonColumn.HP]
+        return ~(team_hp > 0).any(axis=1)
+
+    def _decided(self, battles: NDArray[np.intp]) -> NDArray[np.bool_]:
+        return (self._defeated(0) | self._defeated(1))[battles]
+
+    def _use_moves(self, battles: NDArray[np.intp], sides: NDArray[np.intp], slots: NDArray[np.intp]) -> None:
+        pokemon, moves, rng = self.state.pokemon, self.moves, self.rng
+        attackers = self._active_slots(battles, sides)
+        pp_column = PokemonColumn.PP_1 + slots
+        has_pp = pokemon[battles, attackers, pp_column] > 0  # Not so only for the Struggle stand-in
+        battles, sides, slots, attackers, pp_column = (a[has_pp] for a in (battles, sides, slots, attackers, pp_column))
+        pokemon[battles, attackers, pp_column] -= 1
+
+        defenders = self._active_slots(battles, 1 - sides)
+        hit = rng.random_probabilities(len(battles)) < moves.accuracy[attackers, slots]
+        battles, attackers, defenders, slots = (a[hit] for a in (battles, attackers, defenders, slots))
+
+        damaging = moves.power[attackers, slots] > 0
+        self._deal_damage(battles[damaging], attackers[damaging], defenders[damaging], slots[damaging])
+
+        changes = rng.random_probabilities(len(battles)) < moves.stage_chance[attackers, slots]
+        battles, attackers, defenders, slots = (a[changes] for a in (battles, attackers, defenders, slots))
+        recipients = np.where(moves.stage_self[attackers, slots], attackers, defenders)
+        stages = pokemon[battles, recipients, _STAGE_COLUMNS] + moves.stage_changes[attackers, slots]
+        pokemon[battles, recipients, _STAGE_COLUMNS] = np.clip(stages, -6, 6)
+
+    def _deal_damage(
+        self,
+        battles: NDArray[np.intp],
+        attackers: NDArray[np.intp],
+        defenders: NDArray[np.intp],
+        slots: NDArray[np.intp],
+    ) -> None:
+        pokemon, moves, rng = self.state.pokemon, self.moves, self.rng
+        low, high = moves.multi_hit[attackers, slots, 0], moves.multi_hit[attackers, slots, 1]
+        draws = rng.random_probabilities(len(battles))
+        hits = np.where(
+            (low == 2) & (high == 5),
+            2 + (draws[:, np.newaxis] >= _MULTI_HIT_THRESHOLDS).sum(axis=1),
+            low + (draws * (high - low + 1)).astype(np.int64),
+        )
+
+        physical = moves.physical[attackers, slots]
+        attack_column = np.where(physical, PokemonColumn.ATTACK, PokemonColumn.SP_ATTACK)
+        defence_column = np.where(physical, PokemonColumn.DEFENCE, PokemonColumn.SP_DEFENCE)
+        attack_stage_column = np.where(physical, PokemonColumn.STAGE_ATTACK, PokemonColumn.STAGE_SP_ATTACK)
+        defence_stage_column = np.where(physical, PokemonColumn.STAGE_DEFENCE, PokemonColumn.STAGE_SP_DEFENCE)
+        move_types = moves.type[attackers, slots]
+        attacker_types = pokemon[battles, attackers, PokemonColumn.PRIMARY_TYPE : PokemonColumn.SECONDARY_TYPE + 1]
+        defender_types = pokemon[battles, defenders, PokemonColumn.PRIMARY_TYPE : PokemonColumn.SECONDARY_TYPE + 1]
+        stab = (attacker_types == move_types[:, np.newaxis]).any(axis=1)
+        effectiveness = batch_type_effectiveness(move_types, defender_types)
+
+        for hit in range(int(hits.max(initial=0))):
+            live = (hits > hit) & (pokemon[battles, defenders, PokemonColumn.HP] > 0)
+            b, a, d, s = battles[live], attackers[live], defenders[live], slots[live]
+            critical = rng.random_probabilities(len(b)) < moves.crit_chance[a, s]
+            attack_stage = pokemon[b, a, attack_stage_column[live]]
+            defence_stage = pokemon[b, d, defence_stage_column[live]]
+            # Critical hits ignore the attacker's drops and the defender's boosts.
+            attack = calculate_effective_stat_batch(
+                pokemon[b, a, attack_column[live]], np.where(critical, np.maximum(attack_stage, 0), attack_stage)
+            )
+            defence = calculate_effective_stat_batch(
+                pokemon[b, d, defence_column[live]], np.minimum(defence_stage, np.where(critical, 0, defence_stage))
+            )
+            damage = damage_for_rolls(
+                pokemon[b, a, PokemonColumn.LEVEL].astype(np.int64),
+                moves.power[a, s],
+                attack,
+                defence,
+                rng.damage_rolls(len(b)),
+                critical=critical,
+                stab=stab[live],
+                effectiveness=effectiveness[live],
+            )
+            defender_hp = pokemon[b, d, PokemonColumn.HP].astype(np.int64)
+            dealt = np.minimum(damage, defender_hp)
+            pokemon[b, d, PokemonColumn.HP] = defender_hp - dealt
+
+            attacker_hp = pokemon[b, a, PokemonColumn.HP].astype(np.int64)
+            recoil = (dealt * moves.recoil[a, s] / 100).astype(np.int64)
+            drain = (dealt * moves.drain[a, s] / 100).astype(np.int64)
+            attacker_hp = np.clip(attacker_hp - recoil + drain, 0, pokemon[b, a, PokemonColumn.MAX_HP])
+            pokemon[b, a, PokemonColumn.HP] = attacker_hp
+
+    def _replace_fainted(self, side: int) -> None:
+        """Send in each side's first standing team member wherever its active Pokemon has fainted."""
+        battles = np.arange(self.num_battles)
+        fainted = ~self._standing(battles, self._active_slots(battles, np.full_like(battles, side)))
+        team_hp = self.state.pokemon[:, side * TEAM_SIZE : (side + 1) * TEAM_SIZE, PokemonColumn.HP]
+        standing = team_hp > 0
+        replace = fainted & standing.any(axis=1)
+        self.state.field[replace, FieldColumn.ACTIVE_ONE + side] = standing[replace].argmax(axis=1)
+
+    def _finish_turn(self) -> StepResult:
+        one_defeated, two_defeated = self._defeated(0), self._defeated(1)
+        done = one_defeated | two_defeated | (self.state.field[:, FieldColumn.TURN] >= self.max_turns)
+        winner = np.where(two_defeated & ~one_defeated, 0, np.where(one_defeated & ~two_defeated, 1, -1))
+        winner = winner.astype(np.int8)
+        score = (winner == 0).astype(np.float32) - (winner == 1)
+        reward = np.stack([score, -score], axis=1)
+        self.state.buffer[done] = self._initial_row
+        return StepResult(self.observe(), reward, done, winner)
+
+
+def sample_legal_actions(masks: NDArray[np.bool_], rng: RNG) -> NDArray[np.intp]:
+    """A uniformly random legal action for every mask row, e.g. for `VectorBattleEnv.legal_actions()`."""
+    scores = rng.random_probabilities(masks.size).reshape(masks.shape) + 1.0
+    return (scores * masks).argmax(axis=-1)
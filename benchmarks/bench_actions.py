@@ -0,0 +1,33 @@
+"""
+Benchmark building actions: validated pydantic Actions vs ActionRecords and packed codes.
+
+Run with:
+    uv run python -m benchmarks.bench_actions
+"""
+
+import timeit
+
+from battle_sim.models.actions import Action, ActionRecord, ActionType, unpack_action
+from battle_sim.models.moves import MoveSlot
+from battle_sim.utils import Target
+
+NUMBER = 100_000
+
+
+def main() -> None:
+    use_move, slot, target = ActionType.USE_MOVE, MoveSlot.SECOND, Target.SINGLE_OPPONENT
+    record = ActionRecord(use_move, slot, target)
+    code = record.pack()
+
+    for label, statement in (
+        ("Action (validated)", lambda: Action(action=use_move, target=target, move=slot)),
+        ("ActionRecord", lambda: ActionRecord(use_move, slot, target)),
+        ("ActionRecord + validate", lambda: ActionRecord(use_move, slot, target).validate()),
+        ("unpack_action (cached)", lambda: unpack_action(code)),
+    ):
+        seconds = min(timeit.repeat(statement, number=NUMBER, repeat=5)) / NUMBER
+        print(f"{label:>24}: {seconds * 1e9:8.1f} ns")
+
+
+if __name__ == "__main__":
+    main()
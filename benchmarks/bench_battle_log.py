@@ -0,0 +1,63 @@
+"""
+Benchmark the binary battle log: bytes per battle, logging overhead per event and streaming read throughput.
+
+Run with:
+    uv run python -m benchmarks.bench_battle_log
+"""
+
+import tempfile
+import time
+from pathlib import Path
+
+from battle_sim.battle_log import BattleLogWriter, read_battle_log
+from battle_sim.engine import Battle, random_move_policy
+from battle_sim.maths.rng import CounterRNG
+from benchmarks.bench_battle_state import make_team
+
+BATTLES = 500
+
+
+def play(log: BattleLogWriter | None) -> float:
+    """Seconds to play BATTLES battles, recording each into `log` if given."""
+    team_one, team_two = make_team("A"), make_team("B")
+    elapsed = 0.0
+    for index in range(BATTLES):
+        for pokemon in team_one + team_two:
+            pokemon.reset_live_stats()
+            pokemon.reset_stat_stages()
+            pokemon.moves.restore_pp()
+        battle = Battle(team_one, team_two, (random_move_policy, random_move_policy), CounterRNG(0, battle_index=index))
+        start = time.perf_counter()
+        if log is None:
+            battle.run()
+        else:
+            with log.recording(battle):
+                battle.run()
+        elapsed += time.perf_counter() - start
+    return elapsed
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "battles.bslog"
+        plain = min(play(None) for _ in range(3))
+        logged = float("inf")
+        for _ in range(3):
+            path.unlink(missing_ok=True)
+            with BattleLogWriter(path) as log:
+                logged = min(logged, play(log))
+
+        start = time.perf_counter()
+        events = sum(len(battle.records) for battle in read_battle_log(path))
+        read = time.perf_counter() - start
+        size = path.stat().st_size
+
+    print(f"log size:          {size / BATTLES:8.0f} bytes per battle ({events / BATTLES:.0f} events)")
+    print(
+        f"logging overhead:  {(logged - plain) / events * 1e6:8.2f} µs per event ({logged / plain - 1:+.0%} run time)"
+    )
+    print(f"streaming read:    {BATTLES / read:8.0f} battles/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Benchmark BattleState snapshot/restore against deep-copying the equivalent Pokemon models.
+
+Run with:
+    uv run python -m benchmarks.bench_battle_state
+"""
+
+import timeit
+
+from battle_sim.database.sample_moves import DRACO_METEOR, EARTHQUAKE, ROCK_SLIDE, SWORDS_DANCE
+from battle_sim.models.battle_state import BattleState
+from battle_sim.models.moves import MoveSet
+from battle_sim.models.pokemon import Pokemon
+from battle_sim.models.stats import BaseStats, EVs, IVs
+from battle_sim.utils import Nature, Type
+
+
+def make_team(prefix: str) -> list[Pokemon]:
+    return [
+        Pokemon(
+            name="Garchomp",
+            nickname=f"{prefix}{i}",
+            base_stats=BaseStats(HP=108, ATTACK=130, DEFENCE=95, SP_ATTACK=80, SP_DEFENCE=85, SPEED=102),
+            effort_values=EVs(ATTACK=252, SPEED=252),
+            individual_values=IVs(),
+            types=(Type.DRAGON, Type.GROUND),
+            moves=MoveSet(EARTHQUAKE, SWORDS_DANCE, DRACO_METEOR, ROCK_SLIDE),
+            nature=Nature.JOLLY,
+        )
+        for i in range(6)
+    ]
+
+
+def best(statement, number: int) -> float:
+    return min(timeit.repeat(statement, number=number, repeat=5)) / number
+
+
+def main() -> None:
+    teams = make_team("A") + make_team("B")
+    state = BattleState.from_teams(teams[:6], teams[6:])
+    snapshot = state.snapshot()
+    deep_copy = best(lambda: [p.model_copy(deep=True) for p in teams], number=200)
+    print(f"pydantic deep copy of 12 Pokemon: {deep_copy * 1e6:9.2f} us")
+    print(f"BattleState snapshot:             {best(state.snapshot, number=20_000) * 1e6:9.2f} us")
+    print(f"BattleState restore:              {best(lambda: state.restore(snapshot), number=20_000) * 1e6:9.2f} us")
+
+    batch = BattleState.from_teams(teams[:6], teams[6:], num_battles=10_000)
+    print(f"10,000-battle snapshot:           {best(batch.snapshot, number=50) * 1e6:9.2f} us")
+
+
+if __name__ == "__main__":
+    main()
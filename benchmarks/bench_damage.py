@@ -0,0 +1,40 @@
+"""
+Benchmark full 16-roll damage distributions: per pair vs one batched pass.
+
+Run with:
+    uv run python -m benchmarks.bench_damage
+"""
+
+import timeit
+
+from battle_sim.database.sample_moves import DRACO_METEOR, EARTHQUAKE, ROCK_SLIDE
+from battle_sim.mechanics.damage import DAMAGE_ROLLS, batch_damage_distributions, damage_distribution, damage_for_rolls
+from benchmarks.bench_battle_state import make_team
+
+PAIRS = 600
+
+
+def main() -> None:
+    attackers, defenders = make_team("A"), make_team("D")
+    moves = [EARTHQUAKE, DRACO_METEOR, ROCK_SLIDE]
+    triples = [
+        (attackers[i % len(attackers)], defenders[(i // 3) % len(defenders)], moves[i % len(moves)])
+        for i in range(PAIRS)
+    ]
+    attacker_list, defender_list, move_list = (list(column) for column in zip(*triples, strict=True))
+
+    scalar = min(timeit.repeat(lambda: [damage_distribution(a, d, m) for a, d, m in triples], number=1, repeat=5))
+    batch = min(
+        timeit.repeat(lambda: batch_damage_distributions(attacker_list, defender_list, move_list), number=1, repeat=5)
+    )
+    rolls = min(
+        timeit.repeat(lambda: [damage_for_rolls(75, 65, 123, 163, int(r)) for r in DAMAGE_ROLLS], number=1000, repeat=5)
+    )
+
+    print(f"{PAIRS} distributions (per pair): {scalar / PAIRS * 1e6:8.2f} µs each")
+    print(f"{PAIRS} distributions (batched):  {batch / PAIRS * 1e6:8.2f} µs each  ({scalar / batch:.1f}x)")
+    print(f"16 scalar damage rolls:          {rolls / 1000 * 1e6:8.2f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""
+Benchmark cold loading of the compiled dex, and interned lookups.
+
+Run with:
+    uv run python -m benchmarks.bench_dex
+"""
+
+import subprocess
+import sys
+import timeit
+
+from battle_sim.database.dex import move_dex
+
+COLD_LOAD = """
+import time
+import battle_sim.models.pokemon
+start = time.perf_counter()
+from battle_sim.database.dex import move_dex, species_dex
+move_dex().by_name("Earthquake")
+species_dex().by_name("Garchomp")
+print(time.perf_counter() - start)
+"""
+
+
+def main() -> None:
+    move_dex()  # Make sure the dex is compiled before timing cold starts
+    cold = min(float(subprocess.check_output([sys.executable, "-c", COLD_LOAD])) for _ in range(5))
+    first = min(timeit.repeat("dex._records.clear(); dex[89]", globals={"dex": move_dex()}, number=1000, repeat=5))
+    cached = min(timeit.repeat("dex[89]", globals={"dex": move_dex()}, number=100_000, repeat=5))
+
+    print(f"cold dex load + first lookups: {cold * 1e3:8.2f} ms")
+    print(f"build a Move from its row:     {first / 1000 * 1e6:8.2f} µs")
+    print(f"interned lookup:               {cached / 100_000 * 1e9:8.2f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Benchmark run_matchup throughput and per-task overhead across worker counts and chunk sizes.
+
+Run with:
+    uv run python -m benchmarks.bench_engine
+"""
+
+import os
+import time
+
+from battle_sim.engine import random_move_policy, run_matchup
+from benchmarks.bench_battle_state import make_team
+
+TRIALS = 400
+
+
+def time_matchup(workers: int, chunk_size: int | None = None, trials: int = TRIALS) -> float:
+    """Wall-clock seconds to play `trials` battles, including pool start-up."""
+    team_one, team_two = make_team("A"), make_team("B")
+    start = time.perf_counter()
+    for _ in run_matchup(
+        team_one, team_two, (random_move_policy, random_move_policy), trials, workers=workers, chunk_size=chunk_size
+    ):
+        pass
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    serial = time_matchup(workers=0)
+    print(f"serial: {TRIALS / serial:8.1f} battles/s")
+
+    cpus = os.cpu_count() or 1
+    for workers in sorted({1, 2, cpus}):
+        for chunk_size in (1, 10, None):
+            elapsed = time_matchup(workers, chunk_size)
+            tasks = -(-TRIALS // chunk_size) if chunk_size else workers * 4
+            # Time beyond perfect scaling of the serial run, spread over the tasks that were submitted.
+            overhead = max(0.0, elapsed - serial / workers) * workers / tasks
+            print(
+                f"workers={workers:<3} chunk={chunk_size or 'auto':<5} {TRIALS / elapsed:8.1f} battles/s "
+                f"speed-up {serial / elapsed:5.2f}x  overhead {overhead * 1e3:7.2f} ms/task"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmark EventBus.emit while the number of unrelated subscriptions grows, and on the damage hot path.
+
+Run with:
+    uv run python -m benchmarks.bench_event_bus
+"""
+
+import timeit
+
+from battle_sim.database.sample_moves import EARTHQUAKE
+from battle_sim.maths.rng import RNG
+from battle_sim.mechanics.events import Event, EventBus, EventContext, EventPriority, HandlerResult
+from battle_sim.mechanics.payloads import DamageCalcPayload
+
+HOT_EVENT = Event.ON_DAMAGE_CALC
+HOT_HANDLERS = 8
+UNRELATED_COUNTS = (0, 100, 1_000, 10_000)
+
+
+def build_bus(unrelated: int) -> EventBus:
+    """A bus with a fixed set of hot handlers plus `unrelated` handlers spread over the other events."""
+    bus = EventBus()
+    for i in range(HOT_HANDLERS):
+        bus.on(HOT_EVENT, lambda c, p: None, priority=EventPriority.ABILITY - i)
+
+    other_events = [event for event in Event if event is not HOT_EVENT]
+    for i in range(unrelated):
+        bus.on(other_events[i % len(other_events)], lambda c, p: None, priority=i % 10_000)
+    return bus
+
+
+def build_hot_path_bus(updating: int) -> EventBus:
+    """ON_BEFORE_HIT/ON_DAMAGE_CALC handlers, `updating` of which return a payload update instead of None."""
+    bus = EventBus()
+    for event in (Event.ON_BEFORE_HIT, HOT_EVENT):
+        for i in range(HOT_HANDLERS):
+            if i < updating:
+                bus.on(event, lambda c, p: HandlerResult(updated_payload={"modifier": 1.0}), priority=i)
+            else:
+                bus.on(event, lambda c, p: None, priority=i)
+    return bus
+
+
+def _boost_power(context: EventContext, payload: DamageCalcPayload) -> None:
+    payload.base_power += 1
+
+
+def time_typed_emit(number: int = 20_000, repeat: int = 5) -> float:
+    """Best-of-`repeat` seconds per ON_DAMAGE_CALC emit with every handler mutating a typed payload."""
+    bus = EventBus()
+    for i in range(HOT_HANDLERS):
+        bus.on(HOT_EVENT, _boost_power, priority=i)
+    context = EventContext(rng=RNG(seed=0))
+    payload = DamageCalcPayload(move=EARTHQUAKE, base_power=0)
+    timings = timeit.repeat(lambda: bus.emit(HOT_EVENT, context, payload), number=number, repeat=repeat)
+    return min(timings) / number
+
+
+def time_emit(bus: EventBus, *, events: tuple[Event, ...] = (HOT_EVENT,), number: int = 20_000, repeat: int = 5):
+    """Best-of-`repeat` seconds per emit of `events`."""
+    context = EventContext(rng=RNG(seed=0))
+
+    def run() -> None:
+        for event in events:
+            bus.emit(event, context)
+
+    timings = timeit.repeat(run, number=number, repeat=repeat)
+    return min(timings) / (number * len(events))
+
+
+def main() -> None:
+    print(f"{'unrelated subs':>15} | {'emit (us)':>10}")
+    for unrelated in UNRELATED_COUNTS:
+        per_emit = time_emit(build_bus(unrelated))
+        print(f"{unrelated:>15} | {per_emit * 1e6:>10.3f}")
+
+    print()
+    print(f"{'updating handlers':>17} | {'emit (us)':>10}")
+    for updating in (0, 1, HOT_HANDLERS):
+        per_emit = time_emit(build_hot_path_bus(updating), events=(Event.ON_BEFORE_HIT, HOT_EVENT))
+        print(f"{updating:>17} | {per_emit * 1e6:>10.3f}")
+    print(f"{'typed, all mutate':>17} | {time_typed_emit() * 1e6:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Benchmark EventBus instrumentation: emit cost on a plain bus, on a bus that was instrumented and switched back off,
+and on an instrumented bus, then print the slowest handlers of a few instrumented battles.
+
+Run with:
+    uv run python -m benchmarks.bench_instrumentation
+"""
+
+from battle_sim.engine import Battle, random_move_policy
+from battle_sim.maths.rng import CounterRNG
+from battle_sim.mechanics.events import EventBus, EventPriority
+from battle_sim.mechanics.instrumentation import instrument, uninstrument
+from benchmarks.bench_battle_state import make_team
+from benchmarks.bench_event_bus import HOT_EVENT, HOT_HANDLERS, build_hot_path_bus, time_emit
+
+BATTLES = 20
+
+
+def main() -> None:
+    plain = build_hot_path_bus(1)
+    switched_off = build_hot_path_bus(1)
+    instrument(switched_off)
+    uninstrument(switched_off)
+    instrumented = build_hot_path_bus(1)
+    instrument(instrumented)
+
+    print(f"{HOT_HANDLERS} handlers per event | {'emit (us)':>10}")
+    baseline = 0.0
+    for label, bus in (("plain", plain), ("instrumentation off", switched_off), ("instrumented", instrumented)):
+        per_emit = time_emit(bus, events=(HOT_EVENT,))
+        baseline = baseline or per_emit
+        print(f"{label:>21} | {per_emit * 1e6:>10.3f} ({per_emit / baseline - 1:+.0%})")
+
+    bus = EventBus()
+    for priority in (EventPriority.ABILITY, EventPriority.ITEM, EventPriority.MOVE):
+        bus.on(HOT_EVENT, lambda c, p: None, priority=priority)
+    stats = instrument(bus)
+    for index in range(BATTLES):
+        battle = Battle(
+            make_team("A"),
+            make_team("B"),
+            (random_move_policy, random_move_policy),
+            CounterRNG(0, battle_index=index),
+            bus=bus,
+        )
+        battle.run()
+
+    print()
+    print(stats.to_frame("events").sort_values("emits", ascending=False).to_string())
+    print()
+    print(stats.to_frame("tiers").to_string())
+
+
+if __name__ == "__main__":
+    main()
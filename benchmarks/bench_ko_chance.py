@@ -0,0 +1,52 @@
+"""
+Benchmark exact KO chances against a Monte Carlo estimate of the same 2HKO probability.
+
+Run with:
+    uv run python -m benchmarks.bench_ko_chance
+"""
+
+import timeit
+
+from battle_sim.database.sample_moves import ROCK_SLIDE
+from battle_sim.maths.rng import CounterRNG
+from battle_sim.mechanics.damage import damage_distribution, roll_damage
+from battle_sim.mechanics.ko_chance import ko_chance
+from benchmarks.bench_battle_state import make_team
+
+SAMPLES = 20_000
+
+
+def sampled_ko_chance(attacker, defender, move, uses: int, rng: CounterRNG) -> float:
+    hp = defender.live_stats.HP
+    kos = 0
+    for _ in range(SAMPLES):
+        total = 0
+        for _ in range(uses):
+            if rng.roll_chance(move.accuracy_probability):
+                total += roll_damage(attacker, defender, move, rng)[0]
+        kos += total >= hp
+    return kos / SAMPLES
+
+
+def main() -> None:
+    attacker, defender = make_team("A")[0], make_team("D")[0]
+    rng = CounterRNG(seed=0)
+    # Leave the defender in 2HKO range, so the answer is neither 0 nor 1.
+    median = int(damage_distribution(attacker, defender, ROCK_SLIDE).normal[8])
+    defender.apply_damage(defender.live_stats.HP - 2 * median)
+
+    exact = ko_chance(attacker, defender, ROCK_SLIDE, 2)
+    exact_time = min(timeit.repeat(lambda: ko_chance(attacker, defender, ROCK_SLIDE, 2), number=200, repeat=5)) / 200
+    sampled = sampled_ko_chance(attacker, defender, ROCK_SLIDE, 2, rng)
+    sampled_time = min(
+        timeit.repeat(lambda: sampled_ko_chance(attacker, defender, ROCK_SLIDE, 2, rng), number=1, repeat=3)
+    )
+
+    print(f"exact 2HKO chance:   {exact:.4f} in {exact_time * 1e6:10.1f} µs")
+    print(
+        f"sampled ({SAMPLES} runs): {sampled:.4f} in {sampled_time * 1e6:10.1f} µs ({sampled_time / exact_time:.0f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
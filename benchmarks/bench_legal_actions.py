@@ -0,0 +1,50 @@
+"""
+Benchmark legal-action generation: validated Action objects vs masks, per battle and batched over a BattleState.
+
+Run with:
+    uv run python -m benchmarks.bench_legal_actions
+"""
+
+import timeit
+
+import numpy as np
+
+from battle_sim.mechanics.legal_actions import ACTION_SPACE, legal_action_mask, legal_action_masks
+from battle_sim.models.actions import Action, ActionType
+from battle_sim.models.battle_state import BattleState
+from battle_sim.models.moves import MoveSlot
+from benchmarks.bench_battle_state import make_team
+
+BATTLES = 1_000
+
+
+def legal_actions_as_objects(team, active: int) -> list[Action]:
+    pokemon = team[active]
+    actions = []
+    for slot in MoveSlot:
+        move = pokemon.moves[slot]
+        if move is not None and pokemon.moves.has_pp(slot):
+            actions.append(Action(action=ActionType.USE_MOVE, target=move.target, move=slot))
+    for position, member in enumerate(team):
+        if position != active and not member.is_fainted():
+            actions.append(Action(action=ActionType.SWITCH_OUT, switch_in=member))
+    return actions
+
+
+def main() -> None:
+    team_one, team_two = make_team("A"), make_team("B")
+    state = BattleState.from_teams(team_one, team_two, BATTLES)
+    out = np.zeros((BATTLES, ACTION_SPACE), dtype=bool)
+    row = np.zeros(ACTION_SPACE, dtype=bool)
+
+    objects = min(timeit.repeat(lambda: legal_actions_as_objects(team_one, 0), number=200, repeat=5)) / 200
+    mask = min(timeit.repeat(lambda: legal_action_mask(team_one, 0, row), number=200, repeat=5)) / 200
+    batch = min(timeit.repeat(lambda: legal_action_masks(state, 0, out), number=20, repeat=5)) / 20 / BATTLES
+
+    print(f"validated Action objects: {objects * 1e6:8.2f} µs per decision")
+    print(f"mask, one battle:         {mask * 1e6:8.2f} µs per decision")
+    print(f"mask, {BATTLES} battles:     {batch * 1e6:8.2f} µs per decision ({objects / batch:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
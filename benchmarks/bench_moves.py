@@ -0,0 +1,40 @@
+"""
+Benchmark MoveSet slot access, PP checks and copies, and move equality, hashing and membership for interned moves
+vs field-by-field comparison.
+
+Run with:
+    uv run python -m benchmarks.bench_moves
+"""
+
+import timeit
+from dataclasses import replace
+
+from battle_sim.database.sample_moves import DRACO_METEOR, EARTHQUAKE, ROCK_SLIDE, SWORDS_DANCE
+from battle_sim.models.moves import UNREGISTERED_MOVE_ID, MoveSet, MoveSlot
+
+NUMBER = 100_000
+
+
+def main() -> None:
+    interned = MoveSet(EARTHQUAKE, SWORDS_DANCE, ROCK_SLIDE, DRACO_METEOR)
+    earthquake, swords_dance, rock_slide, draco_meteor = (
+        replace(move, id=UNREGISTERED_MOVE_ID) for move in (EARTHQUAKE, SWORDS_DANCE, ROCK_SLIDE, DRACO_METEOR)
+    )
+    copies = MoveSet(earthquake, swords_dance, rock_slide, draco_meteor)
+    damage_cache = {move: move.pp for move in interned.to_list()}
+
+    for label, statement in (
+        ("slot access", lambda: interned[MoveSlot.THIRD]),
+        ("has_pp", lambda: interned.has_pp(MoveSlot.THIRD)),
+        ("len", lambda: len(interned)),
+        ("copy", interned.copy),
+        ("contains (interned)", lambda: interned.contains(DRACO_METEOR)),
+        ("contains (unregistered)", lambda: copies.contains(draco_meteor)),
+        ("cache lookup by move", lambda: damage_cache[DRACO_METEOR]),
+    ):
+        seconds = min(timeit.repeat(statement, number=NUMBER, repeat=5)) / NUMBER
+        print(f"{label:>24}: {seconds * 1e9:8.1f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Benchmark observation encoding: hand-built per-Pokemon feature lists vs encode_battle vs the batched encoder.
+
+Run with:
+    uv run python -m benchmarks.bench_observation
+"""
+
+import timeit
+
+import numpy as np
+
+from battle_sim.engine import Battle, first_move_policy
+from battle_sim.maths.rng import CounterRNG
+from battle_sim.models.battle_state import BattleState
+from battle_sim.models.moves import MoveSlot
+from battle_sim.models.pokemon import Pokemon
+from battle_sim.observation import OBSERVATION_SIZE, ObservationEncoder, encode_battle
+from battle_sim.utils import Nature, Type
+from benchmarks.bench_battle_state import make_team
+
+BATTLES = 1_000
+
+
+def hand_features(pokemon: Pokemon) -> list[float]:
+    """The per-step conversion the encoder replaces: dicts and lists built from the model for every Pokemon."""
+    features = [float(value) for value in pokemon.live_stats.model_dump().values()]
+    features += [float(value) for value in pokemon.stat_stages.model_dump().values()]
+    features += [float(t in pokemon.types) for t in Type]
+    features += [float(nature is pokemon.nature) for nature in Nature]
+    features += [float(pokemon.moves.move_id(slot)) for slot in MoveSlot]
+    return features
+
+
+def main() -> None:
+    team_one, team_two = make_team("A"), make_team("B")
+    battle = Battle(team_one, team_two, (first_move_policy, first_move_policy), CounterRNG(seed=1))
+    state = BattleState.from_teams(team_one, team_two, BATTLES)
+    encoder = ObservationEncoder(BATTLES)
+    out = encoder.empty()
+    row = np.zeros(OBSERVATION_SIZE, dtype=np.float32)
+
+    def by_hand() -> np.ndarray:
+        return np.array([value for pokemon in team_one + team_two for value in hand_features(pokemon)], np.float32)
+
+    hand = min(timeit.repeat(by_hand, number=200, repeat=5)) / 200
+    scalar = min(timeit.repeat(lambda: encode_battle(battle, row), number=200, repeat=5)) / 200
+    batch = min(timeit.repeat(lambda: encoder.encode(state, out), number=20, repeat=5)) / 20 / BATTLES
+
+    print(f"hand-built features:  {hand * 1e6:8.2f} µs per battle")
+    print(f"encode_battle:        {scalar * 1e6:8.2f} µs per battle ({hand / scalar:.1f}x)")
+    print(f"encoder, {BATTLES} battles: {batch * 1e6:8.2f} µs per battle ({hand / batch:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
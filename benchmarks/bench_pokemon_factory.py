@@ -0,0 +1,77 @@
+"""
+Benchmark bulk Pokemon construction against building each Pokemon directly, and Pokemon.clone against a deep copy.
+
+Run with:
+    uv run python -m benchmarks.bench_pokemon_factory
+"""
+
+import dataclasses
+import time
+
+import numpy as np
+
+from battle_sim.models.pokemon import Pokemon
+from battle_sim.models.pokemon_factory import PokemonSpec, build_pokemon, pokemon_rows
+from battle_sim.utils import Nature
+from benchmarks.bench_battle_state import best, make_team
+
+COUNT = 20_000
+
+
+def random_specs(count: int, seed: int = 0) -> list[PokemonSpec]:
+    """Specs in the shape a team generator produces: one species, random spreads, levels and natures."""
+    template = make_team("A")[0]
+    base = PokemonSpec(
+        name=template.name,
+        nickname="",
+        nature=template.nature,
+        base_stats=template.base_stats,
+        types=template.types,
+        moves=template.moves,
+    )
+    rng = np.random.default_rng(seed)
+    evs = rng.multinomial(510, np.full(6, 1 / 6), size=count).clip(0, 252).tolist()
+    ivs = rng.integers(0, 32, size=(count, 6)).tolist()
+    levels = rng.integers(1, 101, size=count).tolist()
+    natures = rng.choice(list(Nature), size=count).tolist()
+    return [
+        dataclasses.replace(
+            base, nickname=f"P{i}", effort_values=tuple(ev), individual_values=tuple(iv), level=lvl, nature=nature
+        )
+        for i, (ev, iv, lvl, nature) in enumerate(zip(evs, ivs, levels, natures, strict=True))
+    ]
+
+
+def build_directly(specs: list[PokemonSpec]) -> list[Pokemon]:
+    """The usual loop: construct each Pokemon, then reset its live stats before battle."""
+    built = []
+    for spec in specs:
+        pokemon = spec.build()
+        pokemon.reset_live_stats()
+        built.append(pokemon)
+    return built
+
+
+def timed(function, specs: list[PokemonSpec]) -> float:
+    start = time.perf_counter()
+    function(specs)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    specs = random_specs(COUNT)
+    direct = min(timed(build_directly, specs) for _ in range(3))
+    bulk = min(timed(build_pokemon, specs) for _ in range(3))
+    rows = min(timed(pokemon_rows, specs) for _ in range(3))
+    print(f"direct construction + reset: {COUNT / direct:10,.0f} Pokemon/s")
+    print(f"build_pokemon:               {COUNT / bulk:10,.0f} Pokemon/s ({direct / bulk:.1f}x)")
+    print(f"pokemon_rows:                {COUNT / rows:10,.0f} Pokemon/s ({direct / rows:.1f}x)")
+
+    pokemon = build_pokemon(specs[:1])[0]
+    deep_copy = best(lambda: pokemon.model_copy(deep=True), number=5_000)
+    clone = best(pokemon.clone, number=5_000)
+    print(f"deep copy: {deep_copy * 1e6:7.2f} us   clone: {clone * 1e6:7.2f} us ({deep_copy / clone:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
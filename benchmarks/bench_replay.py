@@ -0,0 +1,46 @@
+"""
+Benchmark Replay.seek on long battles: replaying from the start vs restoring the nearest checkpoint.
+
+Run with:
+    uv run python -m benchmarks.bench_replay
+"""
+
+import timeit
+
+from battle_sim.database.sample_moves import SWORDS_DANCE
+from battle_sim.engine import random_move_policy
+from battle_sim.maths.rng import CounterRNG
+from battle_sim.models.moves import MoveSet
+from battle_sim.replay import Replay
+from benchmarks.bench_battle_state import make_team
+
+POLICIES = (random_move_policy, random_move_policy)
+TURNS = (50, 200, 500)
+
+
+def make_replay(checkpoint_interval: int) -> Replay:
+    """A replay of a battle that runs to the turn limit: neither side has a damaging move."""
+    teams = make_team("A"), make_team("B")
+    for pokemon in (*teams[0], *teams[1]):
+        pokemon.moves = MoveSet(SWORDS_DANCE)
+    replay = Replay(*teams, CounterRNG(seed=1), policies=POLICIES, checkpoint_interval=checkpoint_interval)
+    replay.run()
+    return replay
+
+
+def time_seek(replay: Replay, turn: int) -> float:
+    """Seconds per seek to `turn`, seeking back to turn 0 first so every seek has to rewind."""
+    return min(timeit.repeat(lambda: (replay.seek(0), replay.seek(turn)), number=5, repeat=3)) / 5
+
+
+def main() -> None:
+    for interval in (1_000, 10):
+        replay = make_replay(interval)
+        label = "from the start" if interval > max(TURNS) else f"checkpoints every {interval}"
+        for turn in TURNS:
+            seconds = time_seek(replay, turn)
+            print(f"{label:<22} seek to turn {turn:<4} {seconds * 1e3:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
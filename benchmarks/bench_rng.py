@@ -0,0 +1,35 @@
+"""
+Benchmark single and batched rolls for the RNG backends.
+
+Run with:
+    uv run python -m benchmarks.bench_rng
+"""
+
+import timeit
+
+from battle_sim.maths.rng import RNG, BufferedRNG, CounterRNG
+
+ROLLS = 100_000
+
+
+def best(statement, number: int) -> float:
+    return min(timeit.repeat(statement, number=number, repeat=5)) / number
+
+
+def time_backend(rng: RNG) -> tuple[float, float, float]:
+    """Best-of-5 seconds per roll for roll_chance, random_integer and batched damage_rolls."""
+    chance = best(lambda: rng.roll_chance(0.3), ROLLS)
+    integer = best(lambda: rng.random_integer(85, 101), ROLLS)
+    batch = best(lambda: rng.damage_rolls(ROLLS), 5) / ROLLS
+    return chance, integer, batch
+
+
+def main() -> None:
+    print(f"{'backend':>12} | {'roll_chance':>12} | {'random_integer':>14} | {'damage_rolls':>13}")
+    for backend in (RNG, BufferedRNG, CounterRNG):
+        chance, integer, batch = time_backend(backend(seed=0))
+        print(f"{backend.__name__:>12} | {chance * 1e9:>9.1f} ns | {integer * 1e9:>11.1f} ns | {batch * 1e9:>10.1f} ns")
+
+
+if __name__ == "__main__":
+    main()
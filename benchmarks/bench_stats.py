@@ -0,0 +1,49 @@
+"""
+Benchmark scalar stat totals against the batch calculator over random EV/IV/nature/level spreads.
+
+Run with:
+    uv run python -m benchmarks.bench_stats
+"""
+
+import timeit
+
+import numpy as np
+
+from battle_sim.maths.stats import calculate_stat_totals_batch, calculate_total_hp, calculate_total_stat
+from battle_sim.utils import Nature, Stats
+
+SPREADS = 100_000
+
+
+def random_spreads(size: int, seed: int = 0):
+    generator = np.random.default_rng(seed)
+    bases = generator.integers(1, 256, (size, 6))
+    ivs = generator.integers(0, 32, (size, 6))
+    evs = generator.integers(0, 253, (size, 6))
+    levels = generator.integers(1, 101, size)
+    natures = generator.integers(0, len(Nature), size)
+    return bases, ivs, evs, levels, natures
+
+
+def scalar_totals(bases, ivs, evs, levels, natures) -> list[list[int]]:
+    stats = list(Stats)
+    nature_list = list(Nature)
+    return [
+        [calculate_total_hp(base[0], iv[0], ev[0], lvl)]
+        + [calculate_total_stat(base[i], iv[i], ev[i], lvl, nature_list[n], stats[i]) for i in range(1, 6)]
+        for base, iv, ev, lvl, n in zip(
+            bases.tolist(), ivs.tolist(), evs.tolist(), levels.tolist(), natures.tolist(), strict=True
+        )
+    ]
+
+
+def main() -> None:
+    spreads = random_spreads(SPREADS)
+    scalar = min(timeit.repeat(lambda: scalar_totals(*spreads), number=1, repeat=3)) / SPREADS
+    batch = min(timeit.repeat(lambda: calculate_stat_totals_batch(*spreads), number=1, repeat=3)) / SPREADS
+    print(f"scalar: {scalar * 1e9:8.1f} ns/spread")
+    print(f"batch:  {batch * 1e9:8.1f} ns/spread ({scalar / batch:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
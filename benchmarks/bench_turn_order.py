@@ -0,0 +1,60 @@
+"""
+Benchmark turn ordering for many lockstep battles: one lexsort vs a Python sorted() per battle.
+
+Run with:
+    uv run python -m benchmarks.bench_turn_order
+"""
+
+import timeit
+
+import numpy as np
+
+from battle_sim.mechanics.turn_order import order_actions_batch
+
+BATTLES = 10_000
+ACTIONS = 2
+
+
+def sorted_per_battle(ranks, priorities, speeds, tiebreaks) -> list[list[int]]:
+    orders = []
+    for battle in range(len(ranks)):
+        keys = list(zip(ranks[battle], -priorities[battle], -speeds[battle], tiebreaks[battle], strict=True))
+        orders.append(sorted(range(len(keys)), key=keys.__getitem__))
+    return orders
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    shape = (BATTLES, ACTIONS)
+    ranks = rng.choice([1, 3], size=shape, p=[0.1, 0.9])
+    priorities = rng.integers(-1, 3, size=shape)
+    speeds = rng.integers(50, 400, size=shape)
+    tiebreaks = rng.random(shape)
+    lists = [array.tolist() for array in (ranks, priorities, speeds, tiebreaks)]
+    lists[1] = [[-p for p in row] for row in lists[1]]
+    lists[2] = [[-s for s in row] for row in lists[2]]
+
+    def python_sorted() -> None:
+        for rank, priority, speed, tiebreak in zip(*lists, strict=True):
+            keys = list(zip(rank, priority, speed, tiebreak, strict=True))
+            sorted(range(ACTIONS), key=keys.__getitem__)
+
+    batch = (
+        min(
+            timeit.repeat(
+                lambda: order_actions_batch(ranks, priorities, speeds, tiebreaks=tiebreaks), number=5, repeat=5
+            )
+        )
+        / 5
+    )
+    scalar = min(timeit.repeat(python_sorted, number=1, repeat=5))
+    assert order_actions_batch(ranks, priorities, speeds, tiebreaks=tiebreaks).tolist() == sorted_per_battle(
+        ranks, priorities, speeds, tiebreaks
+    )
+
+    print(f"{BATTLES} battles, sorted() each: {scalar * 1e3:8.2f} ms")
+    print(f"{BATTLES} battles, one lexsort:   {batch * 1e3:8.2f} ms  ({scalar / batch:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
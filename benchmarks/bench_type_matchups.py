@@ -0,0 +1,42 @@
+"""
+Benchmark scalar and batched type effectiveness lookups.
+
+Run with:
+    uv run python -m benchmarks.bench_type_matchups
+"""
+
+import timeit
+
+import numpy as np
+
+from battle_sim.models.type_matchups import NO_TYPE_INDEX, batch_type_effectiveness, type_effectiveness
+from battle_sim.utils import Type
+
+BATCH_SIZE = 1_000_000
+
+
+def time_scalar(number: int = 200_000, repeat: int = 5) -> float:
+    """Best-of-`repeat` seconds per scalar lookup."""
+    pair = (Type.DRAGON, Type.GROUND)
+    timings = timeit.repeat(lambda: type_effectiveness(Type.ICE, pair), number=number, repeat=repeat)
+    return min(timings) / number
+
+
+def time_batch(size: int = BATCH_SIZE, repeat: int = 5) -> float:
+    """Best-of-`repeat` seconds per element of one batched lookup over `size` random matchups."""
+    generator = np.random.default_rng(0)
+    attacking = generator.integers(0, NO_TYPE_INDEX, size)
+    defending = np.stack(
+        [generator.integers(0, NO_TYPE_INDEX, size), generator.integers(0, NO_TYPE_INDEX + 1, size)], axis=-1
+    )
+    timings = timeit.repeat(lambda: batch_type_effectiveness(attacking, defending), number=1, repeat=repeat)
+    return min(timings) / size
+
+
+def main() -> None:
+    print(f"scalar: {time_scalar() * 1e9:8.1f} ns/lookup")
+    print(f"batch:  {time_batch() * 1e9:8.1f} ns/lookup ({BATCH_SIZE:,} per call)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmark VectorBattleEnv throughput against playing the same battles one at a time with Battle.run.
+
+Run with:
+    uv run python -m benchmarks.bench_vector_env
+"""
+
+import time
+
+from battle_sim.engine import Battle, random_move_policy
+from battle_sim.maths.rng import BufferedRNG
+from battle_sim.vector_env import VectorBattleEnv, sample_legal_actions
+from benchmarks.bench_battle_state import make_team
+
+SERIAL_BATTLES = 200
+STEPS = 200
+
+
+def serial_rates() -> tuple[float, float]:
+    """Battles and turns per second for Battle.run with random moves."""
+    team_one, team_two = make_team("A"), make_team("B")
+    rng = BufferedRNG(seed=1)
+    turns = 0
+    start = time.perf_counter()
+    for _ in range(SERIAL_BATTLES):
+        for pokemon in team_one + team_two:
+            pokemon.reset_live_stats()
+            pokemon.moves.restore_pp()
+        turns += Battle(team_one, team_two, (random_move_policy, random_move_policy), rng).run().turns
+    elapsed = time.perf_counter() - start
+    return SERIAL_BATTLES / elapsed, turns / elapsed
+
+
+def vector_rates(num_battles: int) -> tuple[float, float]:
+    """Finished battles and battle-turns per second for VectorBattleEnv with random legal actions."""
+    env = VectorBattleEnv(make_team("A"), make_team("B"), num_battles, rng=BufferedRNG(seed=1))
+    policy_rng = BufferedRNG(seed=2)
+    finished = 0
+    start = time.perf_counter()
+    for _ in range(STEPS):
+        finished += int(env.step(sample_legal_actions(env.legal_actions(), policy_rng)).done.sum())
+    elapsed = time.perf_counter() - start
+    return finished / elapsed, STEPS * num_battles / elapsed
+
+
+def main() -> None:
+    serial_battles, serial_turns = serial_rates()
+    print(f"Battle.run:              {serial_battles:10.1f} battles/s {serial_turns:12.0f} turns/s")
+    for num_battles in (1, 256, 1024, 4096):
+        battles, turns = vector_rates(num_battles)
+        print(
+            f"VectorBattleEnv N={num_battles:<5} {battles:10.1f} battles/s {turns:12.0f} turns/s "
+            f"({turns / serial_turns:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
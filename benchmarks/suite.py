@@ -0,0 +1,283 @@
+"""
+Benchmark suite with regression tracking: times a fixed set of micro and macro benchmarks, stores the results as
+JSON keyed by commit, and compares two stored runs.
+
+Run with:
+    uv run python -m benchmarks.suite run [-k PATTERN]
+    uv run python -m benchmarks.suite compare BASE [HEAD] [--threshold 0.1]
+
+BASE and HEAD are commits (any unambiguous prefix of a stored run) or paths to result files; HEAD defaults to the
+most recent run. `compare` exits with status 1 when any benchmark regressed by more than the threshold.
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+import timeit
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+
+from battle_sim.engine import Battle, random_move_policy
+from battle_sim.maths.rng import RNG, BufferedRNG, CounterRNG
+from battle_sim.maths.stats import calculate_effective_stat
+from battle_sim.mechanics.events import EventContext
+from battle_sim.models.moves import MoveSlot
+from battle_sim.models.pokemon import Pokemon
+from battle_sim.models.pokemon_factory import build_pokemon
+from battle_sim.models.stats import StatStages
+from battle_sim.models.type_matchups import type_effectiveness
+from battle_sim.utils import Stats, Type
+from benchmarks.bench_battle_state import make_team
+from benchmarks.bench_event_bus import HOT_EVENT, build_bus
+from benchmarks.bench_pokemon_factory import random_specs
+
+RESULTS_DIR = Path(__file__).parent / "results"
+DEFAULT_THRESHOLD = 0.10  # Relative slow-down that counts as a regression
+REPEAT = 5
+
+# Each benchmark returns its best-of-`repeat` seconds per operation. Timings are noisy, so keep every case long
+# enough (a few milliseconds per repeat) that the best repeat is stable between runs on the same machine.
+Benchmark = Callable[[int], float]
+BENCHMARKS: dict[str, Benchmark] = {}
+
+
+def benchmark(name: str) -> Callable[[Benchmark], Benchmark]:
+    def register(function: Benchmark) -> Benchmark:
+        BENCHMARKS[name] = function
+        return function
+
+    return register
+
+
+def best(statement: Callable[[], object], number: int, repeat: int) -> float:
+    return min(timeit.repeat(statement, number=number, repeat=repeat)) / number
+
+
+def _emit_benchmark(subscriptions: int) -> Benchmark:
+    def run(repeat: int) -> float:
+        bus = build_bus(subscriptions)
+        context = EventContext(rng=RNG(seed=0))
+        return best(lambda: bus.emit(HOT_EVENT, context), 20_000, repeat)
+
+    return run
+
+
+for _subscriptions in (0, 1_000, 10_000):
+    benchmark(f"event_bus.emit[unrelated={_subscriptions}]")(_emit_benchmark(_subscriptions))
+
+
+@benchmark("type_effectiveness")
+def _type_effectiveness(repeat: int) -> float:
+    defending = (Type.DRAGON, Type.GROUND)
+    return best(lambda: type_effectiveness(Type.ICE, defending), 200_000, repeat)
+
+
+@benchmark("pokemon.construct")
+def _pokemon_construct(repeat: int) -> float:
+    template = make_team("A")[0]
+    fields = {name: getattr(template, name) for name in type(template).model_fields if name != "live_stats"}
+    return best(lambda: Pokemon(**fields), 2_000, repeat)
+
+
+@benchmark("pokemon.build_pokemon")
+def _pokemon_build_pokemon(repeat: int) -> float:
+    specs = random_specs(1_000)
+    return best(lambda: build_pokemon(specs), 5, repeat) / len(specs)
+
+
+@benchmark("pokemon.clone")
+def _pokemon_clone(repeat: int) -> float:
+    pokemon = make_team("A")[0]
+    return best(pokemon.clone, 10_000, repeat)
+
+
+@benchmark("pokemon.stat_totals[cached]")
+def _stat_totals_cached(repeat: int) -> float:
+    pokemon = make_team("A")[0]
+    return best(lambda: pokemon.stat_totals, 200_000, repeat)
+
+
+@benchmark("pokemon.stat_totals[recompute]")
+def _stat_totals_recompute(repeat: int) -> float:
+    pokemon = make_team("A")[0]
+
+    def recompute() -> object:
+        pokemon.__dict__.pop("stat_totals", None)
+        return pokemon.stat_totals
+
+    return best(recompute, 20_000, repeat)
+
+
+@benchmark("calculate_effective_stat")
+def _effective_stat(repeat: int) -> float:
+    totals = make_team("A")[0].stat_totals
+    stages = StatStages(ATTACK=2)
+    return best(lambda: calculate_effective_stat(totals, stages, Stats.ATTACK), 100_000, repeat)
+
+
+@benchmark("moveset.getitem")
+def _moveset_getitem(repeat: int) -> float:
+    moves = make_team("A")[0].moves
+    return best(lambda: moves[MoveSlot.THIRD], 200_000, repeat)
+
+
+@benchmark("moveset.pp")
+def _moveset_pp(repeat: int) -> float:
+    moves = make_team("A")[0].moves
+    return best(lambda: moves.pp(MoveSlot.THIRD), 200_000, repeat)
+
+
+def _rng_benchmark(make_rng: Callable[[], RNG]) -> Benchmark:
+    def run(repeat: int) -> float:
+        rng = make_rng()
+        return best(lambda: rng.random_integer(85, 100), 100_000, repeat)
+
+    return run
+
+
+benchmark("rng.random_integer[RNG]")(_rng_benchmark(lambda: RNG(seed=0)))
+benchmark("rng.random_integer[BufferedRNG]")(_rng_benchmark(lambda: BufferedRNG(seed=0)))
+benchmark("rng.random_integer[CounterRNG]")(_rng_benchmark(lambda: CounterRNG(seed=0)))
+
+
+def _play_battles(count: int) -> tuple[float, int]:
+    """Seconds spent in `Battle.run`, and turns played, over `count` seeded battles (set-up excluded)."""
+    team_one, team_two = make_team("A"), make_team("B")
+    elapsed, turns = 0.0, 0
+    for index in range(count):
+        for pokemon in team_one + team_two:
+            pokemon.reset_live_stats()
+            pokemon.reset_stat_stages()
+            pokemon.moves.restore_pp()
+        battle = Battle(team_one, team_two, (random_move_policy, random_move_policy), CounterRNG(0, battle_index=index))
+        start = time.perf_counter()
+        result = battle.run()
+        elapsed += time.perf_counter() - start
+        turns += result.turns
+    return elapsed, turns
+
+
+@benchmark("battle.turn")
+def _battle_turn(repeat: int) -> float:
+    return min(elapsed / turns for elapsed, turns in (_play_battles(20) for _ in range(repeat)))
+
+
+@benchmark("battle.run")
+def _battle_run(repeat: int) -> float:
+    return min(_play_battles(20)[0] for _ in range(repeat)) / 20
+
+
+def _git(*args: str) -> str | None:
+    try:
+        completed = subprocess.run(["git", *args], capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return completed.stdout.strip()
+
+
+def current_commit() -> str:
+    """The checked-out commit, suffixed with `-dirty` when the working tree has uncommitted changes."""
+    commit = _git("rev-parse", "HEAD") or "unknown"
+    return f"{commit}-dirty" if _git("status", "--porcelain", "--untracked-files=no") else commit
+
+
+def run_suite(pattern: str = "", repeat: int = REPEAT) -> dict[str, float]:
+    results = {}
+    for name, function in BENCHMARKS.items():
+        if pattern in name:
+            results[name] = function(repeat)
+            print(f"{name:<40} {results[name] * 1e6:12.3f} us", flush=True)
+    return results
+
+
+def save(results: dict[str, float], commit: str, directory: Path = RESULTS_DIR) -> Path:
+    """Write a run to `<directory>/<commit>.json`, merging with an earlier run of the same commit."""
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{commit}.json"
+    previous = load(path)["results"] if path.exists() else {}
+    record = {
+        "commit": commit,
+        "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": previous | results,
+    }
+    path.write_text(json.dumps(record, indent=2, sort_keys=True) + "\n")
+    return path
+
+
+def load(path: Path) -> dict:
+    return json.loads(path.read_text())
+
+
+def resolve(reference: str | None, directory: Path = RESULTS_DIR) -> Path:
+    """A result file from a path, a commit prefix or ref (e.g. HEAD~1), or None for the most recent run."""
+    if reference is not None and Path(reference).is_file():
+        return Path(reference)
+    runs = sorted(directory.glob("*.json"), key=lambda path: path.stat().st_mtime)
+    if reference is None:
+        if not runs:
+            raise SystemExit(f"No benchmark results in {directory}; run `python -m benchmarks.suite run` first.")
+        return runs[-1]
+
+    prefixes = {reference, _git("rev-parse", "--verify", "--quiet", f"{reference}^{{commit}}") or reference}
+    matches = [path for path in runs if any(path.stem.startswith(prefix) for prefix in prefixes)]
+    if len({path.stem for path in matches}) != 1:
+        found = ", ".join(path.stem for path in matches) or "none"
+        raise SystemExit(f"{reference!r} must match exactly one stored run (found: {found}).")
+    return matches[0]
+
+
+def compare(base: dict[str, float], head: dict[str, float], threshold: float) -> list[str]:
+    """Print the change in every shared benchmark and return the names of those that regressed past `threshold`."""
+    regressions = []
+    print(f"{'benchmark':<40} {'base (us)':>12} {'head (us)':>12} {'change':>8}")
+    for name in sorted(base.keys() & head.keys()):
+        change = head[name] / base[name] - 1
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        elif change < -threshold:
+            flag = "  improved"
+        print(f"{name:<40} {base[name] * 1e6:12.3f} {head[name] * 1e6:12.3f} {change:+8.1%}{flag}")
+    for name in sorted(base.keys() ^ head.keys()):
+        print(f"{name:<40} only in {'base' if name in base else 'head'}")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.suite", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--results", type=Path, default=RESULTS_DIR, help="directory holding the JSON results")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="run the suite and store the results for the current commit")
+    run.add_argument("-k", "--pattern", default="", help="only run benchmarks whose name contains PATTERN")
+    run.add_argument("--repeat", type=int, default=REPEAT, help="take the best of this many repeats")
+
+    diff = commands.add_parser("compare", help="compare two stored runs")
+    diff.add_argument("base")
+    diff.add_argument("head", nargs="?")
+    diff.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="e.g. 0.1 flags >10%% slow-downs")
+
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        path = save(run_suite(args.pattern, args.repeat), current_commit(), args.results)
+        print(f"saved {path}")
+        return 0
+
+    base, head = load(resolve(args.base, args.results)), load(resolve(args.head, args.results))
+    print(f"base {base['commit']}\nhead {head['commit']}\n")
+    regressions = compare(base["results"], head["results"], args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,65 @@
+import itertools
+
+import pytest
+
+from battle_sim.engine import Battle, first_move_policy
+from battle_sim.maths.rng import CounterRNG
+from battle_sim.models.actions import Action, ActionRecord, ActionType, unpack_action
+from battle_sim.models.moves import MoveSlot
+from battle_sim.utils import Target
+
+
+def test_pack_round_trips_every_record():
+    codes = set()
+    for action_type, move, target, switch in itertools.product(
+        ActionType, [None, *MoveSlot], [None, *Target], [None, 0, 5]
+    ):
+        record = ActionRecord(action_type, move, target, switch)
+        code = record.pack()
+        assert unpack_action(code) == record
+        codes.add(code)
+    assert len(codes) == len(ActionType) * 5 * (len(Target) + 1) * 3
+    assert unpack_action(code) is unpack_action(code)  # Decoded records are shared
+
+
+@pytest.mark.parametrize(
+    "record",
+    [
+        ActionRecord(ActionType.USE_MOVE, MoveSlot.FIRST),
+        ActionRecord(ActionType.USE_MOVE, target=Target.SINGLE_OPPONENT),
+        ActionRecord(ActionType.SWITCH_OUT),
+        ActionRecord(ActionType.SWITCH_OUT, switch_index=6),
+        ActionRecord(ActionType.USE_MOVE, 1, Target.SINGLE_OPPONENT),  # type: ignore[arg-type]
+    ],
+)
+def test_strict_validation_rejects_bad_records(record):
+    with pytest.raises(ValueError):
+        record.validate(team_size=6)
+
+
+def test_records_convert_to_and_from_actions(garchomp_factory):
+    team = [garchomp_factory(f"Chomp{i}") for i in range(3)]
+    action = Action(action=ActionType.SWITCH_OUT, switch_in=team[2])
+    record = ActionRecord.from_action(action, team)
+
+    assert record == ActionRecord(ActionType.SWITCH_OUT, switch_index=2)
+    assert record.to_action(team).switch_in is team[2]
+    with pytest.raises(ValueError):
+        ActionRecord.from_action(action, team[:2])
+
+
+def test_battle_accepts_actions_and_records(garchomp_factory):
+    def battle() -> Battle:
+        teams = [garchomp_factory(f"L{i}") for i in range(2)], [garchomp_factory(f"R{i}") for i in range(2)]
+        return Battle(*teams, (first_move_policy, first_move_policy), CounterRNG(seed=2), strict=True)
+
+    with_action, with_record = battle(), battle()
+    with_action.play_turn(
+        (Action(action=ActionType.SWITCH_OUT, switch_in=with_action.teams[0][1]), first_move_policy(with_action, 1))
+    )
+    with_record.play_turn((ActionRecord(ActionType.SWITCH_OUT, switch_index=1), first_move_policy(with_record, 1)))
+
+    assert with_action.active == with_record.active == [1, 0]
+    assert [p.live_stats.HP for p in with_action.teams[0]] == [p.live_stats.HP for p in with_record.teams[0]]
+    with pytest.raises(ValueError):
+        with_record.play_turn((ActionRecord(ActionType.USE_MOVE, MoveSlot.FIRST), first_move_policy(with_record, 1)))
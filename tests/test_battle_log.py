@@ -0,0 +1,174 @@
+import pytest
+
+from battle_sim.battle_log import (
+    FILE_HEADER,
+    INT16_MAX,
+    RECORD,
+    BattleLogWriter,
+    pack_payload,
+    read_battle_log,
+)
+from battle_sim.database.sample_moves import EARTHQUAKE
+from battle_sim.engine import Battle, first_move_policy, random_move_policy
+from battle_sim.maths.rng import RNG, CounterRNG
+from battle_sim.mechanics.events import Event, EventContext
+from battle_sim.mechanics.payloads import DamageCalcPayload, HitPayload, SwitchPayload
+from battle_sim.models.actions import ActionRecord, ActionType
+from battle_sim.models.moves import MoveSlot
+from battle_sim.utils import Stats
+
+
+@pytest.fixture
+def make_battle(garchomp_factory):
+    def _make(battle_index: int) -> Battle:
+        team_one = [garchomp_factory(f"A{i}") for i in range(2)]
+        team_two = [garchomp_factory(f"B{i}") for i in range(3)]
+        rng = CounterRNG(seed=11, battle_index=battle_index)
+        return Battle(team_one, team_two, (random_move_policy, random_move_policy), rng)
+
+    return _make
+
+
+def record_events(battle: Battle) -> list[tuple[Event, int, tuple[int, int, int]]]:
+    """Tuples as `LoggedBattle.events` yields them, captured directly from the bus."""
+    events = []
+    slots = {id(pokemon): side * 6 + i for side, team in enumerate(battle.teams) for i, pokemon in enumerate(team)}
+
+    def capture(event):
+        def handler(context, payload):
+            actor = None if context.actor is None else slots[id(context.actor)]
+            events.append((event, actor, pack_payload(context, payload, slots)))
+
+        return handler
+
+    for event in Event:
+        battle.bus.on(event, capture(event), priority=-10)
+    return events
+
+
+def test_round_trip(tmp_path, make_battle):
+    path = tmp_path / "battles.bslog"
+    expected = []
+    with BattleLogWriter(path) as log:
+        for index in range(3):
+            battle = make_battle(index)
+            events = record_events(battle)
+            with log.recording(battle):
+                result = battle.run()
+            expected.append((result, events))
+
+    logged = list(read_battle_log(path))
+    assert len(logged) == 3
+    for battle_log, (result, events) in zip(logged, expected, strict=True):
+        assert (battle_log.winner, battle_log.turns) == (result.winner, result.turns)
+        assert list(battle_log.events()) == events
+        assert events[0] == (Event.ON_TURN_START, None, (1, 0, 0))
+        rng = battle_log.make_rng()
+        assert isinstance(rng, CounterRNG) and (rng.seed, rng.battle_index) == (11, battle_log.battle_index)
+
+    team_one, team_two = logged[1].teams()
+    assert [p.nickname for p in team_one + team_two] == ["A0", "A1", "B0", "B1", "B2"]
+    assert team_one[0].moves[MoveSlot.FIRST] is EARTHQUAKE
+    assert team_one[0].stat_totals == make_battle(0).teams[0][0].stat_totals
+
+
+def test_records_are_fixed_size(tmp_path, make_battle):
+    path = tmp_path / "battles.bslog"
+    with BattleLogWriter(path) as log:
+        battle = make_battle(0)
+        with log.recording(battle):
+            battle.run()
+    (logged,) = read_battle_log(path)
+    assert logged.records.itemsize == RECORD.size == 8
+    assert path.stat().st_size < FILE_HEADER.size + 1024 + len(logged.records) * RECORD.size
+
+
+def test_appending_and_failed_battles(tmp_path, make_battle):
+    path = tmp_path / "battles.bslog"
+    with BattleLogWriter(path) as log:
+        battle = make_battle(0)
+        with log.recording(battle):
+            battle.run()
+        with pytest.raises(RuntimeError), log.recording(make_battle(1)):
+            raise RuntimeError
+    with BattleLogWriter(path) as log:
+        battle = make_battle(2)
+        with log.recording(battle):
+            battle.run()
+        assert not battle.bus._buckets  # The recorder unsubscribed
+
+    assert [logged.battle_index for logged in read_battle_log(path)] == [0, 2]
+
+
+def test_invalid_logs(tmp_path, make_battle):
+    path = tmp_path / "battles.bslog"
+    path.write_bytes(b"nonsense")
+    with pytest.raises(ValueError):
+        BattleLogWriter(path)
+
+    path.unlink()
+    with BattleLogWriter(path) as log:
+        battle = make_battle(0)
+        with log.recording(battle):
+            battle.run()
+    path.write_bytes(path.read_bytes()[:-3])
+    with pytest.raises(ValueError, match="truncated"):
+        list(read_battle_log(path))
+
+    battle = make_battle(0)
+    battle.rng = RNG()
+    with BattleLogWriter(tmp_path / "unseeded.bslog") as log, pytest.raises(ValueError):
+        with log.recording(battle):
+            battle.play_turn()
+
+
+def test_rng_stream_round_trips(tmp_path, make_battle):
+    path = tmp_path / "battles.bslog"
+    battle = make_battle(0)
+    battle.rng = CounterRNG(seed=11, battle_index=3, turn=2, block_size=64).spawn(4)[3]
+    with BattleLogWriter(path) as log, log.recording(battle):
+        battle.run()
+    (logged,) = read_battle_log(path)
+    rng = logged.make_rng()
+    assert isinstance(rng, CounterRNG)
+    assert (rng.seed, rng.battle_index, rng.turn, rng.spawn_key, rng.block_size) == (11, 3, 2, (3,), 64)
+    fresh = battle.rng.for_battle(3, turn=2)
+    assert [rng.random_probability() for _ in range(5)] == [fresh.random_probability() for _ in range(5)]
+
+    battle = make_battle(1)
+    battle.rng = CounterRNG(seed=11, spawn_key=(1 << 64,))
+    with BattleLogWriter(path) as log, pytest.raises(ValueError, match="spawn key"), log.recording(battle):
+        battle.play_turn()
+
+
+def test_payload_packing(garchomp_factory):
+    one, two = garchomp_factory("One"), garchomp_factory("Two")
+    slots = {id(one): 0, id(two): 6}
+    context = EventContext(rng=RNG(1), action=ActionRecord(ActionType.USE_MOVE, MoveSlot.SECOND))
+
+    hit = HitPayload(move=EARTHQUAKE, damage=120, effectiveness=2.0, critical=True)
+    assert pack_payload(context, hit, slots) == (EARTHQUAKE.id, 120, 8 << 1 | 1)
+    assert pack_payload(context, SwitchPayload(outgoing=one, incoming=None), slots) == (0, -1, 0)
+    assert pack_payload(context, None, slots) == (context.action.pack(), 0, 0)
+
+
+def test_boosted_hits_saturate(tmp_path, garchomp_factory):
+    attacker, target = garchomp_factory("Boosted"), garchomp_factory("Target")
+    attacker.level, target.level = 100, 1
+    attacker.reset_live_stats()
+    target.reset_live_stats()
+    attacker.change_stat_stage(Stats.ATTACK, 6)
+    battle = Battle([attacker], [target], (first_move_policy, first_move_policy), CounterRNG(seed=0))
+    battle.bus.on(Event.ON_DAMAGE_CALC, lambda context, payload: payload.add_modifier(2.0))
+    damage = []
+    battle.bus.on(Event.ON_AFTER_HIT, lambda context, payload: damage.append(payload.damage))
+
+    with BattleLogWriter(tmp_path / "boosted.bslog") as log, log.recording(battle):
+        battle.run()
+    assert damage[0] > INT16_MAX
+    (logged,) = read_battle_log(tmp_path / "boosted.bslog")
+    assert (Event.ON_AFTER_HIT, 0, (EARTHQUAKE.id, INT16_MAX, 4 << 1)) in list(logged.events())
+
+    context = EventContext(rng=RNG(1))
+    calc = DamageCalcPayload(move=EARTHQUAKE, base_power=100_000)
+    assert pack_payload(context, calc, {}) == (EARTHQUAKE.id, INT16_MAX, False)
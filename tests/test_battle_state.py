@@ -0,0 +1,89 @@
+import pytest
+
+from battle_sim.models.battle_state import TEAM_SIZE, BattleState, FieldColumn
+from battle_sim.models.moves import MoveSlot
+from battle_sim.utils import Stats, Status, Type
+
+
+@pytest.fixture
+def state(garchomp_factory):
+    team_one = [garchomp_factory(f"Chomp{i}") for i in range(6)]
+    team_two = [garchomp_factory(f"Chimp{i}") for i in range(3)]
+    return BattleState.from_teams(team_one, team_two, num_battles=4)
+
+
+def test_views_read_loaded_pokemon(state, garchomp_factory):
+    chomp = garchomp_factory("Reference")
+    view = state.active(0, 1)
+
+    assert view.hp == view.max_hp == chomp.stat_totals.HP
+    assert view.level == 78
+    assert view.types == (Type.DRAGON, Type.GROUND)
+    assert view.status is Status.NONE
+    assert view.pp(MoveSlot.THIRD) == 5
+    assert view.stat_total(Stats.SPEED) == chomp.stat_totals.SPEED
+    assert view.effective_stat(Stats.ATTACK) == chomp.effective_stat(Stats.ATTACK)
+
+    # Empty team slots read as fainted
+    assert state.view(0, TEAM_SIZE + 3).is_fainted()
+
+
+def test_views_write_through_to_the_buffer(state, garchomp_factory):
+    view = state.view(2, 0)
+    chomp = garchomp_factory("Reference")
+
+    assert view.apply_damage(100) == 100
+    assert view.apply_healing(1000) == 100
+    assert view.change_stat_stage(Stats.ATTACK, 8) == 6
+    chomp.change_stat_stage(Stats.ATTACK, 6)
+    assert view.effective_stat(Stats.ATTACK) == chomp.effective_stat(Stats.ATTACK)
+    view.status = Status.BURN
+    view.set_pp(MoveSlot.FIRST, 9)
+
+    assert state.view(2, 0).status is Status.BURN
+    assert state.view(2, 0).pp(MoveSlot.FIRST) == 9
+    # Other battles are untouched
+    assert state.view(1, 0).stat_stage(Stats.ATTACK) == 0
+    assert state.view(1, 0).status is Status.NONE
+
+    view.reset_stat_stages()
+    assert view.stat_stage(Stats.ATTACK) == 0
+
+
+def test_snapshot_and_restore(state):
+    snapshot = state.snapshot()
+    battle_one = state.snapshot(battle=1)
+
+    state.view(1, 0).apply_damage(50)
+    state.view(3, 7).status = Status.SLEEP
+    state.field[:, FieldColumn.TURN] += 1
+
+    state.restore(battle_one, battle=1)
+    assert state.view(1, 0).hp == state.view(1, 0).max_hp
+    assert state.view(3, 7).status is Status.SLEEP
+
+    state.restore(snapshot)
+    assert (state.buffer == snapshot).all()
+    assert state.view(3, 7).status is Status.NONE
+
+
+def test_rejects_oversized_teams(garchomp_factory):
+    with pytest.raises(ValueError):
+        BattleState.from_teams([garchomp_factory("x")] * 7, [])
+
+
+def test_store_teams_writes_live_state_back(state, garchomp_factory):
+    team_one = [garchomp_factory(f"Chomp{i}") for i in range(6)]
+    team_two = [garchomp_factory(f"Chimp{i}") for i in range(3)]
+    view = state.view(1, TEAM_SIZE + 2)
+    view.apply_damage(40)
+    view.change_stat_stage(Stats.SPEED, -3)
+    view.set_pp(MoveSlot.SECOND, 7)
+
+    state.store_teams(1, team_one, team_two)
+
+    chimp = team_two[2]
+    assert chimp.live_stats.HP == chimp.stat_totals.HP - 40
+    assert chimp.stat_stages.SPEED == -3
+    assert chimp.moves.pp(MoveSlot.SECOND) == 7
+    assert team_one[0].live_stats.HP == team_one[0].stat_totals.HP
@@ -0,0 +1,70 @@
+import json
+import os
+
+import pytest
+
+from benchmarks import suite
+
+
+def write_run(directory, commit, results, mtime):
+    path = directory / f"{commit}.json"
+    path.write_text(json.dumps({"commit": commit, "results": results}))
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+def test_compare_flags_changes_beyond_the_threshold(capsys):
+    base = {"slower": 1.0, "faster": 1.0, "noise": 1.0, "removed": 1.0}
+    head = {"slower": 1.2, "faster": 0.8, "noise": 1.05, "added": 1.0}
+    assert suite.compare(base, head, 0.1) == ["slower"]
+    lines = {line.split()[0]: line for line in capsys.readouterr().out.splitlines()[1:]}
+    assert lines["slower"].endswith("REGRESSION")
+    assert lines["faster"].endswith("improved")
+    assert lines["noise"].endswith("+5.0%")
+    assert lines["removed"].endswith("only in base") and lines["added"].endswith("only in head")
+
+    assert suite.compare(base, head, 0.25) == []
+
+
+def test_resolve_finds_runs_by_path_prefix_and_ref(tmp_path, monkeypatch):
+    older = write_run(tmp_path, "abc123", {}, mtime=1_000)
+    newer = write_run(tmp_path, "def456", {}, mtime=2_000)
+    monkeypatch.setattr(suite, "_git", lambda *args: "abc123" if "HEAD~1^{commit}" in args else None)
+
+    assert suite.resolve(None, tmp_path) == newer
+    assert suite.resolve(str(older), tmp_path) == older
+    assert suite.resolve("de", tmp_path) == newer
+    assert suite.resolve("HEAD~1", tmp_path) == older
+    with pytest.raises(SystemExit, match="found: none"):
+        suite.resolve("999", tmp_path)
+    with pytest.raises(SystemExit, match="No benchmark results"):
+        suite.resolve(None, tmp_path / "empty")
+
+
+def test_resolve_rejects_ambiguous_prefixes(tmp_path, monkeypatch):
+    write_run(tmp_path, "abc123", {}, mtime=1_000)
+    write_run(tmp_path, "abd456", {}, mtime=2_000)
+    monkeypatch.setattr(suite, "_git", lambda *args: None)
+
+    with pytest.raises(SystemExit, match="abc123, abd456"):
+        suite.resolve("ab", tmp_path)
+    assert suite.resolve("abd", tmp_path).stem == "abd456"
+
+
+def test_save_merges_reruns_of_the_same_commit(tmp_path):
+    path = suite.save({"a": 1.0, "b": 2.0}, "abc123", tmp_path / "results")
+    assert suite.save({"b": 3.0, "c": 4.0}, "abc123", tmp_path / "results") == path
+    suite.save({"a": 9.0}, "def456", tmp_path / "results")
+
+    record = suite.load(path)
+    assert record["commit"] == "abc123"
+    assert record["results"] == {"a": 1.0, "b": 3.0, "c": 4.0}
+
+
+def test_compare_command_exits_non_zero_on_regression(tmp_path, monkeypatch):
+    write_run(tmp_path, "base", {"x": 1.0}, mtime=1_000)
+    write_run(tmp_path, "head", {"x": 1.5}, mtime=2_000)
+    monkeypatch.setattr(suite, "_git", lambda *args: None)
+
+    assert suite.main(["--results", str(tmp_path), "compare", "base"]) == 1
+    assert suite.main(["--results", str(tmp_path), "compare", "base", "--threshold", "0.6"]) == 0
@@ -0,0 +1,144 @@
+import numpy as np
+import pytest
+
+from battle_sim.database.sample_moves import DRACO_METEOR, EARTHQUAKE, ROCK_SLIDE, SWORDS_DANCE
+from battle_sim.maths.rng import CounterRNG
+from battle_sim.mechanics.damage import (
+    DAMAGE_ROLLS,
+    MULTI_HIT_CHANCES,
+    batch_damage_distributions,
+    damage_distribution,
+    damage_for_rolls,
+    hit_count_chances,
+    roll_damage,
+    roll_hit_count,
+)
+from battle_sim.mechanics.events import Event, EventBus
+from battle_sim.utils import Stats
+
+
+def test_damage_for_rolls_matches_reference_example():
+    # Bulbapedia's worked example: L75 Glaceon's Ice Fang (65 BP, STAB, 4x) vs Garchomp, 123 Atk vs 163 Def.
+    damage = damage_for_rolls(75, 65, 123, 163, DAMAGE_ROLLS, stab=True, effectiveness=4.0)
+    assert (damage.min(), damage.max()) == (168, 196)
+    assert np.all(np.diff(damage) >= 0)
+
+
+def test_damage_for_rolls_scalar_matches_array():
+    rolls = damage_for_rolls(50, 80, 120, 100, DAMAGE_ROLLS, critical=True, effectiveness=0.5, modifier=5325)
+    scalars = [
+        damage_for_rolls(50, 80, 120, 100, int(r), critical=True, effectiveness=0.5, modifier=5325)
+        for r in DAMAGE_ROLLS
+    ]
+    assert rolls.tolist() == scalars
+
+
+def test_immune_target_takes_no_damage_and_others_take_at_least_one():
+    assert damage_for_rolls(1, 10, 5, 500, 85, effectiveness=0.0) == 0
+    assert damage_for_rolls(1, 10, 5, 500, 85, effectiveness=0.25) == 1
+
+
+def test_distribution_shape_and_crit(garchomp_factory):
+    attacker, defender = garchomp_factory("A"), garchomp_factory("D")
+    distribution = damage_distribution(attacker, defender, EARTHQUAKE)
+
+    assert distribution.normal.shape == distribution.critical.shape == (16,)
+    assert distribution.effectiveness == 1.0
+    assert distribution.crit_chance == pytest.approx(1 / 24)
+    assert np.all(distribution.critical > distribution.normal)
+
+
+def test_status_move_distribution_is_zero(garchomp_factory):
+    distribution = damage_distribution(garchomp_factory("A"), garchomp_factory("D"), SWORDS_DANCE)
+    assert not distribution.normal.any() and not distribution.critical.any()
+
+
+def test_critical_hits_ignore_unfavourable_stages(garchomp_factory):
+    attacker, defender = garchomp_factory("A"), garchomp_factory("D")
+    baseline = damage_distribution(attacker, defender, EARTHQUAKE)
+
+    attacker.change_stat_stage(Stats.ATTACK, -2)
+    defender.change_stat_stage(Stats.DEFENCE, +2)
+    staged = damage_distribution(attacker, defender, EARTHQUAKE)
+
+    assert np.all(staged.normal < baseline.normal)
+    assert np.array_equal(staged.critical, baseline.critical)
+
+
+def test_damage_calc_handlers_are_folded_in(garchomp_factory):
+    attacker, defender = garchomp_factory("A"), garchomp_factory("D")
+    bus = EventBus()
+
+    def boost(context, payload):
+        payload.add_modifier(1.5)
+
+    bus.on(Event.ON_DAMAGE_CALC, boost)
+    boosted = damage_distribution(attacker, defender, DRACO_METEOR, bus=bus)
+    plain = damage_distribution(attacker, defender, DRACO_METEOR)
+
+    assert boosted.normal[-1] == pytest.approx(plain.normal[-1] * 1.5, abs=1)
+    assert np.all(boosted.normal > plain.normal)
+
+
+def test_damage_calc_is_emitted_once_for_both_crit_cases(garchomp_factory):
+    attacker, defender = garchomp_factory("A"), garchomp_factory("D")
+    defender.change_stat_stage(Stats.DEFENCE, 2)
+    bus = EventBus()
+    bus.on(Event.ON_DAMAGE_CALC, lambda context, payload: payload.add_modifier(2.0), once=True)
+    doubled = damage_distribution(attacker, defender, EARTHQUAKE, bus=bus)
+    plain = damage_distribution(attacker, defender, EARTHQUAKE, bus=bus)
+
+    assert np.all(np.abs(doubled.normal - plain.normal * 2) <= 1)
+    assert np.all(np.abs(doubled.critical - plain.critical * 2) <= 1)
+    assert np.all(plain.critical > plain.normal)
+
+    bus.on(Event.ON_DAMAGE_CALC, lambda context, payload: setattr(payload, "critical", True), once=True)
+    forced = damage_distribution(attacker, defender, EARTHQUAKE, bus=bus)
+    assert np.array_equal(forced.normal, plain.critical) and np.array_equal(forced.critical, plain.critical)
+    assert forced.crit_chance == 1.0
+
+
+def test_batch_matches_per_pair_distributions(garchomp_factory):
+    attacker, defender = garchomp_factory("A"), garchomp_factory("D")
+    defender.change_stat_stage(Stats.SP_DEFENCE, 1)
+    moves = [EARTHQUAKE, DRACO_METEOR, ROCK_SLIDE, SWORDS_DANCE]
+    normal, critical = batch_damage_distributions([attacker] * 4, [defender] * 4, moves)
+
+    assert normal.shape == critical.shape == (4, 16)
+    for i, move in enumerate(moves):
+        distribution = damage_distribution(attacker, defender, move)
+        assert np.array_equal(normal[i], distribution.normal)
+        assert np.array_equal(critical[i], distribution.critical)
+
+
+def test_rolled_damage_lies_in_distribution(garchomp_factory):
+    attacker, defender = garchomp_factory("A"), garchomp_factory("D")
+    distribution = damage_distribution(attacker, defender, EARTHQUAKE)
+    rng = CounterRNG(seed=3)
+    for _ in range(200):
+        damage, critical = roll_damage(attacker, defender, EARTHQUAKE, rng)
+        assert damage in (distribution.critical if critical else distribution.normal)
+
+
+def test_damage_calc_handlers_get_the_callers_rng(garchomp_factory):
+    attacker, defender = garchomp_factory("A"), garchomp_factory("D")
+    bus = EventBus()
+    seen = []
+    bus.on(Event.ON_DAMAGE_CALC, lambda context, payload: seen.append(context.rng))
+
+    rng = CounterRNG(seed=3)
+    roll_damage(attacker, defender, EARTHQUAKE, rng, bus=bus)
+    assert len(seen) == 1 and seen[0] is rng
+    damage_distribution(attacker, defender, EARTHQUAKE, bus=bus)
+    assert len(seen) == 2 and seen[1].seed == 0
+
+
+def test_hit_count_chances():
+    assert hit_count_chances(None) == {1: 1.0}
+    assert hit_count_chances((2, 5)) == MULTI_HIT_CHANCES
+    assert hit_count_chances((2, 2)) == {2: 1.0}
+
+    rng = CounterRNG(seed=0)
+    counts = [roll_hit_count((2, 5), rng) for _ in range(4000)]
+    assert set(counts) == {2, 3, 4, 5}
+    assert counts.count(2) / len(counts) == pytest.approx(0.35, abs=0.03)
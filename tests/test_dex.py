@@ -0,0 +1,95 @@
+import subprocess
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from battle_sim.database import dex as dex_module
+from battle_sim.database import sample_moves
+from battle_sim.database.build import build_database, compile_moves, compile_species
+from battle_sim.database.dex import DATA_DIR, Dex, MoveDex, SpeciesDex, move_dex, species_dex
+from battle_sim.models.moves import DamageEffect
+from battle_sim.models.stats import BaseStats
+from battle_sim.utils import Type
+
+
+@pytest.mark.parametrize(
+    "move",
+    [
+        sample_moves.EARTHQUAKE,
+        sample_moves.SWORDS_DANCE,
+        sample_moves.WILL_O_WISP,
+        sample_moves.ROCK_SLIDE,
+        sample_moves.DRACO_METEOR,
+    ],
+)
+def test_compiled_moves_match_sample_moves(move):
+    assert move_dex().by_name(move.name) is move  # Sample moves are registered under their dex ids
+
+
+def test_importing_sample_moves_leaves_the_dex_alone():
+    code = (
+        "import sys; import battle_sim.database.sample_moves; from battle_sim.database.dex import move_dex; "
+        "assert 'pandas' not in sys.modules and move_dex.cache_info().currsize == 0"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_moves_are_built_lazily_and_interned():
+    dex = MoveDex(compile_moves(pd.read_csv(DATA_DIR / "moves.csv")))
+    assert not dex._records
+    bullet_seed = dex[331]
+    assert dex[331] is bullet_seed is dex.by_name("Bullet Seed")
+    assert list(dex._records) == [331]
+    effect = bullet_seed.effects[0]
+    assert isinstance(effect, DamageEffect) and effect.multi_hit == (2, 5)
+    assert type(bullet_seed.accuracy_probability) is float
+
+
+def test_missing_ids_and_names():
+    dex = move_dex()
+    assert 89 in dex and 1 not in dex
+    with pytest.raises(KeyError):
+        dex[1]
+    with pytest.raises(KeyError):
+        dex.by_name("Splash")
+
+
+def test_species():
+    garchomp = species_dex().by_name("Garchomp")
+    assert garchomp.id == 445
+    assert garchomp.types == (Type.DRAGON, Type.GROUND)
+    assert garchomp.base_stats == BaseStats(HP=108, ATTACK=130, DEFENCE=95, SP_ATTACK=80, SP_DEFENCE=85, SPEED=102)
+    assert species_dex().by_name("Pikachu").types == (Type.ELECTRIC, None)
+
+
+def test_build_writes_memory_mapped_tables(tmp_path):
+    build_database(DATA_DIR, tmp_path)
+    moves, species = MoveDex.load(tmp_path / "moves.npy"), SpeciesDex.load(tmp_path / "species.npy")
+
+    assert isinstance(moves.table, np.memmap)
+    assert len(moves) == len(pd.read_csv(DATA_DIR / "moves.csv"))
+    assert np.all(np.diff(moves.ids().astype(int)) > 0)
+    assert [s.id for s in species] == sorted(pd.read_csv(DATA_DIR / "species.csv").id)
+
+
+def test_tables_compile_outside_the_package(tmp_path, monkeypatch):
+    monkeypatch.setattr(sys, "platform", "linux")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    assert dex_module._user_cache_dir() == tmp_path / "cache" / "battle_sim" / "dex"
+    assert not dex_module.COMPILED_DIR.is_relative_to(DATA_DIR.parent)
+
+    monkeypatch.setattr(dex_module, "COMPILED_DIR", tmp_path / "dex")
+    assert dex_module._compiled("moves") == tmp_path / "dex" / "moves.npy"
+    assert len(MoveDex.load(tmp_path / "dex" / "moves.npy")) == len(move_dex())
+    with pytest.raises(TypeError):
+        Dex(move_dex().table)  # type: ignore[abstract]
+
+
+def test_compile_rejects_bad_rows():
+    frame = pd.read_csv(DATA_DIR / "species.csv")
+    with pytest.raises(ValueError, match="unique"):
+        compile_species(pd.concat([frame, frame.head(1)]))
+    with pytest.raises(ValueError, match="Unknown type1"):
+        compile_species(frame.assign(type1="SOUND"))
@@ -0,0 +1,79 @@
+import pytest
+
+from battle_sim import engine
+from battle_sim.engine import (
+    Battle,
+    MatchupSummary,
+    first_move_policy,
+    random_move_policy,
+    run_matchup,
+)
+from battle_sim.maths.rng import CounterRNG
+from battle_sim.models.moves import MoveSlot
+
+
+@pytest.fixture
+def teams(garchomp_factory):
+    return [garchomp_factory(f"Left{i}") for i in range(3)], [garchomp_factory(f"Right{i}") for i in range(2)]
+
+
+def test_battle_runs_to_a_winner(teams):
+    team_one, team_two = teams
+    result = Battle(team_one, team_two, (first_move_policy, first_move_policy), CounterRNG(seed=1)).run()
+
+    assert result.winner == 0
+    assert result.turns > 0
+    assert all(pokemon.is_fainted() for pokemon in team_two)
+
+
+def test_battle_stops_at_max_turns(teams):
+    result = Battle(*teams, (first_move_policy, first_move_policy), CounterRNG(seed=1), max_turns=2).run()
+    assert result == type(result)(winner=None, turns=2)
+
+
+def test_matchup_results_do_not_depend_on_workers_or_chunks(teams):
+    policies = (random_move_policy, first_move_policy)
+    serial = sorted(run_matchup(*teams, policies, 12, seed=5, workers=0), key=lambda r: r.trial)
+    parallel = sorted(run_matchup(*teams, policies, 12, seed=5, workers=2, chunk_size=5), key=lambda r: r.trial)
+
+    assert [r.trial for r in serial] == list(range(12))
+    assert serial == parallel
+    assert serial != sorted(run_matchup(*teams, policies, 12, seed=6, workers=0), key=lambda r: r.trial)
+
+
+def test_in_process_matchups_can_interleave(teams):
+    policies = (random_move_policy, first_move_policy)
+    expected = [list(run_matchup(*teams, policies, 3, seed=seed, workers=0)) for seed in (1, 2)]
+    first, second = (
+        run_matchup(*teams, policies, 3, seed=1, workers=0),
+        run_matchup(*teams, policies, 3, seed=2, workers=0),
+    )
+    interleaved = [[], []]
+    for one, two in zip(first, second, strict=True):
+        interleaved[0].append(one)
+        interleaved[1].append(two)
+
+    assert interleaved == expected
+    assert engine._worker_matchup is None  # Only pool workers hold a matchup
+
+
+def test_matchup_does_not_mutate_input_teams(teams):
+    list(run_matchup(*teams, (first_move_policy, first_move_policy), 2, workers=0))
+    assert not any(pokemon.is_fainted() for team in teams for pokemon in team)
+
+
+def test_matchup_summary(teams):
+    summary = MatchupSummary.from_results(run_matchup(*teams, (first_move_policy, first_move_policy), 4, workers=0))
+    assert summary.trials == 4
+    assert summary.wins + summary.losses + summary.draws == 4
+    assert summary.mean_turns > 0
+
+
+def test_moves_use_pp(teams):
+    team_one, team_two = teams
+    battle = Battle(team_one, team_two, (first_move_policy, first_move_policy), CounterRNG(seed=1))
+    battle.play_turn()
+    assert team_one[0].moves.pp(MoveSlot.FIRST) == team_one[0].moves.max_pp(MoveSlot.FIRST) - 1
+
+    team_one[0].moves.use_pp(MoveSlot.FIRST, 99)
+    assert first_move_policy(battle, 0).move is MoveSlot.SECOND
@@ -1,7 +1,9 @@
 import pytest
 
+from battle_sim.database.sample_moves import EARTHQUAKE
 from battle_sim.maths.rng import RNG
 from battle_sim.mechanics.events import Event, EventBus, EventContext, EventPriority, HandlerResult
+from battle_sim.mechanics.payloads import DamageCalcPayload
 from battle_sim.models.actions import Action, ActionType
 from battle_sim.models.moves import MoveSlot
 from battle_sim.utils import Target
@@ -55,6 +57,24 @@ def test_payload_merging(context):
     assert out == {"a": 1, "b": 2}
 
 
+def test_in_place_writes_to_dict_payloads_reach_later_handlers(context):
+    bus = EventBus()
+    seen = []
+
+    def write(ctx, payload):
+        payload["x"] = payload.get("x", 0) + 1
+
+    bus.on(Event.ON_TURN_START, write, priority=1)
+    bus.on(Event.ON_TURN_START, lambda ctx, payload: seen.append(dict(payload)))
+
+    assert bus.emit(Event.ON_TURN_START, context) == {"x": 1}
+    given = {"x": 5}
+    out = bus.emit(Event.ON_TURN_START, context, given)
+    assert out == {"x": 6} and out is not given and given == {"x": 5}
+    assert seen == [{"x": 1}, {"x": 6}]
+    assert bus.emit(Event.ON_TURN_START, context) is not bus.emit(Event.ON_TURN_START, context)
+
+
 def test_cancellation_stops_later_handlers(context):
     bus = EventBus()
     called = []
@@ -134,3 +154,170 @@ def test_emit_returns_initial_payload_if_no_handlers(context):
     bus = EventBus()
     out = bus.emit(Event.ON_TURN_START, context, {"x": 1})
     assert out == {"x": 1}
+
+
+def test_equal_priority_handlers_run_in_registration_order(context):
+    bus = EventBus()
+    order = []
+
+    def make(label):
+        def handler(ctx, payload):
+            order.append(label)
+
+        return handler
+
+    for label in ("a", "b", "c"):
+        bus.on(Event.ON_SWITCH_IN, make(label), priority=EventPriority.ITEM)
+    bus.on(Event.ON_SWITCH_IN, make("field"), priority=EventPriority.FIELD)
+    bus.on(Event.ON_SWITCH_IN, make("default"))
+    bus.emit(Event.ON_SWITCH_IN, context)
+    assert order == ["field", "a", "b", "c", "default"]
+
+
+def test_off_removes_only_the_matching_subscription(context):
+    bus = EventBus()
+    called = []
+
+    def first(ctx, payload):
+        called.append("first")
+
+    def second(ctx, payload):
+        called.append("second")
+
+    sub = bus.on(Event.ON_AFTER_HIT, first)
+    bus.on(Event.ON_AFTER_HIT, second)
+
+    # A duplicate registration returns an equal subscription, which can also be used to unsubscribe.
+    bus.off(bus.on(Event.ON_AFTER_HIT, first))
+    bus.off(sub)
+    bus.emit(Event.ON_AFTER_HIT, context)
+    assert called == ["second"]
+
+    bus.on(Event.ON_AFTER_HIT, first)
+    bus.emit(Event.ON_AFTER_HIT, context)
+    assert called == ["second", "second", "first"]
+
+
+def test_off_owner_keeps_other_owners_and_events(context):
+    bus = EventBus()
+
+    class DummyOwner:
+        def __init__(self, name):
+            self.name = name
+
+        def on_register(self, b): ...
+        def on_unregister(self, b): ...
+
+    leftovers, ours = DummyOwner("leftovers"), DummyOwner("ours")
+    called = []
+
+    def h(ctx, payload):
+        called.append(ctx.target)
+
+    bus.on(Event.ON_TURN_END, h, owner=leftovers)
+    bus.on(Event.ON_TURN_END, h, owner=ours, priority=EventPriority.ABILITY)
+    bus.on(Event.ON_TURN_START, h, owner=ours)
+    bus.off_owner(ours)
+    bus.off_owner(ours)
+
+    bus.emit(Event.ON_TURN_START, context)
+    bus.emit(Event.ON_TURN_END, context)
+    assert len(called) == 1
+
+
+def test_subscription_changes_during_emit_apply_from_next_emit(context):
+    bus = EventBus()
+    called = []
+
+    def late(ctx, payload):
+        called.append("late")
+
+    def second(ctx, payload):
+        called.append("second")
+
+    def first(ctx, payload):
+        called.append("first")
+        bus.off(second_sub)
+        bus.on(Event.ON_BEFORE_HIT, late)
+
+    bus.on(Event.ON_BEFORE_HIT, first, priority=EventPriority.ABILITY)
+    second_sub = bus.on(Event.ON_BEFORE_HIT, second)
+
+    bus.emit(Event.ON_BEFORE_HIT, context)
+    assert called == ["first", "second"]
+
+    called.clear()
+    bus.emit(Event.ON_BEFORE_HIT, context)
+    assert called == ["first", "late"]
+
+
+def test_once_handler_after_cancel_is_kept(context):
+    bus = EventBus()
+    called = []
+
+    def cancel(ctx, payload):
+        called.append("cancel")
+        return HandlerResult(cancel=True)
+
+    def once_handler(ctx, payload):
+        called.append("once")
+
+    cancel_sub = bus.on(Event.ON_DAMAGE_CALC, cancel, priority=EventPriority.ITEM, once=True)
+    bus.on(Event.ON_DAMAGE_CALC, once_handler, once=True)
+
+    bus.emit(Event.ON_DAMAGE_CALC, context)
+    bus.off(cancel_sub)
+    bus.emit(Event.ON_DAMAGE_CALC, context)
+    bus.emit(Event.ON_DAMAGE_CALC, context)
+    assert called == ["cancel", "once"]
+
+
+def test_typed_payload_is_mutated_in_place(context):
+    bus = EventBus()
+
+    def technician(ctx, payload: DamageCalcPayload):
+        payload.base_power = payload.base_power * 3 // 2
+
+    def expert_belt(ctx, payload: DamageCalcPayload):
+        payload.add_modifier(1.2)
+
+    bus.on(Event.ON_DAMAGE_CALC, technician, priority=EventPriority.ABILITY)
+    bus.on(Event.ON_DAMAGE_CALC, expert_belt, priority=EventPriority.ITEM)
+
+    payload = DamageCalcPayload(move=EARTHQUAKE, base_power=60)
+    out = bus.emit(Event.ON_DAMAGE_CALC, context, payload)
+    assert out is payload
+    assert payload.base_power == 90
+    assert payload.modifiers == [1.2]
+    assert payload.chained_modifier() == 4915
+
+
+def test_dict_style_handlers_work_on_typed_payloads(context):
+    bus = EventBus()
+
+    def crit(ctx, payload):
+        assert payload["critical"] is False
+        return HandlerResult(updated_payload={"critical": True})
+
+    def huge_power(ctx, payload):
+        payload["attack_multiplier"] = 2.0
+
+    bus.on(Event.ON_DAMAGE_CALC, crit)
+    bus.on(Event.ON_DAMAGE_CALC, huge_power)
+    out = bus.emit(Event.ON_DAMAGE_CALC, context, DamageCalcPayload(move=EARTHQUAKE, base_power=100))
+    assert out.critical is True
+    assert out.to_dict()["attack_multiplier"] == 2.0
+
+
+def test_typed_payload_keys_are_fields_plus_overflow(context):
+    bus = EventBus()
+    bus.on(Event.ON_DAMAGE_CALC, lambda ctx, payload: HandlerResult(updated_payload={"stab_applied": True}))
+    out = bus.emit(Event.ON_DAMAGE_CALC, context, DamageCalcPayload(move=EARTHQUAKE, base_power=100))
+
+    assert out["stab_applied"] is True and "stab_applied" in out
+    assert out.keys()[-1] == "stab_applied" and out.to_dict()["stab_applied"] is True
+    assert DamageCalcPayload(move=EARTHQUAKE, base_power=100).get("stab_applied") is None
+    for method in ("to_dict", "update", "keys", "_extra"):
+        assert method not in out and out.get(method) is None
+        with pytest.raises(KeyError):
+            out[method]
@@ -0,0 +1,99 @@
+import pytest
+
+from battle_sim.engine import Battle, random_move_policy
+from battle_sim.maths.rng import RNG, CounterRNG
+from battle_sim.mechanics.events import Event, EventBus, EventContext, EventPriority, HandlerResult
+from battle_sim.mechanics.instrumentation import (
+    BusStats,
+    EventStats,
+    InstrumentedEventBus,
+    instrument,
+    priority_tier,
+    uninstrument,
+)
+
+
+@pytest.fixture
+def context():
+    return EventContext(rng=RNG(seed=0))
+
+
+def cancel(context, payload):
+    return HandlerResult(cancel=True)
+
+
+def test_priority_tiers():
+    assert priority_tier(EventPriority.SYSTEM + 5) is EventPriority.SYSTEM
+    assert priority_tier(EventPriority.ABILITY - 1) is EventPriority.ITEM
+    assert priority_tier(EventPriority.MOVE) is EventPriority.MOVE
+    assert priority_tier(-1) is EventPriority.DEFAULT
+
+
+def test_counts_calls_and_cancels(context):
+    bus = EventBus()
+    seen = []
+    bus.on(Event.ON_BEFORE_HIT, lambda c, p: seen.append("first"), priority=EventPriority.ABILITY)
+    bus.on(Event.ON_BEFORE_HIT, cancel, priority=EventPriority.MOVE)
+    bus.on(Event.ON_BEFORE_HIT, lambda c, p: seen.append("never"))
+    bus.on(Event.ON_AFTER_HIT, lambda c, p: None, once=True)
+
+    stats = instrument(bus)
+    assert type(bus) is InstrumentedEventBus and instrument(bus) is stats
+    for _ in range(3):
+        bus.emit(Event.ON_BEFORE_HIT, context)
+        bus.emit(Event.ON_AFTER_HIT, context)
+    assert seen == ["first"] * 3
+
+    assert stats.events[Event.ON_BEFORE_HIT] == EventStats(emits=3, handler_calls=6, cancels=3)
+    assert stats.events[Event.ON_AFTER_HIT].emits == 3
+    assert stats.events[Event.ON_AFTER_HIT].handler_calls == 1  # `once` handlers still unsubscribe
+
+    data = stats.to_dict()
+    assert data["events"]["ON_BEFORE_HIT"]["cancel_rate"] == 1.0
+    move_tier = data["tiers"]["MOVE"]
+    assert (move_tier["handler_calls"], move_tier["cancels"], move_tier["cancel_rate"]) == (3, 3, 1.0)
+    assert data["tiers"]["ABILITY"]["cancel_rate"] == 0.0
+    handlers = {row["handler"]: row for row in data["handlers"]}
+    assert handlers["cancel"]["calls"] == 3 and handlers["cancel"]["tier"] == "MOVE"
+    assert all(0 <= row["max_time"] <= row["total_time"] for row in data["handlers"])
+    assert "never" not in str(handlers)
+
+    frame = stats.to_frame()
+    assert set(frame["handler"]) == set(handlers)
+    assert stats.to_frame("events").loc["ON_BEFORE_HIT", "emits"] == 3
+    assert stats.to_frame("tiers").loc["MOVE", "cancels"] == 3
+
+
+def test_uninstrument_restores_plain_emit(context):
+    bus = EventBus()
+    bus.on(Event.ON_TURN_START, lambda c, p: None)
+    stats = instrument(bus)
+    bus.emit(Event.ON_TURN_START, context)
+
+    assert uninstrument(bus) is stats
+    assert type(bus) is EventBus and bus._stats is None
+    bus.emit(Event.ON_TURN_START, context)
+    assert stats.events[Event.ON_TURN_START].emits == 1
+    assert uninstrument(bus) is None
+
+    # Re-instrumenting into the same stats keeps adding to them.
+    instrument(bus, stats)
+    bus.on(Event.ON_TURN_START, cancel)
+    bus.emit(Event.ON_TURN_START, context)
+    assert stats.events[Event.ON_TURN_START].emits == 2
+    assert stats.events[Event.ON_TURN_START].handler_calls == 3
+
+
+def test_instrumented_battle_matches_plain_battle(garchomp_factory):
+    def play(bus: EventBus):
+        teams = [garchomp_factory(f"A{i}") for i in range(3)], [garchomp_factory(f"B{i}") for i in range(3)]
+        return Battle(*teams, (random_move_policy, random_move_policy), CounterRNG(seed=2), bus=bus).run()
+
+    stats = BusStats()
+    bus = EventBus()
+    instrument(bus, stats)
+    assert play(bus) == play(EventBus())
+    assert stats.events[Event.ON_TURN_START].emits >= 1
+
+    stats.clear()
+    assert not stats.events and not stats.handlers
@@ -0,0 +1,89 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from battle_sim.database.sample_moves import DRACO_METEOR, EARTHQUAKE, ROCK_SLIDE, SWORDS_DANCE
+from battle_sim.maths.rng import CounterRNG
+from battle_sim.mechanics.damage import damage_distribution, roll_damage, roll_hit_count
+from battle_sim.mechanics.ko_chance import hit_pmf, ko_chance, ko_chances, use_pmf
+from battle_sim.models.moves import DamageEffect, Move
+from battle_sim.utils import Category, PriorityLevel, Target, Type
+
+BULLET_SEED = Move(
+    name="Bullet Seed",
+    type=Type.GRASS,
+    category=Category.PHYSICAL,
+    accuracy_probability=1.0,
+    priority=PriorityLevel.NORMAL,
+    pp=30,
+    target=Target.SINGLE_OPPONENT,
+    effects=[DamageEffect(power=25, category=Category.PHYSICAL, contact=False, crit_stage=0, multi_hit=(2, 5))],
+)
+
+
+@pytest.fixture
+def pair(garchomp_factory):
+    return garchomp_factory("A"), garchomp_factory("D")
+
+
+def test_histograms_are_probability_distributions(pair):
+    distribution = damage_distribution(*pair, ROCK_SLIDE)
+    for pmf in (hit_pmf(distribution, 100), use_pmf(distribution, 100, accuracy=0.9, multi_hit=(2, 5))):
+        assert pmf.shape == (101,)
+        assert pmf.sum() == pytest.approx(1.0)
+
+
+def test_single_use_matches_enumeration(pair):
+    attacker, defender = pair
+    distribution = damage_distribution(attacker, defender, DRACO_METEOR)
+    hp = int(distribution.normal[8])
+    crit = distribution.crit_chance
+    expected = DRACO_METEOR.accuracy_probability * (
+        (1 - crit) * np.mean(distribution.normal >= hp) + crit * np.mean(distribution.critical >= hp)
+    )
+    assert ko_chance(attacker, defender, DRACO_METEOR, hp=hp) == pytest.approx(expected)
+
+
+def test_two_uses_match_enumeration(pair):
+    attacker, defender = pair
+    distribution = damage_distribution(attacker, defender, ROCK_SLIDE)
+    hp = int(distribution.normal.sum() // 8)
+    accuracy, crit = ROCK_SLIDE.accuracy_probability, distribution.crit_chance
+    outcomes = [(0, 1 - accuracy)]
+    outcomes += [(int(d), accuracy * (1 - crit) / 16) for d in distribution.normal]
+    outcomes += [(int(d), accuracy * crit / 16) for d in distribution.critical]
+    expected = sum(p1 * p2 for (d1, p1), (d2, p2) in itertools.product(outcomes, repeat=2) if d1 + d2 >= hp)
+
+    chances = ko_chances(attacker, defender, ROCK_SLIDE, 2, hp=hp)
+    assert chances[1] == pytest.approx(expected)
+    assert chances[0] <= chances[1]
+
+
+def test_multi_hit_matches_simulation(pair):
+    attacker, defender = pair
+    hp = 150
+    exact = ko_chances(attacker, defender, BULLET_SEED, 3, hp=hp)
+
+    rng = CounterRNG(seed=11)
+    trials = 20_000
+    kos = np.zeros(3)
+    for _ in range(trials):
+        total = 0
+        for use in range(3):
+            for _ in range(roll_hit_count((2, 5), rng)):
+                total += roll_damage(attacker, defender, BULLET_SEED, rng)[0]
+            kos[use] += total >= hp
+    np.testing.assert_allclose(kos / trials, exact, atol=0.015)
+
+
+def test_defaults_and_edge_cases(pair):
+    attacker, defender = pair
+    assert ko_chance(attacker, defender, EARTHQUAKE, 10) == pytest.approx(1.0)
+    assert ko_chance(attacker, defender, EARTHQUAKE, hp=1) == pytest.approx(1.0)
+    assert not ko_chances(attacker, defender, SWORDS_DANCE, 3).any()
+
+    defender.apply_damage(defender.live_stats.HP)
+    assert ko_chances(attacker, defender, SWORDS_DANCE, 2).tolist() == [1.0, 1.0]
+    with pytest.raises(ValueError):
+        ko_chances(attacker, defender, EARTHQUAKE, 0)
@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+
+from battle_sim.engine import Battle, first_move_policy
+from battle_sim.maths.rng import CounterRNG
+from battle_sim.mechanics.legal_actions import (
+    ACTION_SPACE,
+    NUM_MOVE_ACTIONS,
+    action_for_index,
+    legal_action_mask,
+    legal_action_masks,
+)
+from battle_sim.models.actions import ActionRecord, ActionType
+from battle_sim.models.battle_state import BattleState, FieldColumn
+from battle_sim.models.moves import MoveSlot
+
+
+@pytest.fixture
+def team(garchomp_factory):
+    return [garchomp_factory(f"Chomp{i}") for i in range(3)]
+
+
+def test_fresh_team_mask(team):
+    mask = legal_action_mask(team, 0)
+    assert mask.tolist() == [True] * 4 + [False, True, True, False, False, False]
+
+
+def test_mask_tracks_pp_and_fainting(team):
+    team[0].moves.use_pp(MoveSlot.SECOND, 99)
+    team[2].apply_damage(team[2].live_stats.HP)
+    out = np.ones(ACTION_SPACE, dtype=bool)
+
+    assert legal_action_mask(team, 0, out) is out
+    assert out.tolist() == [True, False, True, True, False, True, False, False, False, False]
+
+    for slot in MoveSlot:
+        team[0].moves.use_pp(slot, 99)
+    assert legal_action_mask(team, 0)[:NUM_MOVE_ACTIONS].tolist() == [True, False, False, False]  # Struggle stand-in
+
+    team[0].apply_damage(team[0].live_stats.HP)
+    assert legal_action_mask(team, 0).tolist() == [False] * 5 + [True] + [False] * 4
+
+
+def test_batch_masks_match_scalar_masks(garchomp_factory):
+    variants = []
+    for battle in range(5):
+        team_one = [garchomp_factory(f"L{battle}-{i}") for i in range(battle + 2)]
+        team_two = [garchomp_factory(f"R{battle}-{i}") for i in range(2)]
+        team_one[battle % len(team_one)].apply_damage(999)
+        team_one[0].moves.use_pp(MoveSlot(battle % 4 + 1), 99)
+        variants.append((team_one, team_two, battle % 2))
+
+    state = BattleState(len(variants))
+    for battle, (team_one, team_two, active) in enumerate(variants):
+        state.load_teams(battle, team_one, team_two)
+        state.field[battle, FieldColumn.ACTIVE_ONE] = active
+    out = np.zeros((len(variants), ACTION_SPACE), dtype=bool)
+
+    assert legal_action_masks(state, 0, out) is out
+    for battle, (team_one, _, active) in enumerate(variants):
+        assert out[battle].tolist() == legal_action_mask(team_one, active).tolist()
+    assert legal_action_masks(state, 1).tolist() == [legal_action_mask(v[1], 0).tolist() for v in variants]
+
+
+def test_indices_decode_to_actions(team):
+    assert action_for_index(team[0], 2) == ActionRecord(
+        ActionType.USE_MOVE, MoveSlot.THIRD, team[0].moves[MoveSlot.THIRD].target
+    )
+    assert action_for_index(team[0], NUM_MOVE_ACTIONS + 1) == ActionRecord(ActionType.SWITCH_OUT, switch_index=1)
+
+
+def test_battle_legal_actions(team, garchomp_factory):
+    battle = Battle(team, [garchomp_factory("Foe")], (first_move_policy, first_move_policy), CounterRNG(seed=0))
+    battle.play_turn((ActionRecord(ActionType.SWITCH_OUT, switch_index=2), first_move_policy(battle, 1)))
+    assert battle.legal_actions(0).tolist() == legal_action_mask(team, 2).tolist()
+    assert not battle.legal_actions(0)[NUM_MOVE_ACTIONS + 2]
@@ -1,5 +1,15 @@
+import copy
+from dataclasses import replace
+
+import pytest
+from pydantic import TypeAdapter, ValidationError
+
+from battle_sim.database.dex import move_dex
+from battle_sim.database.registry import CUSTOM_MOVE_ID_START, MOVES, MoveRegistry
 from battle_sim.database.sample_moves import DRACO_METEOR, EARTHQUAKE, ROCK_SLIDE, SWORDS_DANCE, WILL_O_WISP
-from battle_sim.models.moves import MoveSet, MoveSlot
+from battle_sim.models.moves import EMPTY_SLOT_ID, UNREGISTERED_MOVE_ID, Move, MoveSet, MoveSlot
+from battle_sim.models.pokemon import Pokemon
+from battle_sim.utils import Category, PriorityLevel, Stats, Target, Type
 
 
 def test_forget_move_shifts_left():
@@ -28,3 +38,121 @@ def test_learn_move_requires_slot_when_full():
     move_set.learn_move(WILL_O_WISP, MoveSlot.FIRST)
     assert move_set.to_list() == [WILL_O_WISP, DRACO_METEOR, ROCK_SLIDE, SWORDS_DANCE]
     assert move_set[MoveSlot.FIRST] == WILL_O_WISP
+
+
+def test_sample_moves_are_interned_under_dex_ids():
+    assert EARTHQUAKE.id == 89
+    assert MOVES[89] is EARTHQUAKE
+    assert MOVES.by_name("Swords Dance") is SWORDS_DANCE
+    assert move_dex()[434] is DRACO_METEOR
+    assert copy.deepcopy(EARTHQUAKE) is EARTHQUAKE
+
+
+def test_moves_are_hashable_and_compare_by_id():
+    table = {move: move.name for move in (EARTHQUAKE, SWORDS_DANCE, DRACO_METEOR)}
+    assert table[SWORDS_DANCE] == "Swords Dance"
+    assert SWORDS_DANCE.effects[0].stages == {Stats.ATTACK: 2}
+    assert EARTHQUAKE != ROCK_SLIDE
+
+    unregistered = replace(SWORDS_DANCE, id=UNREGISTERED_MOVE_ID)
+    assert unregistered == SWORDS_DANCE and hash(unregistered) == hash(SWORDS_DANCE)
+    assert replace(SWORDS_DANCE, pp=5, id=UNREGISTERED_MOVE_ID) != SWORDS_DANCE
+
+
+def test_registry_assigns_custom_ids_and_rejects_conflicts():
+    registry = MoveRegistry()
+    splash = Move(
+        name="Splash",
+        type=Type.NORMAL,
+        category=Category.STATUS,
+        accuracy_probability=None,
+        priority=PriorityLevel.NORMAL,
+        pp=40,
+        target=Target.SELF,
+    )
+    interned = registry.register(splash)
+
+    assert interned.id == CUSTOM_MOVE_ID_START and not splash.is_registered
+    assert registry.register(replace(splash)) is interned
+    with pytest.raises(ValueError):
+        registry.register(replace(splash, pp=20))
+    with pytest.raises(ValueError):
+        registry.register(replace(splash, name="Splash 2"), move_id=interned.id)
+
+
+def test_pp_tracking():
+    move_set = MoveSet(EARTHQUAKE, DRACO_METEOR)
+    assert move_set.pp(MoveSlot.FIRST) == move_set.max_pp(MoveSlot.FIRST) == EARTHQUAKE.pp
+    assert move_set.pp(MoveSlot.THIRD) == 0 and not move_set.has_pp(MoveSlot.THIRD)
+
+    assert move_set.use_pp(MoveSlot.SECOND) == DRACO_METEOR.pp - 1
+    assert move_set.use_pp(MoveSlot.SECOND, 99) == 0
+    assert not move_set.has_pp(MoveSlot.SECOND)
+    move_set.set_pp(MoveSlot.FIRST, 99)
+    assert move_set.pp(MoveSlot.FIRST) == EARTHQUAKE.pp
+
+    move_set.restore_pp()
+    assert move_set.pp(MoveSlot.SECOND) == DRACO_METEOR.pp
+
+
+def test_forget_and_learn_move_keep_pp_aligned():
+    move_set = MoveSet(EARTHQUAKE, DRACO_METEOR, ROCK_SLIDE, None)
+    move_set.use_pp(MoveSlot.THIRD, 3)
+    move_set.forget_move(MoveSlot.FIRST)
+    assert move_set.pp(MoveSlot.SECOND) == ROCK_SLIDE.pp - 3
+    assert move_set.move_id(MoveSlot.SECOND) == ROCK_SLIDE.id
+    assert move_set.move_id(MoveSlot.FOURTH) == EMPTY_SLOT_ID
+
+    move_set.learn_move(SWORDS_DANCE, MoveSlot.FIRST)
+    assert move_set[MoveSlot.THIRD] == SWORDS_DANCE
+    assert move_set.pp(MoveSlot.THIRD) == SWORDS_DANCE.pp
+
+
+def test_copy_is_independent():
+    move_set = MoveSet(EARTHQUAKE, DRACO_METEOR)
+    clone = copy.deepcopy(move_set)
+    clone.use_pp(MoveSlot.FIRST)
+    clone.learn_move(SWORDS_DANCE, MoveSlot.FIRST)
+
+    assert clone[MoveSlot.FIRST] is EARTHQUAKE
+    assert move_set.pp(MoveSlot.FIRST) == EARTHQUAKE.pp
+    assert len(move_set) == 2 and len(clone) == 3
+    assert move_set == MoveSet(EARTHQUAKE, DRACO_METEOR) != clone
+
+
+def test_pokemon_copies_get_their_own_pp(garchomp_factory):
+    garchomp = garchomp_factory("Chompy")
+    clone = garchomp.model_copy(deep=True)
+    clone.moves.use_pp(MoveSlot.FIRST)
+    assert garchomp.moves.pp(MoveSlot.FIRST) == EARTHQUAKE.pp
+    with pytest.raises(ValidationError):
+        garchomp.model_validate({**garchomp.__dict__, "moves": ["Earthquake"]})
+
+
+def test_moves_serialize_with_stage_changes():
+    adapter = TypeAdapter(Move)
+    for move in (SWORDS_DANCE, EARTHQUAKE):
+        restored = adapter.validate_json(adapter.dump_json(move))
+        assert restored == move and restored.definition() == move.definition()
+    assert adapter.dump_python(SWORDS_DANCE)["effects"][0]["stages"] == {Stats.ATTACK: 2}
+
+
+def test_moveset_round_trips_through_data(garchomp_factory):
+    pokemon = garchomp_factory("Chomp")
+    pokemon.moves.use_pp(MoveSlot.FIRST, 3)
+    data = pokemon.model_dump()
+    assert data["moves"]["pp"] == [EARTHQUAKE.pp - 3, SWORDS_DANCE.pp, DRACO_METEOR.pp, ROCK_SLIDE.pp]
+    restored = Pokemon.model_validate(data)
+    assert restored == pokemon and restored.moves.pp(MoveSlot.FIRST) == EARTHQUAKE.pp - 3
+    assert '"move_one":{"name":"Earthquake"' in pokemon.model_dump_json()
+
+    adapter = TypeAdapter(MoveSet)
+    assert adapter.validate_json(adapter.dump_json(pokemon.moves)) == pokemon.moves
+    # The mapping MoveSet had as a dataclass, and plain lists of moves, still validate.
+    assert adapter.validate_python({"move_one": EARTHQUAKE, "move_three": ROCK_SLIDE}) == MoveSet(
+        EARTHQUAKE, None, ROCK_SLIDE
+    )
+    assert adapter.validate_python([EARTHQUAKE, SWORDS_DANCE]) == MoveSet(EARTHQUAKE, SWORDS_DANCE)
+    for bad in ([], [None, EARTHQUAKE], {"move_two": EARTHQUAKE}, [EARTHQUAKE] * 5, "Earthquake"):
+        with pytest.raises(ValidationError):
+            adapter.validate_python(bad)
@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+
+from battle_sim.engine import Battle, first_move_policy
+from battle_sim.maths.rng import CounterRNG
+from battle_sim.models.battle_state import TEAM_SIZE, BattleState, FieldColumn
+from battle_sim.models.moves import MoveSlot
+from battle_sim.observation import (
+    FEATURE_NAMES,
+    OBSERVATION_SIZE,
+    OBSERVATION_VERSION,
+    POKEMON_FEATURES,
+    ObservationEncoder,
+    feature_names,
+)
+from battle_sim.utils import Stats
+
+
+@pytest.fixture
+def battle(garchomp_factory):
+    team_one = [garchomp_factory(f"A{i}") for i in range(3)]
+    team_two = [garchomp_factory(f"B{i}") for i in range(2)]
+    battle = Battle(team_one, team_two, (first_move_policy, first_move_policy), CounterRNG(seed=1))
+    battle.play_turn()
+    team_one[1].apply_damage(50)
+    team_one[1].change_stat_stage(Stats.SPEED, -2)
+    team_two[0].moves.use_pp(MoveSlot.THIRD, 3)
+    battle.active[0] = 1
+    return battle
+
+
+def as_state(battle: Battle, num_battles: int = 1) -> BattleState:
+    state = BattleState.from_teams(*battle.teams, num_battles)
+    state.field[:, FieldColumn.TURN] = battle.turn
+    state.field[:, FieldColumn.ACTIVE_ONE] = battle.active[0]
+    state.field[:, FieldColumn.ACTIVE_TWO] = battle.active[1]
+    return state
+
+
+def test_layout_is_named_and_versioned():
+    assert len(FEATURE_NAMES) == OBSERVATION_SIZE == len(set(FEATURE_NAMES))
+    assert feature_names(OBSERVATION_VERSION) == FEATURE_NAMES
+    with pytest.raises(ValueError):
+        feature_names(OBSERVATION_VERSION + 1)
+
+
+def test_battle_encoding(battle):
+    observation = battle.observe()
+    features = dict(zip(FEATURE_NAMES, observation.tolist(), strict=True))
+    hp = battle.teams[0][1].live_stats.HP
+
+    assert observation.dtype == np.float32
+    assert features["SLOT1_HP_FRACTION"] == pytest.approx(hp / battle.teams[0][1].stat_totals.HP)
+    assert features["SLOT1_STAGE_SPEED"] == pytest.approx(-2 / 6)
+    assert features["SLOT0_TYPE_DRAGON"] == features["SLOT0_TYPE_GROUND"] == 1.0
+    assert features["SLOT0_NATURE_ADAMANT"] == features["SLOT0_STATUS_NONE"] == 1.0
+    assert features["SLOT0_MOVE_ID_1"] == battle.teams[0][0].moves.move_id(MoveSlot.FIRST)
+    assert features["SIDE0_ACTIVE_1"] == features["SIDE1_ACTIVE_0"] == features["WEATHER_NONE"] == 1.0
+    assert not observation[3 * POKEMON_FEATURES : TEAM_SIZE * POKEMON_FEATURES].any()  # Empty team positions
+
+
+def test_battle_encoding_writes_at_offset(battle):
+    out = np.full(OBSERVATION_SIZE + 10, 7.0, dtype=np.float32)
+
+    assert battle.observe(out, offset=10) is out
+    assert (out[:10] == 7.0).all()
+    np.testing.assert_array_equal(out[10:], battle.observe())
+
+
+def test_batch_encoding_matches_battle_encoding(battle):
+    state = as_state(battle, num_battles=3)
+    encoder = ObservationEncoder(3)
+    out = encoder.empty()
+
+    assert encoder.encode(state, out) is out
+    for row in out:
+        np.testing.assert_allclose(row, battle.observe(), rtol=1e-6)
+
+
+def test_batch_encoding_overwrites_stale_features(battle):
+    state = as_state(battle)
+    encoder = ObservationEncoder(1)
+    out = np.full((1, OBSERVATION_SIZE), 9.0, dtype=np.float32)
+
+    np.testing.assert_allclose(encoder.encode(state, out)[0], battle.observe(), rtol=1e-6)
@@ -0,0 +1,115 @@
+import dataclasses
+import gc
+
+import numpy as np
+import pytest
+
+from battle_sim.database.sample_moves import DRACO_METEOR, EARTHQUAKE, ROCK_SLIDE, SWORDS_DANCE
+from battle_sim.models.battle_state import BattleState
+from battle_sim.models.moves import MoveSet, MoveSlot
+from battle_sim.models.pokemon_factory import PokemonSpec, build_pokemon, build_teams, pokemon_rows
+from battle_sim.models.stats import BaseStats
+from battle_sim.utils import Nature, Stats, Type
+
+GARCHOMP = PokemonSpec(
+    name="Garchomp",
+    nickname="Chomp",
+    nature=Nature.ADAMANT,
+    base_stats=BaseStats(HP=108, ATTACK=130, DEFENCE=95, SP_ATTACK=80, SP_DEFENCE=85, SPEED=102),
+    types=(Type.DRAGON, Type.GROUND),
+    moves=MoveSet(EARTHQUAKE, SWORDS_DANCE, DRACO_METEOR, ROCK_SLIDE),
+    effort_values=(74, 190, 91, 48, 84, 23),
+    individual_values=(24, 12, 30, 16, 23, 5),
+    level=78,
+)
+SPECS = [
+    GARCHOMP,
+    dataclasses.replace(GARCHOMP, nickname="Default spread", effort_values=(0,) * 6, individual_values=(31,) * 6),
+    dataclasses.replace(GARCHOMP, nickname="Mono", types=(Type.DRAGON, None), nature=Nature.JOLLY, level=1),
+    # Inputs pydantic coerces (a list for the type pair, a bool level) must match a direct build too.
+    dataclasses.replace(
+        GARCHOMP,
+        nickname="Coerced",
+        nature=Nature.TIMID,
+        types=[Type.GROUND, None],  # type: ignore[arg-type]
+        level=True,
+    ),
+]
+
+
+def test_build_matches_direct_construction():
+    built = build_pokemon(SPECS)
+    for pokemon, spec in zip(built, SPECS, strict=True):
+        expected = spec.build()
+        assert pokemon == expected
+        assert pokemon.stat_totals == expected.stat_totals
+        assert pokemon.effective_stat(Stats.SPEED) == expected.effective_stat(Stats.SPEED)
+        pokemon.reset_live_stats()
+        assert pokemon == expected
+
+    built[0].moves.use_pp(MoveSlot.FIRST)
+    assert built[1].moves.pp(MoveSlot.FIRST) == GARCHOMP.moves.pp(MoveSlot.FIRST) == EARTHQUAKE.pp
+    built[0].apply_damage(10)
+    built[0].change_stat_stage(Stats.ATTACK, 2)
+    assert built[1].live_stats.HP == built[1].stat_totals.HP and built[1].stat_stages.ATTACK == 0
+
+    teams = build_teams([SPECS[:2], SPECS[2:], []])
+    assert [len(team) for team in teams] == [2, 2, 0]
+    assert teams[1][0] == SPECS[2].build()
+
+
+@pytest.mark.parametrize(
+    "changes",
+    [
+        {"effort_values": (253, 0, 0, 0, 0, 0)},
+        {"effort_values": (252, 252, 252, 0, 0, 0)},
+        {"individual_values": (31, 31, 31, 31, 31, 32)},
+        {"individual_values": (31, 31, 31)},
+        {"level": 0},
+        {"level": 3.5},
+        {"nature": "Not a nature"},
+        {"base_stats": BaseStats(HP=-500, ATTACK=-300, DEFENCE=1, SP_ATTACK=1, SP_DEFENCE=1, SPEED=1)},
+        {"moves": ["Earthquake"]},
+    ],
+)
+def test_bad_specs_raise_the_direct_construction_error(changes):
+    bad = dataclasses.replace(GARCHOMP, nickname="Bad", **changes)
+    with pytest.raises(Exception) as direct:
+        bad.build()
+    with pytest.raises(type(direct.value)) as bulk:
+        build_pokemon([GARCHOMP, bad, dataclasses.replace(bad, nickname="Also bad")])
+    assert str(bulk.value) == str(direct.value)
+    with pytest.raises(type(direct.value)):
+        pokemon_rows([GARCHOMP, bad])
+
+
+def test_rows_match_loading_built_pokemon():
+    state = BattleState()
+    state.load_teams(0, [spec.build() for spec in SPECS], [])
+    np.testing.assert_array_equal(pokemon_rows(SPECS), state.pokemon[0, : len(SPECS)])
+
+
+def test_clone_is_independent(garchomp_factory):
+    original = garchomp_factory("Original")
+    original.apply_damage(30)
+    original.change_stat_stage(Stats.SPEED, 1)
+    clone = original.clone()
+    assert clone == original.model_copy(deep=True)
+    assert clone.stat_totals is original.stat_totals
+
+    clone.apply_damage(10)
+    clone.change_stat_stage(Stats.SPEED, 1)
+    clone.moves.set_pp(MoveSlot.SECOND, 0)
+    clone.level = 50
+    assert original.live_stats.HP == original.stat_totals.HP - 30
+    assert original.stat_stages.SPEED == 1
+    assert original.moves.pp(MoveSlot.SECOND) == SWORDS_DANCE.pp
+    assert original.level == 78 and clone.stat_totals != original.stat_totals
+
+
+def test_build_restores_the_garbage_collector():
+    assert gc.isenabled()
+    build_pokemon(SPECS)
+    with pytest.raises(ValueError):
+        build_pokemon([dataclasses.replace(GARCHOMP, level=0)])
+    assert gc.isenabled()
@@ -0,0 +1,129 @@
+import dataclasses
+
+import pytest
+
+from battle_sim.battle_log import BattleLogWriter, read_battle_log
+from battle_sim.engine import Battle, first_move_policy, random_move_policy
+from battle_sim.maths.rng import CounterRNG
+from battle_sim.mechanics.events import Event
+from battle_sim.models.moves import MoveSlot
+from battle_sim.replay import Replay, verify
+
+POLICIES = (random_move_policy, random_move_policy)
+INTERVAL = 3
+
+
+@pytest.fixture
+def teams(garchomp_factory):
+    def _make():
+        return [garchomp_factory(f"A{i}") for i in range(3)], [garchomp_factory(f"B{i}") for i in range(3)]
+
+    return _make
+
+
+def snapshot(battle: Battle) -> tuple:
+    pokemon = [p for team in battle.teams for p in team]
+    return (
+        battle.turn,
+        tuple(battle.active),
+        tuple(p.live_stats.HP for p in pokemon),
+        tuple(p.stat_stages.ATTACK for p in pokemon),
+        tuple(p.moves.pp(slot) for p in pokemon for slot in MoveSlot),
+    )
+
+
+def play_through(replay: Replay) -> list[tuple]:
+    states = [snapshot(replay.battle)]
+    while replay.step():
+        states.append(snapshot(replay.battle))
+    return states
+
+
+def test_seek_matches_playing_through(teams):
+    states = play_through(Replay(*teams(), CounterRNG(seed=4), policies=POLICIES, checkpoint_interval=INTERVAL))
+    replay = Replay(*teams(), CounterRNG(seed=4), policies=POLICIES, checkpoint_interval=INTERVAL)
+
+    for turn in (7, 2, len(states) - 1, 0, 5, 5, 1, len(states) + 10):
+        assert snapshot(replay.seek(turn)) == states[min(turn, len(states) - 1)]
+    assert [c.turn for c in replay.checkpoints] == list(range(0, len(states), INTERVAL))
+
+
+def test_seek_replays_at_most_one_interval(teams):
+    replay = Replay(*teams(), CounterRNG(seed=4), policies=POLICIES, checkpoint_interval=INTERVAL)
+    replay.run()
+    turns_played = []
+    replay.battle.bus.on(Event.ON_TURN_START, lambda context, payload: turns_played.append(payload.turn))
+
+    replay.seek(INTERVAL * 2 + INTERVAL - 1)
+    replay.seek(1)
+    assert turns_played == [INTERVAL * 2 + 1, INTERVAL * 2 + 2, 1]
+
+
+def test_action_list_replays_battle_with_separate_policy_rng(teams):
+    rng = CounterRNG(seed=9)
+    original = Replay(*teams(), rng, policies=POLICIES, policy_rng=rng.spawn(1)[0], checkpoint_interval=INTERVAL)
+    states = play_through(original)
+
+    replay = Replay(*teams(), CounterRNG(seed=9), actions=original.actions, checkpoint_interval=INTERVAL)
+    assert play_through(replay) == states
+    assert snapshot(replay.seek(4)) == states[4]
+    with pytest.raises(RuntimeError):
+        replay.battle.policies[0](replay.battle, 0)
+
+
+def test_invalid_replays(teams):
+    with pytest.raises(ValueError):
+        Replay(*teams(), CounterRNG(seed=1))
+    with pytest.raises(ValueError):
+        Replay(*teams(), CounterRNG(seed=1), actions=[], policies=POLICIES)
+    with pytest.raises(ValueError):
+        Replay(*teams(), CounterRNG(seed=1), policies=POLICIES, checkpoint_interval=0)
+    with pytest.raises(ValueError):
+        Replay(*teams(), CounterRNG(seed=1), policies=POLICIES).seek(-1)
+
+
+def test_verify_reports_first_divergence(tmp_path, teams):
+    path = tmp_path / "battles.bslog"
+    with BattleLogWriter(path) as log:
+        battle = Battle(*teams(), POLICIES, CounterRNG(seed=5, battle_index=2))
+        with log.recording(battle):
+            battle.run()
+    (logged,) = read_battle_log(path)
+
+    assert verify(logged, policies=POLICIES) is None
+
+    divergence = verify(logged, policies=(first_move_policy, first_move_policy))
+    assert divergence is not None and divergence.turn >= 1
+    assert divergence.expected != divergence.actual
+
+    records = logged.records.copy()
+    hit = int((records["event"] == Event.ON_AFTER_HIT.value).nonzero()[0][3])
+    records["values"][hit, 1] += 1
+    divergence = verify(dataclasses.replace(logged, records=records), policies=POLICIES)
+    assert divergence is not None and divergence.record == hit
+    assert divergence.expected is not None and divergence.actual is not None
+    assert divergence.expected[0] is Event.ON_AFTER_HIT
+    assert divergence.expected[2][1] == divergence.actual[2][1] + 1
+
+    shorter = verify(dataclasses.replace(logged, records=logged.records[:-2]), policies=POLICIES)
+    assert shorter is not None and shorter.record == len(logged.records) - 2 and shorter.expected is None
+
+
+@pytest.mark.parametrize(
+    "rng",
+    [
+        CounterRNG(seed=5).spawn(3)[2],
+        CounterRNG(seed=5, battle_index=1).spawn(2)[1].spawn(2)[0],
+        CounterRNG(seed=5, battle_index=1, turn=4),
+    ],
+)
+def test_verify_spawned_and_advanced_streams(tmp_path, teams, rng):
+    path = tmp_path / "battles.bslog"
+    with BattleLogWriter(path) as log:
+        battle = Battle(*teams(), POLICIES, rng)
+        with log.recording(battle):
+            battle.run()
+    (logged,) = read_battle_log(path)
+
+    assert (logged.spawn_key, logged.turn) == (rng.spawn_key, rng.turn)
+    assert verify(logged, policies=POLICIES) is None
@@ -0,0 +1,120 @@
+import pytest
+
+from battle_sim.maths.rng import MAX_DAMAGE_ROLL, MIN_DAMAGE_ROLL, RNG, BufferedRNG, CounterRNG
+from battle_sim.mechanics.events import Event, EventBus, EventContext
+
+
+def draw_sequence(rng: RNG) -> list:
+    items = list(range(10))
+    rng.shuffle_items(items)
+    return [
+        rng.random_probability(),
+        rng.random_integer(0, 100),
+        rng.random_choice("abcdef"),
+        rng.roll_chance(0.5),
+        rng.roll_percentage(30),
+        *items,
+        *rng.damage_rolls(4).tolist(),
+        *rng.random_probabilities(3).tolist(),
+    ]
+
+
+@pytest.mark.parametrize("make_rng", [RNG, BufferedRNG, CounterRNG])
+def test_same_seed_gives_same_stream(make_rng):
+    assert draw_sequence(make_rng(seed=7)) == draw_sequence(make_rng(seed=7))
+    assert draw_sequence(make_rng(seed=7)) != draw_sequence(make_rng(seed=8))
+
+
+@pytest.mark.parametrize("make_rng", [RNG, BufferedRNG, CounterRNG])
+def test_state_round_trip(make_rng):
+    rng = make_rng(seed=1)
+    draw_sequence(rng)
+    state = rng.get_state()
+    expected = [draw_sequence(rng) for _ in range(3)]
+
+    rng.set_state(state)
+    assert [draw_sequence(rng) for _ in range(3)] == expected
+
+
+def test_buffered_state_round_trip_across_blocks():
+    rng = BufferedRNG(seed=3, block_size=5)
+    for _ in range(7):
+        rng.random_probability()
+    state = rng.get_state()
+    rng.random_integers(0, 10, 50)
+    expected = [rng.random_probability() for _ in range(12)]
+
+    rng.set_state(state)
+    rng.random_integers(0, 10, 50)
+    assert [rng.random_probability() for _ in range(12)] == expected
+
+
+def test_buffered_reseed_restarts_stream():
+    rng = BufferedRNG(seed=11, block_size=8)
+    first = [rng.random_probability() for _ in range(20)]
+    rng.reseed(11)
+    assert [rng.random_probability() for _ in range(20)] == first
+
+
+@pytest.mark.parametrize("make_rng", [RNG, BufferedRNG, CounterRNG])
+def test_ranges_and_validation(make_rng):
+    rng = make_rng(seed=5)
+    assert all(3 <= rng.random_integer(3, 6) < 6 for _ in range(500))
+    rolls = rng.damage_rolls(2_000)
+    assert rolls.min() == MIN_DAMAGE_ROLL and rolls.max() == MAX_DAMAGE_ROLL
+
+    with pytest.raises(ValueError):
+        rng.roll_chance(1.5)
+    with pytest.raises(ValueError):
+        rng.roll_percentage(-1)
+    with pytest.raises(ValueError):
+        rng.random_choice([])
+
+
+def test_buffered_rng_drops_into_event_context():
+    bus = EventBus()
+    rolls = []
+    bus.on(Event.ON_TURN_START, lambda ctx, payload: rolls.append(ctx.rng.roll_chance(0.5)))
+    bus.emit(Event.ON_TURN_START, EventContext(rng=BufferedRNG(seed=0)))
+    assert len(rolls) == 1
+
+
+def test_counter_rng_derives_any_battle_turn_directly():
+    master = CounterRNG(seed=2024)
+    played = master.for_battle(734_512)
+    for turn in range(1, 4):
+        played.advance_to_turn(turn)
+        played.random_probabilities(turn * 37)  # however much a turn consumes, the next turn starts fresh
+        for _ in range(turn * 11):
+            played.random_probability()
+    played.advance_to_turn(87)
+
+    direct = CounterRNG(seed=2024, battle_index=734_512, turn=87)
+    assert draw_sequence(played) == draw_sequence(direct)
+
+
+def test_counter_rng_streams_are_distinct():
+    rng = CounterRNG(seed=9)
+    streams = [
+        rng.for_battle(0),
+        rng.for_battle(1),
+        rng.for_battle(0, turn=1),
+        CounterRNG(seed=10),
+        *rng.spawn(2),
+    ]
+    firsts = [tuple(stream.random_probabilities(4).tolist()) for stream in streams]
+    assert len(set(firsts)) == len(firsts)
+
+
+def test_counter_rng_spawn_is_reproducible():
+    children = CounterRNG(seed=9).spawn(3)
+    again = CounterRNG(seed=9).spawn(3)
+    for child, twin in zip(children, again, strict=True):
+        assert draw_sequence(child) == draw_sequence(twin)
+    assert draw_sequence(children[0].spawn(1)[0]) != draw_sequence(again[0])
+
+
+def test_counter_rng_without_seed_records_one():
+    rng = CounterRNG()
+    assert rng.seed is not None
+    assert draw_sequence(rng.for_battle(0)) == draw_sequence(CounterRNG(seed=rng.seed))
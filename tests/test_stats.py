@@ -1,7 +1,23 @@
+import numpy as np
 import pytest
-
+from hypothesis import given
+from hypothesis import strategies as st
+from pydantic import ValidationError
+
+from battle_sim.maths.stats import (
+    NATURE_INDEX,
+    apply_stat_stage,
+    calculate_effective_stat,
+    calculate_effective_stat_batch,
+    calculate_stat_totals_batch,
+    calculate_total_hp,
+    calculate_total_hp_batch,
+    calculate_total_stat,
+    calculate_total_stat_batch,
+)
 from battle_sim.models.pokemon import Pokemon
-from battle_sim.utils import Stats
+from battle_sim.models.stats import EVs, StatStages
+from battle_sim.utils import Nature, Stats
 
 
 def assert_stats(pokemon: Pokemon, expected: dict):
@@ -64,3 +80,96 @@ def test_reset_restores_hp_and_stages(garchomp_factory, expected_garchomp_stats)
     assert chomperinho.live_stats.HP == chomperinho.stat_totals.HP
     assert chomperinho.stat_stages.ATTACK == 0
     assert chomperinho.stat_stages.SP_ATTACK == 0
+
+
+def test_stat_totals_are_cached_until_a_source_field_changes(garchomp_factory):
+    chompster = garchomp_factory("Chompster")
+    totals = chompster.stat_totals
+    assert chompster.stat_totals is totals
+
+    chompster.level = 100
+    assert chompster.stat_totals.HP == 368
+
+    chompster.nature = Nature.MODEST
+    assert chompster.stat_totals.ATTACK == 291
+    assert chompster.effective_stat(Stats.ATTACK) == 291
+
+    chompster.effort_values = EVs(ATTACK=252)
+    assert chompster.stat_totals.ATTACK == 306
+
+
+def test_model_copy_with_source_field_update_recomputes_stats(garchomp_factory):
+    chompster = garchomp_factory("Chompster")
+    speed = chompster.effective_stat(Stats.SPEED)
+
+    levelled = chompster.model_copy(update={"level": 100})
+    assert levelled.stat_totals.HP == 368  # As after `chompster.level = 100`
+    assert levelled.effective_stat(Stats.SPEED) > speed
+    assert chompster.stat_totals == garchomp_factory("Fresh").stat_totals
+    assert chompster.effective_stat(Stats.SPEED) == speed
+
+    renamed = chompster.model_copy(update={"nickname": "Renamed"}, deep=True)
+    assert renamed.__dict__["stat_totals"] == chompster.stat_totals  # Still cached
+
+
+def test_evs_cannot_be_mutated_in_place(garchomp_factory):
+    chompita = garchomp_factory("Chompita")
+    with pytest.raises(ValidationError):
+        chompita.effort_values.ATTACK = 0
+
+
+def test_effective_stat_matches_formula_at_every_stage(garchomp_factory):
+    chompzilla = garchomp_factory("Chompzilla")
+    for stat in (Stats.ATTACK, Stats.DEFENCE, Stats.SP_ATTACK, Stats.SP_DEFENCE, Stats.SPEED):
+        for stage in range(-6, 7):
+            chompzilla.change_stat_stage(stat, stage - getattr(chompzilla.stat_stages, stat))
+            expected = calculate_effective_stat(chompzilla.stat_totals, StatStages(**{stat: stage}), stat)
+            assert chompzilla.effective_stat(stat) == expected, (stat, stage)
+
+
+stat_spreads = st.lists(
+    st.tuples(
+        st.lists(st.integers(1, 255), min_size=6, max_size=6),  # base stats
+        st.lists(st.integers(0, 31), min_size=6, max_size=6),  # IVs
+        st.lists(st.integers(0, 252), min_size=6, max_size=6),  # EVs
+        st.integers(1, 100),  # level
+        st.sampled_from(Nature),
+    ),
+    min_size=1,
+    max_size=50,
+)
+
+
+@given(stat_spreads)
+def test_batch_stat_totals_match_scalar(spreads):
+    bases, ivs, evs, levels, natures = zip(*spreads, strict=True)
+    totals = calculate_stat_totals_batch(bases, ivs, evs, levels, [NATURE_INDEX[n] for n in natures])
+
+    for row, (base, iv, ev, lvl, nature) in zip(totals.tolist(), spreads, strict=True):
+        expected = [calculate_total_hp(base[0], iv[0], ev[0], lvl)] + [
+            calculate_total_stat(base[i], iv[i], ev[i], lvl, nature, stat)
+            for i, stat in enumerate(Stats)
+            if stat is not Stats.HP
+        ]
+        assert row == expected
+
+
+@given(stat_spreads, st.sampled_from([stat for stat in Stats if stat is not Stats.HP]))
+def test_batch_single_stat_matches_scalar(spreads, stat):
+    base, iv, ev, lvl, nature = (np.array(column) for column in zip(*spreads, strict=True))
+    index = list(Stats).index(stat)
+    hp = calculate_total_hp_batch(base[:, 0], iv[:, 0], ev[:, 0], lvl)
+    totals = calculate_total_stat_batch(
+        base[:, index], iv[:, index], ev[:, index], lvl, [NATURE_INDEX[n] for n in nature], stat
+    )
+
+    for i, (b, v, e, lv, n) in enumerate(spreads):
+        assert hp[i] == calculate_total_hp(b[0], v[0], e[0], lv)
+        assert totals[i] == calculate_total_stat(b[index], v[index], e[index], lv, n, stat)
+
+
+@given(st.lists(st.tuples(st.integers(1, 999), st.integers(-6, 6)), min_size=1, max_size=50))
+def test_batch_effective_stat_matches_scalar(values_and_stages):
+    values, stages = zip(*values_and_stages, strict=True)
+    effective = calculate_effective_stat_batch(values, stages)
+    assert effective.tolist() == [apply_stat_stage(v, s) for v, s in values_and_stages]
@@ -0,0 +1,75 @@
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from battle_sim.database.sample_moves import EARTHQUAKE
+from battle_sim.maths.rng import CounterRNG
+from battle_sim.mechanics.turn_order import ACTION_ORDER, action_priority, order_actions, order_actions_batch
+from battle_sim.models.actions import Action, ActionType
+from battle_sim.models.moves import MoveSet, MoveSlot
+from battle_sim.utils import PriorityLevel, Stats, Target
+
+QUICK_EARTHQUAKE = replace(EARTHQUAKE, name="Quick Earthquake", priority=PriorityLevel.E_SPEED)
+
+
+def use_move(slot: MoveSlot = MoveSlot.FIRST) -> Action:
+    return Action(action=ActionType.USE_MOVE, target=Target.SINGLE_OPPONENT, move=slot)
+
+
+@pytest.fixture
+def pair(garchomp_factory):
+    return garchomp_factory("A"), garchomp_factory("B")
+
+
+def test_faster_pokemon_moves_first(pair):
+    slow, fast = pair
+    fast.change_stat_stage(Stats.SPEED, 1)
+    assert order_actions((slow, fast), (use_move(), use_move()), CounterRNG(seed=0)) == [1, 0]
+
+
+def test_priority_beats_speed(pair):
+    slow, fast = pair
+    fast.change_stat_stage(Stats.SPEED, 6)
+    slow.moves = MoveSet(QUICK_EARTHQUAKE, None, None, None)
+    assert action_priority(slow, use_move()) == PriorityLevel.E_SPEED
+    assert order_actions((fast, slow), (use_move(), use_move()), CounterRNG(seed=0)) == [1, 0]
+
+
+def test_switches_go_before_moves(pair, garchomp_factory):
+    slow, fast = pair
+    slow.moves = MoveSet(QUICK_EARTHQUAKE, None, None, None)
+    fast.change_stat_stage(Stats.SPEED, 2)
+    switch = Action(action=ActionType.SWITCH_OUT, switch_in=garchomp_factory("Bench"))
+    assert order_actions((fast, slow), (use_move(), switch), CounterRNG(seed=0)) == [1, 0]
+
+
+def test_speed_ties_are_random(pair):
+    rng = CounterRNG(seed=0)
+    firsts = {order_actions(pair, (use_move(), use_move()), rng)[0] for _ in range(50)}
+    assert firsts == {0, 1}
+
+
+def test_batch_matches_scalar_ordering():
+    rng = np.random.default_rng(0)
+    shape = (500, 4)
+    ranks = rng.choice(list(ACTION_ORDER.values()), size=shape)
+    priorities = rng.integers(-1, 2, size=shape)
+    speeds = rng.integers(90, 100, size=shape)
+    tiebreaks = rng.random(shape)
+
+    order = order_actions_batch(ranks, priorities, speeds, tiebreaks=tiebreaks)
+
+    assert order.shape == shape
+    for battle in range(shape[0]):
+        keys = list(zip(ranks[battle], -priorities[battle], -speeds[battle], tiebreaks[battle], strict=True))
+        assert order[battle].tolist() == sorted(range(shape[1]), key=keys.__getitem__)
+
+
+def test_batch_without_tiebreaks_is_stable():
+    order = order_actions_batch([[3, 3, 1]], [[0, 0, 0]], [[100, 100, 50]])
+    assert order.tolist() == [[2, 0, 1]]
+    drawn = order_actions_batch(
+        np.full((200, 2), 3), np.zeros((200, 2)), np.full((200, 2), 100), rng=CounterRNG(seed=1)
+    )
+    assert set(drawn[:, 0].tolist()) == {0, 1}
@@ -1,4 +1,10 @@
-from battle_sim.models.type_matchups import type_effectiveness
+from battle_sim.models.type_matchups import (
+    batch_type_effectiveness,
+    monotype_effectiveness,
+    type_effectiveness,
+    type_indices,
+    type_pair_indices,
+)
 from battle_sim.utils import Type
 
 
@@ -26,3 +32,38 @@ def test_dual_typing_effectiveness():
     # Ice vs Dragon/Ground (Garchomp): 2x * 2x = 4x
     multiplier = type_effectiveness(Type.ICE, (Type.DRAGON, Type.GROUND))
     assert multiplier == 4.0
+
+
+def _chart_effectiveness(attacking_type, defending_types):
+    # The original two-lookup formulation, kept as the reference the dense table must reproduce.
+    primary_type, secondary_type = defending_types
+    multiplier = monotype_effectiveness(attacking_type, primary_type)
+    if secondary_type is not None and secondary_type != primary_type:
+        multiplier *= monotype_effectiveness(attacking_type, secondary_type)
+    return multiplier
+
+
+ALL_TYPE_PAIRS = [(primary, secondary) for primary in Type for secondary in (*Type, None)]
+
+
+def test_table_matches_chart_for_every_type_pair():
+    for attacking_type in Type:
+        for pair in ALL_TYPE_PAIRS:
+            assert type_effectiveness(attacking_type, pair) == _chart_effectiveness(attacking_type, pair), pair
+
+
+def test_batch_effectiveness_matches_scalar():
+    attacking = [attacking_type for attacking_type in Type for _ in ALL_TYPE_PAIRS]
+    defending = ALL_TYPE_PAIRS * len(Type)
+
+    multipliers = batch_type_effectiveness(type_indices(attacking), type_pair_indices(defending))
+    assert multipliers.shape == (len(attacking),)
+    assert multipliers.tolist() == [type_effectiveness(a, d) for a, d in zip(attacking, defending, strict=True)]
+
+
+def test_batch_effectiveness_broadcasts_attackers_against_defenders():
+    attacking = type_indices([Type.ICE, Type.ELECTRIC])[:, None]
+    defending = type_pair_indices([(Type.DRAGON, Type.GROUND), (Type.WATER, Type.FLYING), (Type.NORMAL, None)])
+
+    multipliers = batch_type_effectiveness(attacking, defending)
+    assert multipliers.tolist() == [[4.0, 1.0, 1.0], [0.0, 4.0, 1.0]]
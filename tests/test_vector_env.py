@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+
+from battle_sim.database.sample_moves import EARTHQUAKE as EARTHQUAKE_MOVE
+from battle_sim.maths.rng import BufferedRNG
+from battle_sim.mechanics.damage import damage_distribution
+from battle_sim.mechanics.legal_actions import ACTION_SPACE, NUM_MOVE_ACTIONS
+from battle_sim.models.battle_state import TEAM_SIZE, FieldColumn, PokemonColumn
+from battle_sim.vector_env import VectorBattleEnv, sample_legal_actions
+
+EARTHQUAKE, SWORDS_DANCE = 0, 1
+BATTLES = 64
+
+
+@pytest.fixture
+def teams(garchomp_factory):
+    return [garchomp_factory(f"A{i}") for i in range(3)], [garchomp_factory(f"B{i}") for i in range(3)]
+
+
+@pytest.fixture
+def env(teams):
+    return VectorBattleEnv(*teams, BATTLES, rng=BufferedRNG(seed=7))
+
+
+def both(action_one: int, action_two: int) -> np.ndarray:
+    return np.tile([action_one, action_two], (BATTLES, 1))
+
+
+def test_first_hit_matches_damage_distribution(env, teams):
+    distribution = damage_distribution(teams[0][0], teams[1][0], EARTHQUAKE_MOVE)
+    possible = set(distribution.normal.tolist()) | set(distribution.critical.tolist())
+    max_hp = env.state.pokemon[0, TEAM_SIZE, PokemonColumn.MAX_HP]
+
+    env.step(both(EARTHQUAKE, SWORDS_DANCE))
+
+    dealt = max_hp - env.state.pokemon[:, TEAM_SIZE, PokemonColumn.HP]
+    assert set(dealt.tolist()) <= {min(damage, max_hp) for damage in possible}
+    assert len(set(dealt.tolist())) > 1  # Rolls are drawn per battle
+    assert (env.state.pokemon[:, 0, PokemonColumn.PP_1] == EARTHQUAKE_MOVE.pp - 1).all()
+
+
+def test_stat_stages_and_turn_counter(env):
+    env.step(both(SWORDS_DANCE, SWORDS_DANCE))
+
+    assert (env.state.pokemon[:, [0, TEAM_SIZE], PokemonColumn.STAGE_ATTACK] == 2).all()
+    assert (env.state.field[:, FieldColumn.TURN] == 1).all()
+
+
+def test_switches_resolve_before_moves(env):
+    switch_to_second = NUM_MOVE_ACTIONS + 1
+    env.step(both(switch_to_second, EARTHQUAKE))
+
+    assert (env.state.field[:, FieldColumn.ACTIVE_ONE] == 1).all()
+    pokemon = env.state.pokemon
+    assert (pokemon[:, 0, PokemonColumn.HP] == pokemon[:, 0, PokemonColumn.MAX_HP]).all()
+    assert (pokemon[:, 1, PokemonColumn.HP] < pokemon[:, 1, PokemonColumn.MAX_HP]).all()
+
+
+def test_illegal_actions_are_replaced(env):
+    switch_to_active = NUM_MOVE_ACTIONS
+    env.step(both(switch_to_active, ACTION_SPACE - 1))  # The last team position is empty
+
+    assert (env.state.field[:, [FieldColumn.ACTIVE_ONE, FieldColumn.ACTIVE_TWO]] == 0).all()
+    assert (
+        env.state.pokemon[:, TEAM_SIZE, PokemonColumn.HP] < env.state.pokemon[0, TEAM_SIZE, PokemonColumn.MAX_HP]
+    ).all()
+
+
+def test_finished_battles_reset(env):
+    start = env.state.snapshot(0)
+    rng = BufferedRNG(seed=3)
+    finished = np.zeros(BATTLES, dtype=bool)
+    for _ in range(200):
+        result = env.step(sample_legal_actions(env.legal_actions(), rng))
+        assert result.observation.dtype == np.float32
+        assert (result.reward[:, 0] == -result.reward[:, 1]).all()
+        assert (result.reward[~result.done] == 0).all()
+        decided = result.done & (result.winner >= 0)
+        assert (result.reward[decided, result.winner[decided]] == 1).all()
+        assert (env.state.buffer[result.done] == start).all()
+        finished |= result.done
+    assert finished.all()
+
+
+def test_sampled_actions_are_legal(env):
+    masks = env.legal_actions()
+    actions = sample_legal_actions(masks, BufferedRNG(seed=1))
+    assert masks[np.arange(BATTLES)[:, np.newaxis], np.arange(2), actions].all()